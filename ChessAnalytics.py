@@ -0,0 +1,368 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Corpus analytics for archives of recorded ChessVar games, in a streaming pipeline across worker
+# processes. Games are read lazily from any number of files (in any format ChessReplay.py reads, including the
+# ChessRecord.py game-record format) and grouped into chunks. Each chunk is replayed through make_move by a worker
+# process, so every move is checked by the same rules as in play, and is summed into a CorpusStatistics object: the
+# results, the piece type whose last piece was captured in each won game, the results by first move, the ply of the
+# first capture, the pieces captured of each type, the game lengths, and the games that held an illegal move. The
+# workers' statistics are merged as they arrive. Only a fixed number of chunks is ever waiting for a worker or for
+# merging, and every table in CorpusStatistics has a fixed number of rows (one per piece type, first move or length
+# bucket), so memory stays bounded however large the archive is. At the end the statistics are printed as summary
+# tables, or as JSON. Run this file from the command line, for example:
+# python ChessAnalytics.py games.cvg more_games.cvg --format record --processes 8
+
+import argparse
+import collections
+import json
+import multiprocessing
+import sys
+import time
+
+from ChessBoard import PIECE_TYPES, SQUARE_MASKS, SQUARE_TO_INDEX
+from ChessRecord import RESULTS
+from ChessReplay import parse_move, read_game_records
+from ChessSelfPlay import HISTOGRAM_BUCKET_PLIES, SelfPlayStatistics, get_winning_piece_type
+from ChessVar import ChessVar
+
+DEFAULT_CHUNK_SIZE = 200
+
+# chunks waiting for or being replayed by a worker, per worker process
+PENDING_CHUNKS_PER_PROCESS = 2
+
+
+class CorpusStatistics:
+    """The CorpusStatistics class sums up a corpus of replayed games. Its data members are a SelfPlayStatistics object
+    that counts the games, their results, the piece type whose last piece was captured in each won game (for each
+    winning team), and their lengths, and counters of the games with an illegal or unreadable move, the results of the
+    games opened with each first move, the captured pieces of each type, the games with a capture and the sum of the
+    plies of their first captures, and a histogram of those plies. Statistics from different workers are combined
+    with merge"""
+
+    def __init__(self):
+        """All counters start at zero"""
+
+        self._game_statistics = SelfPlayStatistics()
+        self._invalid_games = 0
+        self._first_moves = {}
+        self._captures = {piece_type: 0 for piece_type in PIECE_TYPES}
+        self._games_with_capture = 0
+        self._first_capture_plies = 0
+        self._first_capture_histogram = {}
+
+
+    def add_game(self, game, first_move, first_capture_ply, captures, valid):
+        """Counts one replayed game, given the ChessVar game after its last legal move, its first move as a 'e2e4'
+        string (None if it has no legal moves), the ply of its first capture (None if there was none), a dictionary of
+        the number of pieces of each type captured, and whether every recorded move was legal"""
+
+        game_state = game.get_game_state()
+
+        self._game_statistics.add_game(game_state, get_winning_piece_type(game), game.get_ply_count())
+        if valid == False:
+            self._invalid_games += 1
+
+        if first_move is not None:
+            if first_move not in self._first_moves:
+                self._first_moves[first_move] = {game_state: 0 for game_state in RESULTS}
+            self._first_moves[first_move][game_state] += 1
+
+        for piece_type, count in captures.items():
+            self._captures[piece_type] += count
+
+        if first_capture_ply is not None:
+            self._games_with_capture += 1
+            self._first_capture_plies += first_capture_ply
+            bucket = first_capture_ply // HISTOGRAM_BUCKET_PLIES * HISTOGRAM_BUCKET_PLIES
+            self._first_capture_histogram[bucket] = self._first_capture_histogram.get(bucket, 0) + 1
+
+
+    def merge(self, other):
+        """Adds every count of another CorpusStatistics object to this one"""
+
+        self._game_statistics.merge(other._game_statistics)
+        self._invalid_games += other._invalid_games
+
+        for first_move, counts in other._first_moves.items():
+            if first_move not in self._first_moves:
+                self._first_moves[first_move] = {game_state: 0 for game_state in RESULTS}
+            for game_state, count in counts.items():
+                self._first_moves[first_move][game_state] += count
+
+        for piece_type, count in other._captures.items():
+            self._captures[piece_type] += count
+
+        self._games_with_capture += other._games_with_capture
+        self._first_capture_plies += other._first_capture_plies
+        for bucket, count in other._first_capture_histogram.items():
+            self._first_capture_histogram[bucket] = self._first_capture_histogram.get(bucket, 0) + count
+
+
+    def get_games(self):
+        """Returns the number of games counted"""
+
+        return self._game_statistics.get_games()
+
+
+    def to_dict(self):
+        """Returns the statistics as a dictionary that can be written out as JSON, including the share of won games
+        decided by each piece type, the white win rate of each first move, the average ply of the first capture and
+        the average game length"""
+
+        game_summary = self._game_statistics.to_dict()
+        results = game_summary["results"]
+        deciding_piece_types = game_summary["winning_piece_types"]
+        won_games = results["WHITE_WON"] + results["BLACK_WON"]
+        deciding_totals = {piece_type: sum(counts[piece_type] for counts in deciding_piece_types.values())
+                           for piece_type in PIECE_TYPES}
+
+        first_moves = {}
+        for first_move in sorted(self._first_moves):
+            counts = self._first_moves[first_move]
+            games = sum(counts.values())
+            first_moves[first_move] = dict(counts)
+            first_moves[first_move]["games"] = games
+            first_moves[first_move]["white_win_rate"] = counts["WHITE_WON"] / games
+
+        return {
+            "games"                   : game_summary["games"],
+            "invalid_games"           : self._invalid_games,
+            "results"                 : results,
+            "deciding_piece_types"    : deciding_piece_types,
+            "deciding_piece_shares"   : {piece_type: deciding_totals[piece_type] / won_games if won_games > 0 else 0.0
+                                         for piece_type in PIECE_TYPES},
+            "first_moves"             : first_moves,
+            "captures"                : dict(self._captures),
+            "games_with_capture"      : self._games_with_capture,
+            "average_first_capture"   : self._first_capture_plies / self._games_with_capture
+                                        if self._games_with_capture > 0 else 0.0,
+            "first_capture_histogram" : {str(bucket): self._first_capture_histogram[bucket]
+                                         for bucket in sorted(self._first_capture_histogram)},
+            "average_plies"           : game_summary["average_plies"],
+            "length_histogram"        : game_summary["length_histogram"]
+        }
+
+
+def analyse_game(moves, statistics):
+    """Replays the passed list of recorded moves through make_move on a new ChessVar game, stopping at the first move
+    that cannot be read or is illegal, and adds the game to the passed CorpusStatistics"""
+
+    game = ChessVar()
+    first_move = None
+    first_capture_ply = None
+    captures = {}
+    valid = True
+    if isinstance(moves, list) == False:
+        moves = []
+        valid = False
+
+    for recorded_move in moves:
+        move = parse_move(recorded_move)
+        if move is None or game.get_game_state() != "UNFINISHED":
+            valid = False
+            break
+
+        # the piece on the destination square, if any, is captured when the move is made
+        destination_index = SQUARE_TO_INDEX[move[1]]
+        other_team = game.get_team("BLACK" if game.get_turn() == "WHITE" else "WHITE")
+        captured_type = None
+        if other_team.get_occupied() & SQUARE_MASKS[destination_index]:
+            captured_type = other_team.get_piece_type(other_team.identify_piece_by_index(destination_index))
+
+        if game.make_move(move[0], move[1]) == False:
+            valid = False
+            break
+
+        if first_move is None:
+            first_move = move[0] + move[1]
+        if captured_type is not None:
+            captures[captured_type] = captures.get(captured_type, 0) + 1
+            if first_capture_ply is None:
+                first_capture_ply = game.get_ply_count()
+
+    statistics.add_game(game, first_move, first_capture_ply, captures, valid)
+
+
+def analyse_chunk(chunk):
+    """Worker process entry point. Replays every game of the passed list of move lists and returns their summed
+    CorpusStatistics"""
+
+    statistics = CorpusStatistics()
+    for moves in chunk:
+        analyse_game(moves, statistics)
+
+    return statistics
+
+
+def read_corpus(paths, record_format="auto"):
+    """Generator that lazily reads every game of the passed files, one after another, and yields the list of moves of
+    each game as it was recorded. A path of - reads standard input"""
+
+    for path in paths:
+        if path == "-":
+            for _, moves in read_game_records(sys.stdin, record_format):
+                yield moves
+            continue
+
+        with open(path) as input_file:
+            for _, moves in read_game_records(input_file, record_format):
+                yield moves
+
+
+def generate_chunks(games, chunk_size):
+    """Generator that groups the passed iterable of games into lists of chunk_size games (the last may be shorter)"""
+
+    chunk = []
+    for moves in games:
+        chunk.append(moves)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk != []:
+        yield chunk
+
+
+def run_analytics(games, processes=None, chunk_size=DEFAULT_CHUNK_SIZE, max_pending=None, callback=None):
+    """Replays the passed iterable of games (lists of recorded moves, such as read_corpus yields) across a pool of
+    worker processes (one per CPU if processes is None; with 1 process the games are replayed in this process) and
+    returns the merged CorpusStatistics. At most max_pending chunks (by default PENDING_CHUNKS_PER_PROCESS per process)
+    are handed to the pool and not yet merged at any time, and no more of the input is read until one of them has been
+    merged. The callback, if any, is called with the statistics merged so far each time a chunk is merged"""
+
+    statistics = CorpusStatistics()
+    chunks = generate_chunks(games, chunk_size)
+
+    if processes == 1:
+        for chunk in chunks:
+            statistics.merge(analyse_chunk(chunk))
+            if callback is not None:
+                callback(statistics)
+        return statistics
+
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if max_pending is None:
+        max_pending = processes * PENDING_CHUNKS_PER_PROCESS
+
+    with multiprocessing.Pool(processes) as pool:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(analyse_chunk, (chunk,)))
+            while len(pending) >= max_pending:
+                statistics.merge(pending.popleft().get())
+                if callback is not None:
+                    callback(statistics)
+
+        while pending:
+            statistics.merge(pending.popleft().get())
+            if callback is not None:
+                callback(statistics)
+
+    return statistics
+
+
+def format_table(title, headings, rows):
+    """Returns a plain text table with the passed title, column headings and rows (lists of values), with each column
+    as wide as its widest value. Numbers are right-aligned and floats are shown with three decimals"""
+
+    cells = [[str(heading) for heading in headings]]
+    for row in rows:
+        cells.append(["%.3f" % value if isinstance(value, float) else str(value) for value in row])
+
+    widths = [max(len(line[column]) for line in cells) for column in range(len(headings))]
+    numeric = [all(isinstance(row[column], (int, float)) for row in rows) for column in range(len(headings))]
+
+    lines = [title]
+    for line_number, line in enumerate(cells):
+        lines.append("  ".join(cell.rjust(widths[column]) if numeric[column] else cell.ljust(widths[column])
+                               for column, cell in enumerate(line)).rstrip())
+        if line_number == 0:
+            lines.append("  ".join("-" * width for width in widths))
+
+    return "\n".join(lines)
+
+
+def format_summary(statistics, max_first_moves=20):
+    """Returns the passed CorpusStatistics as summary tables: the results, the piece types that decided the won games,
+    the most played first moves (at most max_first_moves) with their results, the captured pieces, and the ply of the
+    first capture and game length histograms"""
+
+    summary = statistics.to_dict()
+    games = summary["games"]
+    tables = []
+
+    tables.append(format_table("Results", ["result", "games", "share"],
+                               [[game_state, count, count / games if games > 0 else 0.0]
+                                for game_state, count in summary["results"].items()] +
+                               [["invalid games", summary["invalid_games"],
+                                 summary["invalid_games"] / games if games > 0 else 0.0]]))
+
+    tables.append(format_table("Deciding piece type", ["piece type", "WHITE_WON", "BLACK_WON", "share of wins"],
+                               [[piece_type, summary["deciding_piece_types"]["WHITE_WON"][piece_type],
+                                 summary["deciding_piece_types"]["BLACK_WON"][piece_type],
+                                 summary["deciding_piece_shares"][piece_type]] for piece_type in PIECE_TYPES]))
+
+    first_moves = sorted(summary["first_moves"].items(), key=lambda item: (-item[1]["games"], item[0]))
+    tables.append(format_table("First moves", ["move", "games", "WHITE_WON", "BLACK_WON", "DRAW", "UNFINISHED",
+                                               "white win rate"],
+                               [[first_move, counts["games"], counts["WHITE_WON"], counts["BLACK_WON"],
+                                 counts["DRAW"], counts["UNFINISHED"], counts["white_win_rate"]]
+                                for first_move, counts in first_moves[:max_first_moves]]))
+
+    tables.append(format_table("Captured pieces", ["piece type", "captured"],
+                               [[piece_type, summary["captures"][piece_type]] for piece_type in PIECE_TYPES]))
+
+    tables.append(format_table("First capture (average ply %.1f over %d games)" %
+                               (summary["average_first_capture"], summary["games_with_capture"]),
+                               ["plies", "games"],
+                               [["%s-%d" % (bucket, int(bucket) + HISTOGRAM_BUCKET_PLIES - 1), count]
+                                for bucket, count in summary["first_capture_histogram"].items()]))
+
+    tables.append(format_table("Game length (average %.1f plies)" % summary["average_plies"], ["plies", "games"],
+                               [["%s-%d" % (bucket, int(bucket) + HISTOGRAM_BUCKET_PLIES - 1), count]
+                                for bucket, count in summary["length_histogram"].items()]))
+
+    return "\n\n".join(tables) + "\n"
+
+
+def main(arguments=None):
+    """Command line entry point. Analyses every game of the input files (or standard input) and prints summary tables,
+    or JSON with --json, with progress written to standard error"""
+
+    parser = argparse.ArgumentParser(description="Replay archives of ChessVar games across worker processes and "
+                                                 "print summary tables.")
+    parser.add_argument("inputs", nargs="*", default=["-"], help="files of game records (default: stdin)")
+    parser.add_argument("--format", choices=["auto", "json", "plain", "record"], default="auto",
+                        help="format of the game records (default: decide per line)")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="games per worker task (default %d)" % DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="chunks handed out and not yet merged at any time (default: %d per process)" %
+                             PENDING_CHUNKS_PER_PROCESS)
+    parser.add_argument("--json", action="store_true", help="print the statistics as JSON instead of tables")
+    options = parser.parse_args(arguments)
+
+    start_time = time.perf_counter()
+
+    def report(statistics):
+        print("%d games" % statistics.get_games(), file=sys.stderr)
+
+    statistics = run_analytics(read_corpus(options.inputs, options.format), options.processes, options.chunk_size,
+                               options.max_pending, report)
+
+    if options.json:
+        summary = statistics.to_dict()
+        summary["seconds"] = time.perf_counter() - start_time
+        print(json.dumps(summary, indent=2))
+    else:
+        sys.stdout.write(format_summary(statistics))
+        print("\n%d games in %.1f seconds" % (statistics.get_games(), time.perf_counter() - start_time))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Batched, vectorized position features for ChessVar using NumPy. A PositionBatch converts many ChessVar
+# games at once into packed bitboards held in NumPy arrays: one 64-bit integer per (position, team, piece type), so
+# a batch of N positions is an N x 12 array (the first six columns are white's pieces and the last six black's, in
+# ChessBoard.PIECE_TYPES order). From there every feature is computed for the whole batch with array operations and no
+# per-position Python loop: the N x 12 x 64 one-hot planes that models expect, the number of pieces of each type each
+# team has left, the squares each team attacks (sliding pieces use shift-and-fill on the bitboards, so blockers are
+# respected), mobility, and flags for critical pieces (the last of their type) that are under attack. evaluate scores
+# the whole batch with the same terms as ChessEvaluation.evaluate, except that mobility counts the squares a team
+# attacks rather than the moves of each piece separately. This module needs NumPy; nothing else in the project does.
+
+import numpy
+
+from ChessBoard import PIECE_TYPES
+from ChessEvaluation import WIN_SCORE, PIECE_STRENGTH, SCARCITY_PENALTY, MOBILITY_WEIGHT, CRITICAL_FORK_PENALTY, \
+    CRITICAL_THREAT_PENALTY
+
+TEAM_COLORS = ("WHITE", "BLACK")
+
+# column of the bitboards array for each (team color, piece type)
+PLANE_INDEX = {(team_color, piece_type): team_number * 6 + type_number
+               for team_number, team_color in enumerate(TEAM_COLORS)
+               for type_number, piece_type in enumerate(PIECE_TYPES)}
+
+_ALL = numpy.uint64(0xFFFFFFFFFFFFFFFF)
+_NOT_A = numpy.uint64(0xFEFEFEFEFEFEFEFE)          # every square except the 'a' row
+_NOT_H = numpy.uint64(0x7F7F7F7F7F7F7F7F)          # every square except the 'h' row
+_NOT_AB = numpy.uint64(0xFCFCFCFCFCFCFCFC)
+_NOT_GH = numpy.uint64(0x3F3F3F3F3F3F3F3F)
+
+# (shift, mask of squares the shifted bits may land on) for one step in each direction. A positive shift moves towards
+# higher square indexes
+_ROOK_DIRECTIONS = [(8, _ALL), (-8, _ALL), (1, _NOT_A), (-1, _NOT_H)]
+_BISHOP_DIRECTIONS = [(9, _NOT_A), (7, _NOT_H), (-7, _NOT_A), (-9, _NOT_H)]
+_KING_STEPS = _ROOK_DIRECTIONS + _BISHOP_DIRECTIONS
+_KNIGHT_STEPS = [(17, _NOT_A), (15, _NOT_H), (10, _NOT_AB), (6, _NOT_GH), (-15, _NOT_A), (-17, _NOT_H),
+                 (-6, _NOT_AB), (-10, _NOT_GH)]
+_PAWN_STEPS = {"WHITE": [(9, _NOT_A), (7, _NOT_H)], "BLACK": [(-7, _NOT_A), (-9, _NOT_H)]}
+
+_STRENGTHS = numpy.array([PIECE_STRENGTH[piece_type] for piece_type in PIECE_TYPES] * 2, dtype=numpy.int64)
+_SCARCITY = numpy.array([SCARCITY_PENALTY.get(count, 0) for count in range(17)], dtype=numpy.int64)
+
+
+def _shift(bitboards, amount):
+    """Shifts every bitboard in the passed array by amount squares (towards higher indexes if amount is positive).
+    Bits shifted past either end of the board are dropped"""
+
+    if amount > 0:
+        return bitboards << numpy.uint64(amount)
+
+    return bitboards >> numpy.uint64(-amount)
+
+
+def _step_attacks(bitboards, steps):
+    """Returns the squares reached from every set square of the passed bitboards by one of the passed single steps"""
+
+    attacks = numpy.zeros_like(bitboards)
+    for amount, mask in steps:
+        attacks |= _shift(bitboards, amount) & mask
+
+    return attacks
+
+
+def _slide_attacks(bitboards, empty, directions):
+    """Returns the squares attacked by sliding pieces on the passed bitboards along the passed directions, stopping at
+    (and including) the first square that is not in empty. Uses a Kogge-Stone fill: each direction takes three
+    doubling steps instead of up to seven single steps"""
+
+    attacks = numpy.zeros_like(bitboards)
+    for amount, mask in directions:
+        filled = bitboards
+        open_squares = empty & mask
+        filled = filled | (open_squares & _shift(filled, amount))
+        open_squares = open_squares & _shift(open_squares, amount)
+        filled = filled | (open_squares & _shift(filled, 2 * amount))
+        open_squares = open_squares & _shift(open_squares, 2 * amount)
+        filled = filled | (open_squares & _shift(filled, 4 * amount))
+        attacks |= _shift(filled, amount) & mask
+
+    return attacks
+
+
+def count_bits(bitboards):
+    """Returns the number of set squares in each bitboard of the passed uint64 array, as an int64 array of the same
+    shape"""
+
+    if hasattr(numpy, "bitwise_count"):
+        return numpy.bitwise_count(bitboards).astype(numpy.int64)
+
+    as_bytes = bitboards[..., numpy.newaxis].view(numpy.uint8)
+
+    return numpy.unpackbits(as_bytes, axis=-1).sum(axis=-1, dtype=numpy.int64)
+
+
+class PositionBatch:
+    """The PositionBatch class holds many ChessVar positions as NumPy arrays. Its data members are the N x 12 array of
+    piece bitboards, the N x 2 array of unmoved pawn bitboards (white, black), an array of N booleans that are True
+    where it is black's turn, an array of N booleans that are True where the game is already over, and an array of N
+    booleans that are True where the game has ended in a draw. Its methods compute features and evaluations for the
+    whole batch at once"""
+
+    def __init__(self, bitboards, unmoved_pawns, black_to_move, game_over, drawn=None):
+        """Receives the arrays described in the class docstring (no game is drawn if drawn is None). Use from_games to
+        build a batch from ChessVar games"""
+
+        self._bitboards = numpy.asarray(bitboards, dtype=numpy.uint64)
+        self._unmoved_pawns = numpy.asarray(unmoved_pawns, dtype=numpy.uint64)
+        self._black_to_move = numpy.asarray(black_to_move, dtype=bool)
+        self._game_over = numpy.asarray(game_over, dtype=bool)
+        if drawn is None:
+            drawn = numpy.zeros(len(self._game_over), dtype=bool)
+        self._drawn = numpy.asarray(drawn, dtype=bool)
+
+
+    @staticmethod
+    def from_games(games):
+        """Builds a PositionBatch from a list of ChessVar games. Only the bitboards of each game are read, so this is
+        one short loop over the games with no per-piece work"""
+
+        bitboards = numpy.zeros((len(games), 12), dtype=numpy.uint64)
+        unmoved_pawns = numpy.zeros((len(games), 2), dtype=numpy.uint64)
+        black_to_move = numpy.zeros(len(games), dtype=bool)
+        game_over = numpy.zeros(len(games), dtype=bool)
+        drawn = numpy.zeros(len(games), dtype=bool)
+
+        for number, game in enumerate(games):
+            for team_number, team_color in enumerate(TEAM_COLORS):
+                team = game.get_team(team_color)
+                bitboards[number, team_number * 6:team_number * 6 + 6] = [team.get_bitboard(piece_type)
+                                                                          for piece_type in PIECE_TYPES]
+                unmoved_pawns[number, team_number] = team.get_unmoved_pawns()
+            black_to_move[number] = game.get_turn() == "BLACK"
+            game_over[number] = game.get_game_state() != "UNFINISHED"
+            drawn[number] = game.get_game_state() == "DRAW"
+
+        return PositionBatch(bitboards, unmoved_pawns, black_to_move, game_over, drawn)
+
+
+    def __len__(self):
+        """Returns the number of positions in the batch"""
+
+        return len(self._bitboards)
+
+
+    def get_bitboards(self):
+        """Returns the N x 12 uint64 array of piece bitboards"""
+
+        return self._bitboards
+
+
+    def to_planes(self):
+        """Returns the batch as an N x 12 x 64 uint8 array of one-hot planes, where [n, p, s] is 1 if position n has
+        the piece of plane p (see PLANE_INDEX) on square index s"""
+
+        as_bytes = self._bitboards.astype("<u8").view(numpy.uint8).reshape(len(self), 12, 8)
+
+        return numpy.unpackbits(as_bytes, axis=-1, bitorder="little")
+
+
+    def get_piece_counts(self):
+        """Returns an N x 12 int64 array with the number of pieces of each (team, piece type) left in each position"""
+
+        return count_bits(self._bitboards)
+
+
+    def get_occupied(self):
+        """Returns an N x 2 uint64 array with the squares occupied by white's and black's pieces"""
+
+        white = numpy.bitwise_or.reduce(self._bitboards[:, :6], axis=1)
+        black = numpy.bitwise_or.reduce(self._bitboards[:, 6:], axis=1)
+
+        return numpy.stack([white, black], axis=1)
+
+
+    def get_attacks(self):
+        """Returns a pair of N x 2 uint64 arrays: the squares each team attacks with all of its pieces, and the squares
+        each team attacks with its pieces other than pawns (used for mobility)"""
+
+        occupied = self.get_occupied()
+        empty = ~(occupied[:, 0] | occupied[:, 1])
+        all_attacks = numpy.zeros((len(self), 2), dtype=numpy.uint64)
+        piece_attacks = numpy.zeros((len(self), 2), dtype=numpy.uint64)
+
+        for team_number, team_color in enumerate(TEAM_COLORS):
+            def plane(piece_type):
+                return self._bitboards[:, PLANE_INDEX[(team_color, piece_type)]]
+
+            queens = plane("queen")
+            attacks = _step_attacks(plane("knight"), _KNIGHT_STEPS)
+            attacks |= _step_attacks(plane("king"), _KING_STEPS)
+            attacks |= _slide_attacks(plane("rook") | queens, empty, _ROOK_DIRECTIONS)
+            attacks |= _slide_attacks(plane("bishop") | queens, empty, _BISHOP_DIRECTIONS)
+
+            piece_attacks[:, team_number] = attacks
+            all_attacks[:, team_number] = attacks | _step_attacks(plane("pawn"), _PAWN_STEPS[team_color])
+
+        return all_attacks, piece_attacks
+
+
+    def get_mobility(self):
+        """Returns an N x 2 int64 array with the number of squares each team's pieces other than pawns attack that are
+        not occupied by that team"""
+
+        occupied = self.get_occupied()
+        piece_attacks = self.get_attacks()[1]
+
+        return count_bits(piece_attacks & ~occupied)
+
+
+    def get_critical_pieces(self):
+        """Returns an N x 12 uint64 array holding each (team, piece type) bitboard where that team has exactly one piece
+        of that type left (its critical pieces), and 0 elsewhere"""
+
+        return numpy.where(self.get_piece_counts() == 1, self._bitboards, numpy.uint64(0))
+
+
+    def get_attacked_last_piece_flags(self):
+        """Returns an N x 12 boolean array that is True where a team's last piece of a type is attacked by the other
+        team"""
+
+        all_attacks = self.get_attacks()[0]
+        enemy_attacks = numpy.repeat(all_attacks[:, ::-1], 6, axis=1)
+
+        return (self.get_critical_pieces() & enemy_attacks) != 0
+
+
+    def evaluate(self):
+        """Returns an int64 array with the evaluation of every position from the point of view of the team whose turn
+        it is, using the same material, scarcity, mobility and critical threat terms as ChessEvaluation.evaluate.
+        Won games score -WIN_SCORE (the team to move has lost) and drawn games score 0"""
+
+        counts = self.get_piece_counts()
+        material = _STRENGTHS * counts - _SCARCITY[counts]
+        white_score = material[:, :6].sum(axis=1) - material[:, 6:].sum(axis=1)
+
+        mobility = self.get_mobility()
+        white_score += MOBILITY_WEIGHT * (mobility[:, 0] - mobility[:, 1])
+
+        scores = numpy.where(self._black_to_move, -white_score, white_score)
+
+        # critical pieces of the team to move that are attacked by the other team
+        all_attacks = self.get_attacks()[0]
+        critical = self.get_critical_pieces()
+        white_critical = numpy.bitwise_or.reduce(critical[:, :6], axis=1)
+        black_critical = numpy.bitwise_or.reduce(critical[:, 6:], axis=1)
+        threatened = numpy.where(self._black_to_move,
+                                 count_bits(black_critical & all_attacks[:, 0]),
+                                 count_bits(white_critical & all_attacks[:, 1]))
+        scores -= numpy.where(threatened >= 2, CRITICAL_FORK_PENALTY,
+                              numpy.where(threatened == 1, CRITICAL_THREAT_PENALTY, 0))
+
+        scores = numpy.where(self._game_over, -WIN_SCORE, scores)
+
+        return numpy.where(self._drawn, 0, scores)
@@ -0,0 +1,245 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Bitboard board core used by ChessVar and ChessTeam. Each of the 64 squares is given an index from 0 to
+# 63 ('a1' is 0, 'b1' is 1, ... 'h1' is 7, 'a2' is 8, ... 'h8' is 63), and a set of squares is stored as a single
+# Python integer where bit n is set when square n is part of the set (a "bitboard"). Using the naming from ChessVar,
+# the row of a square is its letter (a-h, 1-8) and the column is its number (1-8), so a square's index is
+# (column - 1) * 8 + (row - 1). This module holds the lookup tables that translate between square strings, indexes and
+# single-bit masks, along with small helper functions for working with bitboards. Everything here is built once at
+# import time and shared by every game.
+
+import random
+
+PIECE_TYPES = ("pawn", "rook", "knight", "bishop", "queen", "king")
+
+ROW_LETTERS = "abcdefgh"
+
+# INDEX_TO_SQUARE[n] is the square string for index n, and SQUARE_TO_INDEX is the reverse lookup
+INDEX_TO_SQUARE = [ROW_LETTERS[index % 8] + str(index // 8 + 1) for index in range(64)]
+SQUARE_TO_INDEX = {square: index for index, square in enumerate(INDEX_TO_SQUARE)}
+
+# SQUARE_MASKS[n] is the bitboard with only square n set
+SQUARE_MASKS = [1 << index for index in range(64)]
+
+FULL_BOARD = (1 << 64) - 1
+
+
+def square_to_index(square):
+    """Returns the index (0-63) of the passed square string (eg. 'c4' returns 26)"""
+
+    return SQUARE_TO_INDEX[square]
+
+
+def index_to_square(index):
+    """Returns the square string of the passed index (eg. 26 returns 'c4')"""
+
+    return INDEX_TO_SQUARE[index]
+
+
+def squares_to_mask(list_of_squares):
+    """Receives a list of square strings and returns a bitboard with the bit of each of those squares set"""
+
+    mask = 0
+    for square in list_of_squares:
+        mask |= SQUARE_MASKS[SQUARE_TO_INDEX[square]]
+
+    return mask
+
+
+def mask_to_indexes(mask):
+    """Returns a list of the indexes of every set bit in the passed bitboard, from lowest index to highest"""
+
+    indexes = []
+    while mask:
+        lowest_bit = mask & -mask
+        indexes.append(lowest_bit.bit_length() - 1)
+        mask ^= lowest_bit
+
+    return indexes
+
+
+def mask_to_squares(mask):
+    """Returns a list of the square strings of every set bit in the passed bitboard, from 'a1' towards 'h8'"""
+
+    return [INDEX_TO_SQUARE[index] for index in mask_to_indexes(mask)]
+
+
+def count_bits(mask):
+    """Returns the number of squares set in the passed bitboard"""
+
+    return bin(mask).count("1")
+
+
+def _build_step_table(steps):
+    """Builds a 64 item list where item n is the bitboard of every square that can be reached from square n with one of
+    the passed (row step, column step) pairs without leaving the board"""
+
+    table = []
+    for index in range(64):
+        row, column = index % 8, index // 8
+        mask = 0
+        for row_step, column_step in steps:
+            if 0 <= row + row_step < 8 and 0 <= column + column_step < 8:
+                mask |= SQUARE_MASKS[(column + column_step) * 8 + row + row_step]
+        table.append(mask)
+
+    return table
+
+
+def _build_ray_table(row_step, column_step):
+    """Builds a 64 item list where item n is the bitboard of every square from square n (not included) to the edge of
+    the board when moving repeatedly by (row step, column step)"""
+
+    table = []
+    for index in range(64):
+        row, column = index % 8 + row_step, index // 8 + column_step
+        mask = 0
+        while 0 <= row < 8 and 0 <= column < 8:
+            mask |= SQUARE_MASKS[column * 8 + row]
+            row += row_step
+            column += column_step
+        table.append(mask)
+
+    return table
+
+
+KNIGHT_ATTACKS = _build_step_table([(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)])
+KING_ATTACKS = _build_step_table([(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)])
+
+# White pawns move towards higher columns and black pawns towards lower columns. PAWN_PUSHES holds the square one step
+# forward and PAWN_ATTACKS the two forward diagonals, for each team color
+PAWN_PUSHES = {
+    "WHITE": _build_step_table([(0, 1)]),
+    "BLACK": _build_step_table([(0, -1)])
+}
+PAWN_ATTACKS = {
+    "WHITE": _build_step_table([(1, 1), (-1, 1)]),
+    "BLACK": _build_step_table([(1, -1), (-1, -1)])
+}
+
+# DIRECTION_RAYS[(row step, column step)][n] is the ray from square n to the edge of the board in that direction, for
+# each of the eight directions a rook, bishop or queen can slide in
+DIRECTION_RAYS = {(row_step, column_step): _build_ray_table(row_step, column_step)
+                  for row_step, column_step in [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]}
+
+# Sliding piece rays. The "positive" rays move towards higher square indexes, so the first blocker along them is the
+# lowest set bit; the "negative" rays move towards lower indexes, so the first blocker is the highest set bit
+ROOK_POSITIVE_RAYS = [DIRECTION_RAYS[(1, 0)], DIRECTION_RAYS[(0, 1)]]
+ROOK_NEGATIVE_RAYS = [DIRECTION_RAYS[(-1, 0)], DIRECTION_RAYS[(0, -1)]]
+BISHOP_POSITIVE_RAYS = [DIRECTION_RAYS[(1, 1)], DIRECTION_RAYS[(-1, 1)]]
+BISHOP_NEGATIVE_RAYS = [DIRECTION_RAYS[(-1, -1)], DIRECTION_RAYS[(1, -1)]]
+
+
+def _build_between_table():
+    """Builds a 64 x 64 table where item [source][destination] is the bitboard of the squares strictly between the two
+    squares when they share a row, column or diagonal, and 0 otherwise"""
+
+    table = [[0] * 64 for index in range(64)]
+    for rays in DIRECTION_RAYS.values():
+        for source in range(64):
+            for destination in mask_to_indexes(rays[source]):
+                # the ray from source, minus the destination and everything past it
+                table[source][destination] = rays[source] ^ rays[destination] ^ SQUARE_MASKS[destination]
+
+    return table
+
+
+# BETWEEN[source][destination] is the bitboard of the squares a rook, bishop, queen or pawn passes over when moving
+# from source to destination (0 for adjacent squares and for squares that are not in line)
+BETWEEN = _build_between_table()
+
+
+def _slider_attacks(index, occupied, positive_rays, negative_rays):
+    """Returns the bitboard of every square a sliding piece on the passed index can reach along the passed rays. Each
+    ray stops at (and includes) the first occupied square on it"""
+
+    attacks = 0
+    for rays in positive_rays:
+        ray = rays[index]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= rays[(blockers & -blockers).bit_length() - 1]
+        attacks |= ray
+
+    for rays in negative_rays:
+        ray = rays[index]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= rays[blockers.bit_length() - 1]
+        attacks |= ray
+
+    return attacks
+
+
+def rook_attacks(index, occupied):
+    """Returns the bitboard of every square a rook on the passed index can reach given the occupied squares"""
+
+    return _slider_attacks(index, occupied, ROOK_POSITIVE_RAYS, ROOK_NEGATIVE_RAYS)
+
+
+def bishop_attacks(index, occupied):
+    """Returns the bitboard of every square a bishop on the passed index can reach given the occupied squares"""
+
+    return _slider_attacks(index, occupied, BISHOP_POSITIVE_RAYS, BISHOP_NEGATIVE_RAYS)
+
+
+def queen_attacks(index, occupied):
+    """Returns the bitboard of every square a queen on the passed index can reach given the occupied squares"""
+
+    return rook_attacks(index, occupied) | bishop_attacks(index, occupied)
+
+
+def pawn_targets(team_color, index, occupied, enemy, unmoved):
+    """Returns the bitboard of every square a pawn of the passed team color on the passed index can move to. A pawn
+    moves one square forward onto an empty square, two squares forward if it has not moved yet (unmoved is True) and
+    both squares are empty, and one square diagonally forward only to capture an enemy piece"""
+
+    targets = PAWN_PUSHES[team_color][index] & ~occupied
+    if targets and unmoved:
+        targets |= PAWN_PUSHES[team_color][targets.bit_length() - 1] & ~occupied
+
+    return targets | (PAWN_ATTACKS[team_color][index] & enemy)
+
+
+def piece_targets(piece_type, team_color, index, own, enemy, unmoved=False):
+    """Returns the bitboard of every square the piece of the passed type and team color on the passed index can move
+    to, given the bitboards of its own team's pieces and the enemy team's pieces. Squares holding the moving team's own
+    pieces are never included. unmoved is only used for pawns"""
+
+    occupied = own | enemy
+
+    if piece_type == "pawn":
+        return pawn_targets(team_color, index, occupied, enemy, unmoved)
+    if piece_type == "knight":
+        return KNIGHT_ATTACKS[index] & ~own
+    if piece_type == "king":
+        return KING_ATTACKS[index] & ~own
+    if piece_type == "rook":
+        return rook_attacks(index, occupied) & ~own
+    if piece_type == "bishop":
+        return bishop_attacks(index, occupied) & ~own
+
+    return queen_attacks(index, occupied) & ~own
+
+
+# Zobrist keys: one random 64-bit key per (team color, piece type, square), one per (team color, square) for a pawn
+# that has not moved yet (so positions that differ only in whether a pawn may still move two squares hash
+# differently), and one that is mixed in when it is black's turn. The generator is seeded so that every process
+# builds the same keys, which lets hashes be stored on disk or shared between worker processes
+def _build_zobrist_keys():
+    """Builds and returns the piece keys, unmoved pawn keys and black-to-move key used for Zobrist hashing"""
+
+    generator = random.Random(0x5EED_C4E55)
+
+    piece_keys = {}
+    unmoved_pawn_keys = {}
+    for team_color in ("WHITE", "BLACK"):
+        piece_keys[team_color] = {piece_type: [generator.getrandbits(64) for index in range(64)]
+                                  for piece_type in PIECE_TYPES}
+        unmoved_pawn_keys[team_color] = [generator.getrandbits(64) for index in range(64)]
+
+    return piece_keys, unmoved_pawn_keys, generator.getrandbits(64)
+
+
+ZOBRIST_PIECE_KEYS, ZOBRIST_UNMOVED_PAWN_KEYS, ZOBRIST_BLACK_TO_MOVE = _build_zobrist_keys()
@@ -0,0 +1,146 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Static evaluation of ChessVar positions. In this variant a team loses as soon as all of its pieces of
+# any one type have been captured, so a piece is not simply worth a fixed 1/3/5/9 points: the last king, the last
+# queen, and the last rook, bishop or knight of a pair are critical targets whose loss ends the game. The evaluation
+# gives every piece a base strength, then subtracts a scarcity penalty that grows steeply as a team gets down to its
+# last one or two pieces of a type, adds a small bonus for mobility, and penalizes the team to move when more than one
+# of its critical pieces is attacked at the same time (it can only save one of them). Scores are in centipawns from
+# the point of view of the team whose turn it is.
+
+from ChessBoard import PIECE_TYPES, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, mask_to_indexes, count_bits, \
+    rook_attacks, bishop_attacks, queen_attacks
+
+# score of a won game, reduced by the number of plies it takes to win so that faster wins are preferred
+WIN_SCORE = 1000000
+
+PIECE_STRENGTH = {
+    "pawn"   : 100,
+    "rook"   : 500,
+    "knight" : 300,
+    "bishop" : 320,
+    "queen"  : 900,
+    "king"   : 250
+}
+
+# SCARCITY_PENALTY[n] is subtracted for each piece type a team has exactly n pieces of. With no pieces of a type left
+# the game is already over, so there is no entry for 0
+SCARCITY_PENALTY = {1: 700, 2: 150}
+
+MOBILITY_WEIGHT = 4
+
+# penalty for the team to move when two or more of its critical (last of their type) pieces are attacked
+CRITICAL_FORK_PENALTY = 600
+
+# penalty for the team to move when one of its critical pieces is attacked (it has to spend its move saving it)
+CRITICAL_THREAT_PENALTY = 60
+
+
+def get_team_attacks(team, occupied):
+    """Returns a (attacked squares, mobility) pair for the passed ChessTeam. The attacked squares bitboard holds every
+    square a piece of the team could capture on, and mobility is the number of non-pawn moves to squares that are not
+    occupied by the team itself"""
+
+    team_color = team.get_team_color()
+    own = team.get_occupied()
+    attacks = 0
+    mobility = 0
+
+    for index in mask_to_indexes(team.get_bitboard("pawn")):
+        attacks |= PAWN_ATTACKS[team_color][index]
+
+    for index in mask_to_indexes(team.get_bitboard("knight")):
+        piece_attacks = KNIGHT_ATTACKS[index]
+        attacks |= piece_attacks
+        mobility += count_bits(piece_attacks & ~own)
+
+    for index in mask_to_indexes(team.get_bitboard("king")):
+        piece_attacks = KING_ATTACKS[index]
+        attacks |= piece_attacks
+        mobility += count_bits(piece_attacks & ~own)
+
+    for index in mask_to_indexes(team.get_bitboard("rook")):
+        piece_attacks = rook_attacks(index, occupied)
+        attacks |= piece_attacks
+        mobility += count_bits(piece_attacks & ~own)
+
+    for index in mask_to_indexes(team.get_bitboard("bishop")):
+        piece_attacks = bishop_attacks(index, occupied)
+        attacks |= piece_attacks
+        mobility += count_bits(piece_attacks & ~own)
+
+    for index in mask_to_indexes(team.get_bitboard("queen")):
+        piece_attacks = queen_attacks(index, occupied)
+        attacks |= piece_attacks
+        mobility += count_bits(piece_attacks & ~own)
+
+    return attacks, mobility
+
+
+def get_critical_pieces(team):
+    """Returns a bitboard of the passed team's critical pieces: every piece that is the last one of its type"""
+
+    critical = 0
+    for piece_type in PIECE_TYPES:
+        if team.get_piece_count(piece_type) == 1:
+            critical |= team.get_bitboard(piece_type)
+
+    return critical
+
+
+def evaluate_material(team):
+    """Returns the material score of the passed ChessTeam: the base strength of each of its pieces, minus the scarcity
+    penalty of every piece type it is down to its last one or two pieces of"""
+
+    score = 0
+    for piece_type in PIECE_TYPES:
+        count = team.get_piece_count(piece_type)
+        score += PIECE_STRENGTH[piece_type] * count - SCARCITY_PENALTY.get(count, 0)
+
+    return score
+
+
+def evaluate(game):
+    """Returns the static evaluation of the passed ChessVar position from the point of view of the team whose turn it
+    is. A finished game is scored as a loss for the team to move, since the game can only be won by the team that just
+    made a capture, unless it was drawn by one of the optional draw rules"""
+
+    if game.get_game_state() == "DRAW":
+        return 0
+    if game.get_game_state() != "UNFINISHED":
+        return -WIN_SCORE
+
+    team = game.get_team(game.get_turn())
+    if game.get_turn() == "WHITE":
+        other_team = game.get_team("BLACK")
+    else:
+        other_team = game.get_team("WHITE")
+
+    occupied = team.get_occupied() | other_team.get_occupied()
+    _, team_mobility = get_team_attacks(team, occupied)
+    other_attacks, other_mobility = get_team_attacks(other_team, occupied)
+
+    score = evaluate_material(team) - evaluate_material(other_team)
+    score += MOBILITY_WEIGHT * (team_mobility - other_mobility)
+
+    threatened = count_bits(get_critical_pieces(team) & other_attacks)
+    if threatened >= 2:
+        score -= CRITICAL_FORK_PENALTY
+    elif threatened == 1:
+        score -= CRITICAL_THREAT_PENALTY
+
+    return score
+
+
+def get_capture_value(team, index):
+    """Returns how valuable it is to capture the passed team's piece on the passed square index, for ordering captures
+    during search. Capturing the last piece of a type wins the game, so it is worth more than anything else, and a
+    piece that is one of the last two of its type is worth its strength plus the penalty its team would suffer"""
+
+    piece_type = team.get_piece_type(team.identify_piece_by_index(index))
+    count = team.get_piece_count(piece_type)
+    if count == 1:
+        return WIN_SCORE
+
+    return PIECE_STRENGTH[piece_type] + SCARCITY_PENALTY.get(count - 1, 0) - SCARCITY_PENALTY.get(count, 0)
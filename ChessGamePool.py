@@ -0,0 +1,214 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: A bounded pool of reusable ChessVar games, for services that start very large numbers of short games.
+# Instead of building a new ChessVar for every game and leaving the old one to the garbage collector, a finished game
+# is handed back to the pool with release, and the next acquire takes it out again and puts it in the starting
+# position with ChessVar.reset (or in another position with set_position). The pool keeps at most max_size idle
+# games; games released beyond that are simply dropped, so the pool never holds on to more memory than it was
+# allowed. Every game handed out gets the pool's draw rules and legal move cache, whatever was done to it last time.
+# The pool can be shared by threads. Run this file to benchmark making new games against resetting games and taking
+# them from a pool, for example: python ChessGamePool.py --iterations 100000
+
+import argparse
+import contextlib
+import json
+import sys
+import threading
+import time
+
+from ChessVar import ChessVar
+
+DEFAULT_MAX_SIZE = 1024
+
+
+class GamePool:
+    """The GamePool class keeps finished ChessVar games for reuse. Its data members are the list of idle games, the set
+    of their ids (so that a game released twice is only kept once), the largest number of idle games, the draw rules
+    and legal move cache given to every game handed out, the lock that makes the pool safe to share between threads,
+    and counters of the games created, reused, and dropped"""
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, draw_rules=(None, None), move_cache=None):
+        """Receives the largest number of idle games to keep, the (repetition limit, quiet ply limit) draw rules and
+        the optional LegalMoveCache that every game handed out should have"""
+
+        if max_size < 0:
+            raise ValueError("max_size cannot be negative")
+
+        self._idle = []
+        self._idle_ids = set()
+        self._max_size = max_size
+        self._draw_rules = draw_rules
+        self._move_cache = move_cache
+        self._lock = threading.Lock()
+        self._created = 0
+        self._reused = 0
+        self._dropped = 0
+
+
+    def __len__(self):
+        """Returns the number of idle games in the pool"""
+
+        return len(self._idle)
+
+
+    def get_max_size(self):
+        """Returns the largest number of idle games the pool keeps"""
+
+        return self._max_size
+
+
+    def acquire(self, position=None):
+        """Returns a game in the starting position, or in the passed Position. An idle game is reused if there is one,
+        and a new ChessVar is made otherwise"""
+
+        with self._lock:
+            game = self._idle.pop() if self._idle != [] else None
+            if game is None:
+                self._created += 1
+            else:
+                self._idle_ids.discard(id(game))
+                self._reused += 1
+
+        if game is None:
+            game = ChessVar(position)
+        elif position is None:
+            game.reset()
+        else:
+            game.set_position(position)
+
+        game.set_draw_rules(*self._draw_rules)
+        game.set_move_cache(self._move_cache)
+
+        return game
+
+
+    def release(self, game):
+        """Hands a game that is no longer needed back to the pool. The game must not be used again by the caller. If
+        the pool already holds max_size idle games, the game is dropped instead"""
+
+        with self._lock:
+            if id(game) in self._idle_ids:
+                return
+            if len(self._idle) >= self._max_size:
+                self._dropped += 1
+                return
+            self._idle.append(game)
+            self._idle_ids.add(id(game))
+
+
+    @contextlib.contextmanager
+    def game(self, position=None):
+        """Context manager that acquires a game (see acquire) and releases it when the block ends:
+        with pool.game() as game: ..."""
+
+        game = self.acquire(position)
+        try:
+            yield game
+        finally:
+            self.release(game)
+
+
+    def clear(self):
+        """Drops every idle game"""
+
+        with self._lock:
+            self._idle = []
+            self._idle_ids.clear()
+
+
+    def get_statistics(self):
+        """Returns a dictionary with the number of games created, reused and dropped, the share of acquired games that
+        were reused, and the current and largest number of idle games"""
+
+        acquired = self._created + self._reused
+
+        return {
+            "created"    : self._created,
+            "reused"     : self._reused,
+            "dropped"    : self._dropped,
+            "reuse_rate" : self._reused / acquired if acquired > 0 else 0.0,
+            "idle"       : len(self._idle),
+            "max_size"   : self._max_size
+        }
+
+
+def time_operation(operation, iterations):
+    """Calls the passed function iterations times and returns the mean time of a call in microseconds"""
+
+    start_time = time.perf_counter()
+    for iteration in range(iterations):
+        operation()
+
+    return (time.perf_counter() - start_time) / iterations * 1e6
+
+
+def benchmark(iterations=100000):
+    """Measures the mean time in microseconds of making a new game, making a game from a Position, resetting a game,
+    setting a game's position, and acquiring and releasing a pooled game (both in the starting position and in another
+    position). Each game plays one move first, as a real game would have. Returns a dictionary of the times and the
+    speedup of the pooled start over making a new game"""
+
+    position = ChessVar().get_position()
+    game = ChessVar()
+    pool = GamePool(max_size=16)
+
+    def new_game():
+        ChessVar().make_move("e2", "e4")
+
+    def new_game_from_position():
+        ChessVar.from_position(position).make_move("e2", "e4")
+
+    def reset_game():
+        game.reset()
+        game.make_move("e2", "e4")
+
+    def set_game_position():
+        game.set_position(position)
+        game.make_move("e2", "e4")
+
+    def pooled_game():
+        pooled = pool.acquire()
+        pooled.make_move("e2", "e4")
+        pool.release(pooled)
+
+    def pooled_game_from_position():
+        pooled = pool.acquire(position)
+        pooled.make_move("e2", "e4")
+        pool.release(pooled)
+
+    def move_only():
+        game.make_move("e2", "e4")
+        game.pop()
+
+    results = {
+        "iterations"                   : iterations,
+        "move_microseconds"            : time_operation(move_only, iterations),
+        "new_game_microseconds"        : time_operation(new_game, iterations),
+        "from_position_microseconds"   : time_operation(new_game_from_position, iterations),
+        "reset_microseconds"           : time_operation(reset_game, iterations),
+        "set_position_microseconds"    : time_operation(set_game_position, iterations),
+        "pool_microseconds"            : time_operation(pooled_game, iterations),
+        "pool_position_microseconds"   : time_operation(pooled_game_from_position, iterations)
+    }
+    results["pool_speedup"] = results["new_game_microseconds"] / results["pool_microseconds"]
+    results["pool_statistics"] = pool.get_statistics()
+
+    return results
+
+
+def main(arguments=None):
+    """Command line entry point. Runs the benchmark and prints the results as JSON"""
+
+    parser = argparse.ArgumentParser(description="Compare the cost of making new ChessVar games with resetting and "
+                                                 "pooling them.")
+    parser.add_argument("--iterations", type=int, default=100000, help="games per measurement (default 100000)")
+    options = parser.parse_args(arguments)
+
+    print(json.dumps(benchmark(options.iterations), indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
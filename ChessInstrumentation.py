@@ -0,0 +1,216 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Optional instrumentation of ChessVar move validation, for finding out where the time of a slow
+# validation job goes. A MoveInstrumentation object is attached to one or more ChessVar games; while attached, it
+# counts the calls to each stage of make_move and is_valid_move and adds up the time spent in each (the turn check,
+# the check_*_move dispatch, the path check against the precomputed BETWEEN table, the self-capture check, the
+# victory check, and carrying out the move), and it counts why moves were rejected: game over, wrong turn, illegal
+# shape for the piece, blocked path, or self-capture. Attaching replaces the stage methods of that one game object
+# with timing wrappers, and detaching removes them again. ChessVar itself has no instrumentation code, so a game that
+# is not attached runs exactly as fast as before. Times include the stages called from inside them (make_move
+# includes all of the others). A game with a LegalMoveCache (see ChessMoveCache.py) checks moves against the cache and
+# skips the validation stages, so when the cache rejects a move, the move is checked again by those stages (with the
+# cache set aside) only to find out why; that second check counts its rejection reason but not its calls or time. A
+# snapshot of the counters can be exported as a dictionary, as JSON, or in the Prometheus text exposition format.
+
+import json
+import time
+
+# (stage name, ChessVar method) for every stage that is timed, in the order they run during make_move
+STAGES = (
+    ("make_move", "make_move"),
+    ("turn_check", "check_if_turn_team_piece_is_being_moved"),
+    ("is_valid_move", "is_valid_move"),
+    ("move_shape", "check_piece_type_for_valid_move"),
+    ("path_check", "check_path_between"),
+    ("capture_check", "check_for_valid_capture"),
+    ("execute_move", "execute_move"),
+    ("victory_check", "check_for_victory")
+)
+
+REJECTION_REASONS = ("game_over", "wrong_turn", "illegal_shape", "blocked_path", "self_capture")
+
+# the result of each stage's method that means the move is rejected, and the reason counted for it
+_REJECTING_RESULTS = {
+    "turn_check"    : (False, "wrong_turn"),
+    "move_shape"    : (False, "illegal_shape"),
+    "path_check"    : (True, "blocked_path"),
+    "capture_check" : (False, "self_capture")
+}
+
+
+class MoveInstrumentation:
+    """The MoveInstrumentation class collects call counts, timings and rejection counts for every ChessVar game it is
+    attached to. Its data members are the call count, total nanoseconds and longest call of each stage, the count of
+    each rejection reason, the counts of accepted and rejected moves, the set of ids of the games attached, and
+    whether a move rejected by a legal move cache is being checked again to find its rejection reason"""
+
+    def __init__(self):
+        """All counters start at zero"""
+
+        self._attached = set()
+        self._classifying = False
+        self.reset()
+
+
+    def reset(self):
+        """Sets every counter back to zero. Games stay attached"""
+
+        self._calls = {stage: 0 for stage, method_name in STAGES}
+        self._nanoseconds = {stage: 0 for stage, method_name in STAGES}
+        self._longest = {stage: 0 for stage, method_name in STAGES}
+        self._rejections = {reason: 0 for reason in REJECTION_REASONS}
+        self._accepted = 0
+        self._rejected = 0
+
+
+    def attach(self, game):
+        """Starts instrumenting the passed ChessVar game by shadowing each stage method with a timing wrapper stored on
+        the game object itself. Other games are not affected. Returns the game"""
+
+        if id(game) in self._attached:
+            return game
+
+        for stage, method_name in STAGES:
+            setattr(game, method_name, self.wrap_stage(game, stage, getattr(game, method_name)))
+        self._attached.add(id(game))
+
+        return game
+
+
+    def detach(self, game):
+        """Stops instrumenting the passed ChessVar game by removing the wrappers, so that its methods are the plain
+        class methods again"""
+
+        if id(game) not in self._attached:
+            return
+
+        for stage, method_name in STAGES:
+            del game.__dict__[method_name]
+        self._attached.discard(id(game))
+
+
+    def wrap_stage(self, game, stage, method):
+        """Returns a wrapper around the passed bound method that counts and times each call as the passed stage, and
+        counts the rejection the stage's result stands for, if any"""
+
+        calls = self._calls
+        nanoseconds = self._nanoseconds
+        longest = self._longest
+        rejecting_result, reason = _REJECTING_RESULTS.get(stage, (None, None))
+        clock = time.perf_counter_ns
+
+        def timed(*arguments):
+            if self._classifying:
+                result = method(*arguments)
+                if reason is not None and result is rejecting_result:
+                    self._rejections[reason] += 1
+                return result
+
+            cached = False
+            if stage == "make_move":
+                if game.get_game_state() != "UNFINISHED":
+                    self._rejections["game_over"] += 1
+                else:
+                    cached = game.get_move_cache() is not None
+
+            start = clock()
+            result = method(*arguments)
+            elapsed = clock() - start
+
+            calls[stage] += 1
+            nanoseconds[stage] += elapsed
+            if elapsed > longest[stage]:
+                longest[stage] = elapsed
+
+            if reason is not None and result is rejecting_result:
+                self._rejections[reason] += 1
+            elif stage == "make_move":
+                if result == True:
+                    self._accepted += 1
+                else:
+                    self._rejected += 1
+                    if cached:
+                        self.classify_rejection(game, arguments)
+
+            return result
+
+        return timed
+
+
+    def classify_rejection(self, game, arguments):
+        """Counts the rejection reason of a move that the passed game's legal move cache rejected, by running the
+        passed make_move arguments through the validation stages with the cache set aside. Only the rejection is
+        counted; the calls and times of the stages are not"""
+
+        move_cache = game.get_move_cache()
+        game.set_move_cache(None)
+        self._classifying = True
+        try:
+            type(game).make_move(game, *arguments)
+        finally:
+            self._classifying = False
+            game.set_move_cache(move_cache)
+
+
+    def snapshot(self):
+        """Returns the current counters as a dictionary that can be written out as JSON. Each stage has its number of
+        calls and its total, mean and longest time in seconds"""
+
+        stages = {}
+        for stage, method_name in STAGES:
+            calls = self._calls[stage]
+            stages[stage] = {
+                "method"        : method_name,
+                "calls"         : calls,
+                "seconds"       : self._nanoseconds[stage] / 1e9,
+                "mean_seconds"  : self._nanoseconds[stage] / calls / 1e9 if calls > 0 else 0.0,
+                "max_seconds"   : self._longest[stage] / 1e9
+            }
+
+        return {
+            "moves"      : {"accepted": self._accepted, "rejected": self._rejected},
+            "rejections" : dict(self._rejections),
+            "stages"     : stages
+        }
+
+
+    def to_json(self, indent=None):
+        """Returns the snapshot as a JSON string"""
+
+        return json.dumps(self.snapshot(), indent=indent)
+
+
+    def to_prometheus(self, prefix="chessvar"):
+        """Returns the snapshot in the Prometheus text exposition format, with every metric name starting with the
+        passed prefix"""
+
+        lines = [
+            "# HELP %s_moves_total Moves passed to make_move, by result." % prefix,
+            "# TYPE %s_moves_total counter" % prefix,
+            '%s_moves_total{result="accepted"} %d' % (prefix, self._accepted),
+            '%s_moves_total{result="rejected"} %d' % (prefix, self._rejected),
+            "# HELP %s_move_rejections_total Rejected moves, by reason." % prefix,
+            "# TYPE %s_move_rejections_total counter" % prefix
+        ]
+        for reason in REJECTION_REASONS:
+            lines.append('%s_move_rejections_total{reason="%s"} %d' % (prefix, reason, self._rejections[reason]))
+
+        lines.append("# HELP %s_stage_calls_total Calls of each make_move stage." % prefix)
+        lines.append("# TYPE %s_stage_calls_total counter" % prefix)
+        for stage, method_name in STAGES:
+            lines.append('%s_stage_calls_total{stage="%s"} %d' % (prefix, stage, self._calls[stage]))
+
+        lines.append("# HELP %s_stage_seconds_total Time spent in each make_move stage, including the stages it "
+                     "calls." % prefix)
+        lines.append("# TYPE %s_stage_seconds_total counter" % prefix)
+        for stage, method_name in STAGES:
+            lines.append('%s_stage_seconds_total{stage="%s"} %.9f' % (prefix, stage, self._nanoseconds[stage] / 1e9))
+
+        lines.append("# HELP %s_stage_max_seconds Longest single call of each make_move stage." % prefix)
+        lines.append("# TYPE %s_stage_max_seconds gauge" % prefix)
+        for stage, method_name in STAGES:
+            lines.append('%s_stage_max_seconds{stage="%s"} %.9f' % (prefix, stage, self._longest[stage] / 1e9))
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,420 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: A Monte Carlo tree search engine for ChessVar. This variant is decided by the first capture of a team's
+# last piece of some type, so random games end quickly and their results say a lot about a position, which suits
+# MCTS. The search grows a tree of positions from the current one, choosing which branch to follow with UCT (the
+# upper confidence bound for trees), and scores each new leaf by playing a batch of light random playouts from it.
+# The tree is walked on the ChessVar game itself with execute_move and pop, but the playouts run on a PlayoutBoard,
+# which is only twelve piece bitboards and piece counters: moves come from the ChessBoard attack tables, and a
+# playout ends as soon as a capture leaves a team without any pieces of a type (the rule check_for_victory applies),
+# or is scored as a draw after a ply limit. The tree is kept between moves: when the engine is asked to search a
+# position that is a child or grandchild of its last root (after its own move and the opponent's reply), that
+# subtree becomes the new root and its statistics are reused. Each search runs within a playout budget, a time
+# budget, or both.
+
+import math
+import random
+import time
+
+from ChessBoard import PIECE_TYPES, INDEX_TO_SQUARE, SQUARE_MASKS, mask_to_indexes, count_bits, piece_targets
+
+TEAM_COLORS = ("WHITE", "BLACK")
+
+# UCT exploration constant
+EXPLORATION = 1.4
+
+# number of playouts run from each new leaf
+DEFAULT_BATCH_SIZE = 8
+
+# playouts longer than this many plies are scored as draws
+PLAYOUT_PLY_LIMIT = 200
+
+# results of a finished playout, from the point of view of the team to move at the leaf it started from
+LOSS, DRAW, WIN = 0.0, 0.5, 1.0
+
+
+class PlayoutBoard:
+    """The PlayoutBoard class is a stripped down board used for random playouts. Its data members are the piece
+    bitboards of each team (a list of six bitboards per team, in PIECE_TYPES order), the occupied squares of each
+    team, the unmoved pawns of each team, the number of pieces of each type each team has left, and the number of the
+    team to move (0 for white, 1 for black). Teams are numbered rather than named so that a move is only list
+    indexing"""
+
+    __slots__ = ("_pieces", "_occupied", "_unmoved", "_counts", "_turn")
+
+    def __init__(self, pieces, occupied, unmoved, counts, turn):
+        """Receives the five data members described in the class docstring. Use from_game or copy to make one"""
+
+        self._pieces = pieces
+        self._occupied = occupied
+        self._unmoved = unmoved
+        self._counts = counts
+        self._turn = turn
+
+
+    @staticmethod
+    def from_game(game):
+        """Returns a PlayoutBoard holding the passed ChessVar game's current position"""
+
+        pieces = []
+        occupied = []
+        unmoved = []
+        counts = []
+        for team_color in TEAM_COLORS:
+            team = game.get_team(team_color)
+            pieces.append([team.get_bitboard(piece_type) for piece_type in PIECE_TYPES])
+            occupied.append(team.get_occupied())
+            unmoved.append(team.get_unmoved_pawns())
+            counts.append([team.get_piece_count(piece_type) for piece_type in PIECE_TYPES])
+
+        return PlayoutBoard(pieces, occupied, unmoved, counts, TEAM_COLORS.index(game.get_turn()))
+
+
+    def copy(self):
+        """Returns an independent copy of the board"""
+
+        return PlayoutBoard([list(self._pieces[0]), list(self._pieces[1])], list(self._occupied),
+                            list(self._unmoved), [list(self._counts[0]), list(self._counts[1])], self._turn)
+
+
+    def get_turn(self):
+        """Returns the number of the team to move (0 for white, 1 for black)"""
+
+        return self._turn
+
+
+    def generate_targets(self):
+        """Returns a (total number of moves, list of (piece type number, source index, target bitboard)) pair for the
+        team to move"""
+
+        turn = self._turn
+        team_color = TEAM_COLORS[turn]
+        own = self._occupied[turn]
+        enemy = self._occupied[1 - turn]
+        unmoved = self._unmoved[turn]
+        total = 0
+        targets = []
+
+        for type_number, piece_type in enumerate(PIECE_TYPES):
+            for index in mask_to_indexes(self._pieces[turn][type_number]):
+                mask = piece_targets(piece_type, team_color, index, own, enemy, unmoved & SQUARE_MASKS[index] != 0)
+                if mask:
+                    total += count_bits(mask)
+                    targets.append((type_number, index, mask))
+
+        return total, targets
+
+
+    def make_move(self, type_number, source_index, destination_index):
+        """Moves the team to move's piece of the passed type number from source_index to destination_index, capturing
+        whatever is there, and passes the turn. Returns True if the move won the game: the capture left the other team
+        with no pieces of some type"""
+
+        turn = self._turn
+        other = 1 - turn
+        source_mask = SQUARE_MASKS[source_index]
+        destination_mask = SQUARE_MASKS[destination_index]
+        won = False
+
+        if self._occupied[other] & destination_mask:
+            other_pieces = self._pieces[other]
+            for captured_type in range(6):
+                if other_pieces[captured_type] & destination_mask:
+                    other_pieces[captured_type] ^= destination_mask
+                    self._counts[other][captured_type] -= 1
+                    break
+            self._occupied[other] ^= destination_mask
+            self._unmoved[other] &= ~destination_mask
+            won = 0 in self._counts[other]
+
+        self._pieces[turn][type_number] ^= source_mask | destination_mask
+        self._occupied[turn] ^= source_mask | destination_mask
+        self._unmoved[turn] &= ~source_mask
+        self._turn = other
+
+        return won
+
+
+    def play_out(self, generator, ply_limit=PLAYOUT_PLY_LIMIT):
+        """Plays uniformly random moves on this board (which is changed) until a team wins, the team to move has no
+        moves, or ply_limit plies have been played. Returns the number of the winning team, or None for a draw"""
+
+        for ply in range(ply_limit):
+            total, targets = self.generate_targets()
+            if total == 0:
+                return None
+
+            choice = generator.randrange(total)
+            for type_number, source_index, mask in targets:
+                move_count = count_bits(mask)
+                if choice < move_count:
+                    destination_index = mask_to_indexes(mask)[choice]
+                    break
+                choice -= move_count
+
+            mover = self._turn
+            if self.make_move(type_number, source_index, destination_index):
+                return mover
+
+        return None
+
+
+class TreeNode:
+    """The TreeNode class is one position in the search tree. Its data members are the move that led to it (a (source
+    index, destination index) pair, None at the root), its parent node, its children, the legal moves not yet expanded
+    into children, the position's Zobrist hash, the number of playouts through it, the total result of those playouts
+    for the team that made the move leading to it, and whether the move leading to it won the game"""
+
+    __slots__ = ("_move", "_parent", "_children", "_untried", "_hash", "_visits", "_score", "_winning")
+
+    def __init__(self, move, parent, game, winning=False):
+        """Makes a node for the passed ChessVar game's current position, reached by the passed move from parent"""
+
+        self._move = move
+        self._parent = parent
+        self._children = []
+        self._hash = game.get_hash()
+        self._winning = winning
+        self._untried = [] if winning else game.generate_move_indexes()
+        self._visits = 0
+        self._score = 0.0
+
+
+    def get_move(self):
+        """Returns the move that led to this node"""
+
+        return self._move
+
+
+    def get_children(self):
+        """Returns the list of expanded child nodes"""
+
+        return self._children
+
+
+    def get_hash(self):
+        """Returns the Zobrist hash of the node's position"""
+
+        return self._hash
+
+
+    def get_visits(self):
+        """Returns the number of playouts that passed through this node"""
+
+        return self._visits
+
+
+    def get_mean_score(self):
+        """Returns the average playout result for the team that made the move leading to this node (0 to 1)"""
+
+        if self._visits == 0:
+            return 0.0
+
+        return self._score / self._visits
+
+
+    def is_winning(self):
+        """Returns True if the move leading to this node won the game"""
+
+        return self._winning
+
+
+    def detach(self):
+        """Makes this node a root by cutting it off from its parent"""
+
+        self._parent = None
+        self._move = None
+
+
+    def select_child(self, exploration):
+        """Returns the child with the highest UCT value: its mean score plus an exploration bonus that grows with the
+        parent's visits and shrinks with the child's own"""
+
+        log_visits = math.log(self._visits)
+        best_value = -1.0
+        best_child = None
+        for child in self._children:
+            value = child._score / child._visits + exploration * math.sqrt(log_visits / child._visits)
+            if value > best_value:
+                best_value = value
+                best_child = child
+
+        return best_child
+
+
+class MCTSEngine:
+    """The MCTSEngine class chooses ChessVar moves with Monte Carlo tree search. Its data members are the root of the
+    tree kept from the previous search, the UCT exploration constant, the number of playouts per new leaf, the playout
+    ply limit, and the random generator used by playouts"""
+
+    def __init__(self, exploration=EXPLORATION, batch_size=DEFAULT_BATCH_SIZE, ply_limit=PLAYOUT_PLY_LIMIT, seed=None):
+        """Receives the UCT exploration constant, the number of playouts run from each new leaf, the ply limit of a
+        playout, and an optional seed for the random generator"""
+
+        self._root = None
+        self._exploration = exploration
+        self._batch_size = batch_size
+        self._ply_limit = ply_limit
+        self._generator = random.Random(seed)
+
+
+    def get_root(self):
+        """Returns the root TreeNode of the current tree, or None before the first search"""
+
+        return self._root
+
+
+    def find_root(self, game):
+        """Returns the node of the kept tree holding the passed game's current position, looking at the root, its
+        children and its grandchildren, or None if the position is not there"""
+
+        if self._root is None:
+            return None
+
+        position_hash = game.get_hash()
+        level = [self._root]
+        for depth in range(3):
+            for node in level:
+                if node.get_hash() == position_hash:
+                    return node
+            level = [child for node in level for child in node.get_children()]
+
+        return None
+
+
+    def expand(self, node, game):
+        """Expands one untried move of the passed node (the game is at the node's position): the move is made on the
+        game and a child node is added for it. Returns the new child, with the game left at its position"""
+
+        moves = node._untried
+        move = moves.pop(self._generator.randrange(len(moves)))
+        game.execute_move(move[0], move[1])
+        game_state = game.get_game_state()
+        child = TreeNode(move, node, game, game_state != "UNFINISHED" and game_state != "DRAW")
+        node._children.append(child)
+
+        return child
+
+
+    def run_playouts(self, game):
+        """Plays a batch of random playouts from the passed game's current position and returns their total result
+        for the team that made the move leading to this position"""
+
+        board = PlayoutBoard.from_game(game)
+        leaf_mover = 1 - board.get_turn()
+        total = 0.0
+
+        for playout in range(self._batch_size):
+            winner = board.copy().play_out(self._generator, self._ply_limit)
+            if winner is None:
+                total += DRAW
+            elif winner == leaf_mover:
+                total += WIN
+
+        return total
+
+
+    def run_iteration(self, game):
+        """Runs one MCTS iteration from the root: selection down the tree with UCT, expansion of one new leaf, a batch
+        of playouts from it, and backpropagation of the results. The game is left at the root position. Returns the
+        number of playouts run"""
+
+        node = self._root
+        depth = 0
+
+        while node._untried == [] and node._children != [] and node._winning == False:
+            node = node.select_child(self._exploration)
+            game.execute_move(node._move[0], node._move[1])
+            depth += 1
+
+        if node._untried != [] and node._winning == False:
+            node = self.expand(node, game)
+            depth += 1
+
+        playouts = self._batch_size
+        if node._winning:
+            result = WIN * playouts             # the move into this node won outright
+        elif node._untried == [] and node._children == []:
+            result = DRAW * playouts            # the team to move is stuck, or a draw rule ended the game
+        else:
+            result = self.run_playouts(game)
+
+        # backpropagation: the result alternates between the two teams on the way up
+        while node is not None:
+            node._visits += playouts
+            node._score += result
+            result = playouts - result
+            node = node._parent
+
+        for ply in range(depth):
+            game.pop()
+
+        return playouts
+
+
+    def search(self, game, playout_limit=None, time_limit=1.0, callback=None, callback_interval=1000):
+        """Searches the passed ChessVar game's current position until playout_limit playouts have been run or
+        time_limit seconds have passed (whichever comes first; at least one must be given). The tree from the previous
+        search is reused if it contains this position. The callback, if any, is called with the result so far about
+        every callback_interval playouts. Returns a dictionary with the best move as a (source square, destination
+        square) pair (None if there are no legal moves), its visit count and mean score, the number of playouts run in
+        this search, the total playouts in the tree, whether the tree was reused, the principal variation, and the time
+        taken in seconds"""
+
+        if playout_limit is None and time_limit is None:
+            raise ValueError("a search needs a playout or time limit")
+
+        start_time = time.perf_counter()
+        reused = self.find_root(game)
+        if reused is not None:
+            reused.detach()
+            self._root = reused
+        else:
+            self._root = TreeNode(None, None, game)
+
+        playouts = 0
+        next_callback = callback_interval
+        if game.get_game_state() == "UNFINISHED" and (self._root._untried != [] or self._root._children != []):
+            while True:
+                if playout_limit is not None and playouts >= playout_limit:
+                    break
+                if time_limit is not None and time.perf_counter() - start_time >= time_limit:
+                    break
+                playouts += self.run_iteration(game)
+                if callback is not None and playouts >= next_callback:
+                    next_callback += callback_interval
+                    callback(self.get_result(playouts, reused is not None, start_time))
+
+        return self.get_result(playouts, reused is not None, start_time)
+
+
+    def get_result(self, playouts, reused, start_time):
+        """Returns the result dictionary described in search for the current tree"""
+
+        result = {
+            "move"                : None,
+            "visits"              : 0,
+            "score"               : 0.0,
+            "playouts"            : playouts,
+            "tree_playouts"       : self._root.get_visits(),
+            "reused"              : reused,
+            "principal_variation" : [],
+            "time"                : time.perf_counter() - start_time
+        }
+
+        node = self._root
+        while node.get_children() != []:
+            node = max(node.get_children(), key=lambda child: (child.is_winning(), child.get_visits()))
+            result["principal_variation"].append((INDEX_TO_SQUARE[node.get_move()[0]],
+                                                  INDEX_TO_SQUARE[node.get_move()[1]]))
+            if node.is_winning():
+                break
+
+        if result["principal_variation"] != []:
+            best = max(self._root.get_children(), key=lambda child: (child.is_winning(), child.get_visits()))
+            result["move"] = result["principal_variation"][0]
+            result["visits"] = best.get_visits()
+            result["score"] = best.get_mean_score()
+
+        return result
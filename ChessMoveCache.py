@@ -0,0 +1,89 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: An optional least-recently-used cache of the legal moves of ChessVar positions, for clients that keep
+# asking whether moves are legal in positions they have seen before. The cache maps a position's Zobrist hash to the
+# frozenset of its legal (source index, destination index) moves, generated once with generate_move_indexes. A game
+# given a cache with ChessVar.set_move_cache answers make_move and is_legal with a set lookup whenever its position
+# is in the cache, instead of running the is_valid_move checks again. The cache holds at most max_positions
+# positions; when it is full, the position used longest ago is dropped. One cache can be shared by many games, since
+# the key depends only on the position (the pieces, the pawns that have not moved, and whose turn it is). Hits,
+# misses and evictions are counted and can be read with get_statistics.
+
+from collections import OrderedDict
+
+DEFAULT_MAX_POSITIONS = 4096
+
+
+class LegalMoveCache:
+    """The LegalMoveCache class is a bounded LRU cache from position hash to the set of legal moves. Its data members
+    are the ordered dictionary of cached move sets (least recently used first), the size bound, and the hit, miss and
+    eviction counters"""
+
+    def __init__(self, max_positions=DEFAULT_MAX_POSITIONS):
+        """Receives the largest number of positions to keep"""
+
+        if max_positions < 1:
+            raise ValueError("max_positions must be at least 1")
+
+        self._moves = OrderedDict()
+        self._max_positions = max_positions
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+
+    def __len__(self):
+        """Returns the number of positions in the cache"""
+
+        return len(self._moves)
+
+
+    def get_max_positions(self):
+        """Returns the largest number of positions the cache keeps"""
+
+        return self._max_positions
+
+
+    def get_legal_moves(self, game):
+        """Returns the frozenset of legal (source index, destination index) moves of the passed ChessVar game's current
+        position, from the cache if it is there and otherwise by generating them and adding them to the cache. The game
+        is expected to be unfinished"""
+
+        position_hash = game.get_hash()
+        moves = self._moves.get(position_hash)
+        if moves is not None:
+            self._hits += 1
+            self._moves.move_to_end(position_hash)
+            return moves
+
+        self._misses += 1
+        moves = frozenset(game.generate_move_indexes())
+        self._moves[position_hash] = moves
+        if len(self._moves) > self._max_positions:
+            self._moves.popitem(last=False)
+            self._evictions += 1
+
+        return moves
+
+
+    def clear(self):
+        """Empties the cache. The statistics are kept"""
+
+        self._moves.clear()
+
+
+    def get_statistics(self):
+        """Returns a dictionary with the number of hits, misses and evictions, the hit rate, and the current and largest
+        number of positions"""
+
+        lookups = self._hits + self._misses
+
+        return {
+            "hits"          : self._hits,
+            "misses"        : self._misses,
+            "evictions"     : self._evictions,
+            "hit_rate"      : self._hits / lookups if lookups > 0 else 0.0,
+            "positions"     : len(self._moves),
+            "max_positions" : self._max_positions
+        }
@@ -0,0 +1,207 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Parallel ChessVar search across CPU cores using "lazy SMP". Every worker process runs an ordinary
+# ChessSearch on the same root position, and all of them share one TranspositionTable laid over a block of shared
+# memory (multiprocessing.shared_memory). The workers do not divide the tree between them explicitly; they divide it
+# through the table: whatever one worker has searched is found in the table by the others, which then cut those
+# branches short and move on to other parts of the tree. Odd-numbered helper workers start their iterative deepening
+# one ply deeper than the main worker, so the workers are less often in step with each other. The table needs no
+# locks, because each entry stores the position hash XORed with its data and so a half-written entry never matches.
+# When the main worker (worker 0) finishes, the helpers are told to stop, and the deepest finished result is
+# returned. Each search reports the nodes searched by all workers together and the nodes per second, and benchmark
+# compares one worker with several to measure the speedup. Run this file to benchmark a machine, for example:
+# python ChessParallel.py --depth 5 --workers 1 2 4 8
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from multiprocessing import shared_memory
+
+from ChessSearch import ChessSearch, MAX_DEPTH
+from ChessVar import ChessVar
+from TranspositionTable import TranspositionTable
+
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+
+# state of a worker process: its view of the shared table and the event that tells it to stop
+_worker_memory = None
+_worker_table = None
+_worker_stop_event = None
+
+
+def _start_worker(memory_name, stop_event):
+    """Pool initializer. Attaches the worker process to the shared memory block and lays a TranspositionTable over it"""
+
+    global _worker_memory, _worker_table, _worker_stop_event
+
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    _worker_table = TranspositionTable(buffer=_worker_memory.buf)
+    _worker_stop_event = stop_event
+
+
+def _run_worker(task):
+    """Worker process entry point. Searches the position of the passed (worker number, Position, max depth, time limit,
+    node limit) task with the shared table and returns the search result with the worker number added. Worker 0 is the
+    main worker: when it finishes it sets the stop event so that the helpers stop too"""
+
+    worker_number, position, max_depth, time_limit, node_limit = task
+    game = ChessVar(position)
+    first_depth = 1 + worker_number % 2
+
+    if worker_number == 0:
+        result = ChessSearch(game, _worker_table).search(max_depth, time_limit, node_limit)
+        _worker_stop_event.set()
+    else:
+        result = ChessSearch(game, _worker_table).search(max_depth, time_limit, None, stop_event=_worker_stop_event,
+                                                         first_depth=first_depth)
+
+    result["worker"] = worker_number
+    return result
+
+
+class ParallelSearch:
+    """The ParallelSearch class runs lazy SMP searches on a pool of worker processes. Its data members are the number
+    of workers, the shared memory block holding the transposition table, a table in this process laid over the same
+    memory (for clearing it and reading statistics), the stop event shared with the workers, and the process pool.
+    Use it as a context manager, or call close when done, so that the processes and the shared memory are released"""
+
+    def __init__(self, workers=None, memory_bytes=DEFAULT_MEMORY_BYTES):
+        """Starts workers processes (one per CPU if None) sharing a transposition table of memory_bytes bytes"""
+
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+
+        self._workers = workers
+        self._memory = shared_memory.SharedMemory(create=True, size=memory_bytes)
+        self._table = TranspositionTable(buffer=self._memory.buf)
+        self._table.clear()
+        self._stop_event = multiprocessing.Event()
+        self._pool = multiprocessing.Pool(workers, _start_worker, (self._memory.name, self._stop_event))
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+
+    def get_workers(self):
+        """Returns the number of worker processes"""
+
+        return self._workers
+
+
+    def clear(self):
+        """Empties the shared transposition table, so that the next search starts from nothing"""
+
+        self._table.clear()
+
+
+    def search(self, game, max_depth=MAX_DEPTH, time_limit=None, node_limit=None):
+        """Searches the passed ChessVar game's current position with every worker and returns the result of the worker
+        that finished the deepest iteration (the main worker on a tie), as a ChessSearch result dictionary. node_limit
+        applies to the main worker. "nodes" is replaced by the nodes searched by all workers together, and the
+        dictionary also holds the number of workers, the main worker's own node count and the nodes per second"""
+
+        if time_limit is None and max_depth == MAX_DEPTH and node_limit is None:
+            raise ValueError("a parallel search needs a depth, time or node limit")
+
+        position = game.get_position()
+        tasks = [(worker_number, position, max_depth, time_limit, node_limit)
+                 for worker_number in range(self._workers)]
+
+        self._stop_event.clear()
+        start_time = time.perf_counter()
+        results = self._pool.map(_run_worker, tasks, chunksize=1)
+        elapsed = time.perf_counter() - start_time
+
+        best = results[0]
+        for result in results[1:]:
+            if result["depth"] > best["depth"] and result["move"] is not None:
+                best = result
+
+        best = dict(best)
+        best["main_nodes"] = results[0]["nodes"]
+        best["nodes"] = sum(result["nodes"] for result in results)
+        best["time"] = elapsed
+        best["workers"] = self._workers
+        best["nodes_per_second"] = best["nodes"] / elapsed if elapsed > 0 else 0.0
+
+        return best
+
+
+    def close(self):
+        """Stops the worker processes and releases the shared memory"""
+
+        if self._pool is None:
+            return
+
+        self._pool.close()
+        self._pool.join()
+        self._pool = None
+        self._table = None
+        self._memory.close()
+        self._memory.unlink()
+
+
+def benchmark(game, max_depth, worker_counts, memory_bytes=DEFAULT_MEMORY_BYTES, callback=None):
+    """Searches the passed game to max_depth once for each number of workers in worker_counts, each time with a freshly
+    cleared table, and returns a list of dictionaries with the number of workers, the time taken, the total nodes, the
+    nodes per second, the best move and score, and the speedup over the first worker count in the list (which should
+    be 1 to compare against a single process). The callback, if any, is called with each dictionary as it is made"""
+
+    rows = []
+    for workers in worker_counts:
+        with ParallelSearch(workers, memory_bytes) as parallel_search:
+            result = parallel_search.search(game, max_depth)
+
+        row = {
+            "workers"          : workers,
+            "time"             : result["time"],
+            "nodes"            : result["nodes"],
+            "nodes_per_second" : result["nodes_per_second"],
+            "depth"            : result["depth"],
+            "move"             : result["move"],
+            "score"            : result["score"],
+            "speedup"          : rows[0]["time"] / result["time"] if rows and result["time"] > 0 else 1.0
+        }
+        rows.append(row)
+        if callback is not None:
+            callback(row)
+
+    return rows
+
+
+def main(arguments=None):
+    """Command line entry point. Benchmarks a lazy SMP search of the starting position to a fixed depth with each
+    requested number of workers and prints one JSON line per run"""
+
+    parser = argparse.ArgumentParser(description="Measure the speedup and nodes per second of a lazy SMP ChessVar "
+                                                 "search.")
+    parser.add_argument("--depth", type=int, default=5, help="search depth (default 5)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, multiprocessing.cpu_count()],
+                        help="worker counts to compare, the first being the baseline (default: 1 and one per CPU)")
+    parser.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY_BYTES // (1024 * 1024),
+                        help="size of the shared transposition table in MB (default %d)" %
+                             (DEFAULT_MEMORY_BYTES // (1024 * 1024)))
+    parser.add_argument("--moves", nargs="*", default=[], help="moves to play before searching, such as e2e4 e7e5")
+    options = parser.parse_args(arguments)
+
+    game = ChessVar()
+    for move in options.moves:
+        if game.make_move(move[:2], move[2:]) == False:
+            parser.error("illegal move %s" % move)
+
+    benchmark(game, options.depth, options.workers, options.memory_mb * 1024 * 1024,
+              lambda row: print(json.dumps(row), flush=True))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
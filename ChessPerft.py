@@ -0,0 +1,296 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Perft (performance test) node counting for ChessVar. perft walks every legal move sequence to a fixed
+# depth with execute_move and pop and counts the positions reached. The counts at each depth are a fingerprint of the
+# move rules: a bug in pawn moves, path blocking or captures changes them, so they are checked against known-good
+# counts for the starting position and a set of stored test positions. Because the number of positions visited is
+# known exactly, timing a perft run also measures the throughput of move generation in nodes per second. A game stops
+# as soon as a team wins (WHITE_WON or BLACK_WON), so no moves are counted from a finished position. Test positions
+# are stored as the list of moves that leads to them from the starting position. perft only uses the move generator,
+# so validated_perft counts the same tree through the validation path instead: at every position it tries each
+# source and destination square pair through make_move (and is_legal), which runs the turn check, the shape checks,
+# the path check and the capture check, and it raises MoveRuleMismatch if the moves it accepts are not exactly the
+# moves generate_move_indexes gives. Timing it measures validation throughput. Run this file from the command line to
+# print a per-depth breakdown and check the counts, for example: python ChessPerft.py --depth 4 (add --validate to
+# count through make_move)
+
+import argparse
+import sys
+import time
+
+from ChessBoard import INDEX_TO_SQUARE, SQUARE_MASKS
+from ChessVar import ChessVar
+
+# test positions, each given by the moves leading to it from the starting position
+TEST_POSITIONS = {
+    "start"         : [],
+    "open_center"   : [("e2", "e4"), ("d7", "d5")],
+    "queen_raid"    : [("e2", "e4"), ("e7", "e5"), ("d1", "h5"), ("d8", "h4")],
+    "pawn_exchange" : [("a2", "a4"), ("b7", "b5"), ("a4", "b5"), ("c7", "c6"), ("b5", "c6")],
+    "knight_sortie" : [("g1", "f3"), ("b8", "c6"), ("f3", "e5"), ("c6", "d4"), ("e5", "d7")]
+}
+
+# known-good leaf node counts for each test position, from depth 1 upwards. Every depth was counted independently of
+# this code by the original, list-based ChessVar (before the bitboard board core), trying every source and destination
+# square pair through its make_move at every position of the tree
+KNOWN_COUNTS = {
+    "start"         : [20, 400, 8902, 197742],
+    "open_center"   : [31, 892, 28190, 840960],
+    "queen_raid"    : [37, 1340, 48155, 1731808],
+    "pawn_exchange" : [22, 559, 14309, 394574],
+    "knight_sortie" : [28, 662, 19744, 492124]
+}
+
+
+class MoveRuleMismatch(Exception):
+    """Raised by validated_perft when make_move, is_legal and the move generator disagree about the legal moves of a
+    position. The message gives the moves leading to the position and the moves they disagree on"""
+
+
+def get_test_position(name):
+    """Returns a new ChessVar game set up at the named test position"""
+
+    game = ChessVar()
+    for source_square, destination_square in TEST_POSITIONS[name]:
+        game.make_move(source_square, destination_square)
+
+    return game
+
+
+def perft(game, depth):
+    """Returns the number of leaf positions reached by playing every legal move sequence of exactly depth plies from
+    the game's current position. Finished games have no legal moves, so sequences end when a team wins. The game is
+    returned to its starting position when perft finishes"""
+
+    moves = game.generate_move_indexes()
+    if depth <= 1:
+        if depth == 1:
+            return len(moves)
+        return 1
+
+    nodes = 0
+    for source_index, destination_index in moves:
+        game.execute_move(source_index, destination_index)
+        nodes += perft(game, depth - 1)
+        game.pop()
+
+    return nodes
+
+
+def get_validated_moves(game):
+    """Returns the list of (source index, destination index) moves that make_move accepts in the game's current
+    position, found by trying every source and destination square pair (each accepted move is taken back with pop).
+    Raises MoveRuleMismatch if is_legal disagrees with make_move about any pair, or if the accepted moves are not the
+    moves generate_move_indexes gives. The game must not have a legal move cache, or make_move would only consult it"""
+
+    moves = []
+    for source_index, source_square in enumerate(INDEX_TO_SQUARE):
+        for destination_index, destination_square in enumerate(INDEX_TO_SQUARE):
+            if source_index == destination_index:
+                continue
+
+            legal = game.is_legal(source_square, destination_square)
+            accepted = game.make_move(source_square, destination_square)
+            if accepted:
+                game.pop()
+                moves.append((source_index, destination_index))
+
+            if accepted != legal:
+                raise MoveRuleMismatch("after %s: make_move %s %s%s but is_legal says %s" %
+                                       (format_moves(game), "accepts" if accepted else "rejects", source_square,
+                                        destination_square, legal))
+
+    generated = set(game.generate_move_indexes())
+    if generated != set(moves):
+        raise MoveRuleMismatch("after %s: only make_move accepts %s; only the generator gives %s" %
+                               (format_moves(game), format_index_moves(set(moves) - generated),
+                                format_index_moves(generated - set(moves))))
+
+    return moves
+
+
+def format_moves(game):
+    """Returns the moves made in the game so far as a 'e2e4 e7e5' style string, or 'no moves'"""
+
+    history = game.get_move_history()
+    if history == []:
+        return "no moves"
+
+    return " ".join(source_square + destination_square for source_square, destination_square in history)
+
+
+def format_index_moves(moves):
+    """Returns the passed (source index, destination index) moves as a sorted 'a2a4 b1c3' style string"""
+
+    return " ".join(sorted(INDEX_TO_SQUARE[source_index] + INDEX_TO_SQUARE[destination_index]
+                           for source_index, destination_index in moves)) or "nothing"
+
+
+def validated_perft(game, depth):
+    """Returns the same count as perft, but walks the tree through make_move: the moves of every position are found by
+    get_validated_moves, which cross-checks them against is_legal and the move generator and raises MoveRuleMismatch
+    if they disagree. The game's legal move cache, if any, is set aside while counting. The game is returned to its
+    starting position when validated_perft finishes"""
+
+    def walk(depth):
+        moves = get_validated_moves(game)
+        if depth <= 1:
+            if depth == 1:
+                return len(moves)
+            return 1
+
+        nodes = 0
+        for source_index, destination_index in moves:
+            game.make_move(INDEX_TO_SQUARE[source_index], INDEX_TO_SQUARE[destination_index])
+            nodes += walk(depth - 1)
+            game.pop()
+
+        return nodes
+
+    move_cache = game.get_move_cache()
+    game.set_move_cache(None)
+    try:
+        return walk(depth)
+    finally:
+        game.set_move_cache(move_cache)
+
+
+def perft_breakdown(game, depth):
+    """Walks every legal move sequence up to depth plies from the game's current position and returns a list with one
+    dictionary per depth (index 0 is depth 1). Each dictionary counts the positions reached at that depth ("nodes"),
+    how many of the moves into them were captures ("captures"), and how many of them are games won by white
+    ("white_won") or black ("black_won")"""
+
+    breakdown = [{"nodes": 0, "captures": 0, "white_won": 0, "black_won": 0} for ply in range(depth)]
+
+    def walk(ply):
+        if game.get_turn() == "WHITE":
+            enemy = game.get_team("BLACK").get_occupied()
+        else:
+            enemy = game.get_team("WHITE").get_occupied()
+
+        counts = breakdown[ply]
+        for source_index, destination_index in game.generate_move_indexes():
+            counts["nodes"] += 1
+            if enemy & SQUARE_MASKS[destination_index]:
+                counts["captures"] += 1
+
+            game.execute_move(source_index, destination_index)
+            state = game.get_game_state()
+            if state == "WHITE_WON":
+                counts["white_won"] += 1
+            elif state == "BLACK_WON":
+                counts["black_won"] += 1
+            elif ply + 1 < depth:
+                walk(ply + 1)
+            game.pop()
+
+    walk(0)
+    return breakdown
+
+
+def divide(game, depth):
+    """Returns a dictionary mapping each legal move of the current position, as a 'a2a4' style string, to the number
+    of leaf positions below it at the passed depth. Comparing divide output against a reference is the quickest way
+    to find which move a rule bug is hiding under"""
+
+    counts = {}
+    for source_index, destination_index in game.generate_move_indexes():
+        game.execute_move(source_index, destination_index)
+        counts[INDEX_TO_SQUARE[source_index] + INDEX_TO_SQUARE[destination_index]] = perft(game, depth - 1)
+        game.pop()
+
+    return counts
+
+
+def run_perft(name, depth, validated=False):
+    """Runs perft (or validated_perft, if validated is True) on the named test position at every depth from 1 to the
+    passed depth. Returns a list with one dictionary per depth holding the node count, the time taken, the nodes per
+    second, the known-good count (None if there is none for that depth) and whether the count matched it"""
+
+    game = get_test_position(name)
+    known_counts = KNOWN_COUNTS.get(name, [])
+    results = []
+    count = validated_perft if validated else perft
+
+    for this_depth in range(1, depth + 1):
+        start_time = time.perf_counter()
+        nodes = count(game, this_depth)
+        elapsed = time.perf_counter() - start_time
+
+        expected = None
+        if this_depth <= len(known_counts):
+            expected = known_counts[this_depth - 1]
+
+        nodes_per_second = 0.0
+        if elapsed > 0:
+            nodes_per_second = nodes / elapsed
+
+        results.append({
+            "depth"            : this_depth,
+            "nodes"            : nodes,
+            "time"             : elapsed,
+            "nodes_per_second" : nodes_per_second,
+            "expected"         : expected,
+            "passed"           : expected is None or expected == nodes
+        })
+
+    return results
+
+
+def main(arguments=None):
+    """Command line entry point. Runs perft on the chosen test positions (all of them by default), prints a per-depth
+    table with nodes per second and the check against the known-good counts, and returns 1 if any count is wrong or,
+    with --validate, if make_move and the move generator disagree"""
+
+    parser = argparse.ArgumentParser(description="Count ChessVar move-tree leaf nodes and check them against known-good "
+                                                 "counts.")
+    parser.add_argument("--depth", type=int, default=3, help="deepest depth to count (default 3)")
+    parser.add_argument("--position", action="append", choices=sorted(TEST_POSITIONS),
+                        help="test position to run; may be given more than once (default: all)")
+    parser.add_argument("--breakdown", action="store_true",
+                        help="also print captures and wins for every depth")
+    parser.add_argument("--divide", action="store_true", help="print the node count below each root move")
+    parser.add_argument("--validate", action="store_true",
+                        help="count through make_move instead of the move generator, cross-checking the two")
+    options = parser.parse_args(arguments)
+
+    failed = False
+    for name in options.position or list(TEST_POSITIONS):
+        print("position %s" % name)
+        try:
+            results = run_perft(name, options.depth, options.validate)
+        except MoveRuleMismatch as mismatch:
+            print("  FAILED: %s" % mismatch)
+            failed = True
+            continue
+
+        for result in results:
+            if result["expected"] is None:
+                check = "unchecked"
+            elif result["passed"]:
+                check = "ok"
+            else:
+                check = "FAILED (expected %d)" % result["expected"]
+                failed = True
+            print("  depth %2d  nodes %12d  time %8.3fs  %12.0f nodes/s  %s" % (result["depth"], result["nodes"],
+                  result["time"], result["nodes_per_second"], check))
+
+        if options.breakdown:
+            for ply, counts in enumerate(perft_breakdown(get_test_position(name), options.depth)):
+                print("  ply %2d  nodes %12d  captures %10d  white_won %8d  black_won %8d" % (ply + 1,
+                      counts["nodes"], counts["captures"], counts["white_won"], counts["black_won"]))
+
+        if options.divide:
+            for move, nodes in sorted(divide(get_test_position(name), options.depth).items()):
+                print("  %s %d" % (move, nodes))
+
+    if failed:
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Background analysis and pondering for interactive ChessVar play. An AnalysisSession searches a position
+# with ChessSearch on a worker thread while the caller goes on waiting for input, so the time the opponent spends
+# thinking is not wasted. The worker searches its own copy of the game, never the caller's, and reports the best move,
+# score and principal variation after every finished iteration. Updates are put on a queue, and also passed to an
+# optional listener, so a service can stream them to its clients. After the engine has moved, ponder starts
+# searching the position after the reply the engine expects (the second move of its principal variation). When the
+# opponent's move arrives, opponent_moved compares the new position with the pondered one. If the expected reply
+# was played (a ponder hit), the search keeps running, with the time limit of the reply counted from the hit, and
+# everything it has done already counts. Any other reply (a ponder miss) cancels the search and starts a new one on
+# the real position. Cancelling calls ChessSearch.stop, which
+# makes the worker give up at the very next node it visits, so a cancel takes about a millisecond. Every search of a
+# session shares one transposition table, so even a cancelled search leaves entries that help the next one.
+
+import queue
+import threading
+import time
+
+from ChessBoard import SQUARE_TO_INDEX
+from ChessSearch import ChessSearch, MAX_DEPTH
+from TranspositionTable import TranspositionTable
+
+
+class AnalysisSession:
+    """The AnalysisSession class runs one background search at a time on a worker thread. Its data members are the
+    transposition table shared by all of its searches, the depth limit, the optional listener, the queue of updates,
+    the lock guarding the current search, and the current search's worker thread, ChessSearch, stop event, position
+    hash, whether it is pondering, and latest update"""
+
+    def __init__(self, transposition_table=None, max_depth=MAX_DEPTH, listener=None):
+        """Receives the TranspositionTable to share between searches (a new 16 MB table if None), the depth at which a
+        search ends on its own, and an optional listener that is called on the worker thread with every update"""
+
+        if transposition_table is None:
+            transposition_table = TranspositionTable()
+
+        self._table = transposition_table
+        self._max_depth = max_depth
+        self._listener = listener
+        self._updates = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._search = None
+        self._stop_event = None
+        self._position_hash = None
+        self._pondering = False
+        self._latest = None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+
+    def get_transposition_table(self):
+        """Returns the TranspositionTable shared by this session's searches"""
+
+        return self._table
+
+
+    def is_running(self):
+        """Returns True while a search is running on the worker thread"""
+
+        return self._thread is not None and self._thread.is_alive()
+
+
+    def is_pondering(self):
+        """Returns True if the current search is of a position the opponent has not played into yet"""
+
+        return self._pondering
+
+
+    def get_latest(self):
+        """Returns the most recent update of the current search, or None if it has not finished an iteration yet"""
+
+        return self._latest
+
+
+    def get_update(self, timeout=None):
+        """Returns the next update from the queue, waiting up to timeout seconds (forever if None), or None if there
+        was none in time. Each update is a ChessSearch result dictionary with the position's "hash", whether the search
+        was "pondering", and whether it is the "final" result of a search that ran to its end"""
+
+        try:
+            return self._updates.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+    def analyse(self, game, time_limit=None):
+        """Cancels any running search and starts searching the passed ChessVar game's current position in the
+        background, until max_depth is reached, time_limit seconds have passed, or it is cancelled. Returns at once"""
+
+        self.cancel()
+        analysed_game = game.copy()
+        analysed_game.set_move_cache(None)
+        self.start_search(analysed_game, False, time_limit)
+
+
+    def ponder(self, game, expected_reply=None):
+        """Cancels any running search and starts searching the position after the opponent's expected reply in the
+        passed game (the engine has just moved, so it is the opponent's turn). expected_reply is a (source square,
+        destination square) pair; if it is None, the second move of the latest principal variation is used. Returns the
+        reply being pondered, or None (and searches nothing) if there is no expected reply or it is not legal"""
+
+        if expected_reply is None and self._latest is not None:
+            principal_variation = self._latest["principal_variation"]
+            if len(principal_variation) >= 2:
+                expected_reply = principal_variation[1]
+
+        self.cancel()
+        if expected_reply is None or game.is_legal(expected_reply[0], expected_reply[1]) == False:
+            return None
+
+        pondered_game = game.copy()
+        pondered_game.set_move_cache(None)
+        pondered_game.execute_move(SQUARE_TO_INDEX[expected_reply[0]], SQUARE_TO_INDEX[expected_reply[1]])
+        if pondered_game.get_game_state() != "UNFINISHED":
+            return None
+
+        self.start_search(pondered_game, True, None)
+        return expected_reply
+
+
+    def opponent_moved(self, game, time_limit=None):
+        """Tells the session that the opponent's move has been made on the passed game. On a ponder hit (the game is
+        now in the position being pondered) the running search carries on as an ordinary analysis, ending time_limit
+        seconds from now (or at max_depth if time_limit is None), and True is returned. Otherwise the search is
+        cancelled, a new one of time_limit seconds is started on the game's position (unless the game is over), and
+        False is returned"""
+
+        with self._lock:
+            hit = self._pondering and self._position_hash == game.get_hash() and self._search is not None
+            if hit:
+                self._pondering = False
+                if time_limit is not None:
+                    self._search.set_deadline(time_limit)
+
+        if hit:
+            return True
+
+        self.cancel()
+        if game.get_game_state() == "UNFINISHED":
+            self.analyse(game, time_limit)
+
+        return False
+
+
+    def start_search(self, game, pondering, time_limit):
+        """Starts a ChessSearch of the passed game (which the worker thread takes over) on a new worker thread"""
+
+        with self._lock:
+            self._search = ChessSearch(game, self._table)
+            self._stop_event = threading.Event()
+            self._position_hash = game.get_hash()
+            self._pondering = pondering
+            self._latest = None
+            self._thread = threading.Thread(target=self.run_search,
+                                            args=(self._search, self._stop_event, self._position_hash, time_limit),
+                                            daemon=True)
+            self._thread.start()
+
+
+    def run_search(self, search, stop_event, position_hash, time_limit):
+        """Worker thread entry point. Runs the search, publishing an update after every finished iteration, and a
+        final update when it ends without being cancelled"""
+
+        def publish(result, final):
+            if stop_event.is_set():
+                return
+            update = dict(result)
+            update["hash"] = position_hash
+            update["pondering"] = self._pondering
+            update["final"] = final
+            self._latest = update
+            self._updates.put(update)
+            if self._listener is not None:
+                self._listener(update)
+
+        result = search.search(self._max_depth, time_limit, callback=lambda result: publish(result, False),
+                               stop_event=stop_event)
+        publish(result, True)
+
+
+    def cancel(self):
+        """Stops the running search, if any, and waits for the worker thread to finish. Updates of a cancelled search
+        stop at once. Returns the number of seconds the worker took to stop (0.0 if nothing was running)"""
+
+        with self._lock:
+            thread, search, stop_event = self._thread, self._search, self._stop_event
+            self._thread = None
+            self._search = None
+            self._pondering = False
+
+        if thread is None:
+            return 0.0
+
+        start_time = time.perf_counter()
+        stop_event.set()
+        search.stop()
+        thread.join()
+
+        return time.perf_counter() - start_time
+
+
+    def wait(self, timeout=None):
+        """Waits up to timeout seconds (forever if None) for the running search to end by itself, and returns the
+        latest update"""
+
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+        return self._latest
+
+
+    def close(self):
+        """Cancels any running search"""
+
+        self.cancel()
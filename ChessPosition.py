@@ -0,0 +1,108 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: An immutable, hashable snapshot of a ChessVar position. A Position holds one snapshot per team, whose
+# turn it is, the game state and the Zobrist hash. A team snapshot is a pair of 16 item tuples, the square index of
+# each piece (None once it has been captured) and its number of moves, in ChessTeam piece order. ChessVar.get_position
+# exports the current position and ChessVar.set_position (or ChessVar(position)) sets a game up from one, without
+# parsing any square strings. Each ChessTeam keeps its last snapshot until one of its pieces moves or is captured, so
+# positions taken along a line of play share the snapshot of every team that has not changed, instead of copying it.
+# Positions are compared by value and hash by their Zobrist hash, so they can be used as dictionary keys and set
+# members, and they are cheap to keep around in large numbers.
+
+from ChessBoard import INDEX_TO_SQUARE
+
+
+class Position:
+    """The Position class is an immutable snapshot of a ChessVar position. Its data members are the white and black
+    team snapshots (pairs of square index and move count tuples), whose turn it is, the game state, and the Zobrist
+    hash of the position. Its data members cannot be changed once the Position has been made"""
+
+    __slots__ = ("_white", "_black", "_turn", "_game_state", "_hash")
+
+    def __init__(self, white, black, turn, game_state, position_hash):
+        """Receives the white and black team snapshots, the turn (WHITE or BLACK), the game state and the Zobrist hash.
+        Use ChessVar.get_position rather than building one by hand"""
+
+        object.__setattr__(self, "_white", white)
+        object.__setattr__(self, "_black", black)
+        object.__setattr__(self, "_turn", turn)
+        object.__setattr__(self, "_game_state", game_state)
+        object.__setattr__(self, "_hash", position_hash)
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Position objects cannot be changed")
+
+
+    def __delattr__(self, name):
+        raise AttributeError("Position objects cannot be changed")
+
+
+    def __reduce__(self):
+        return (Position, (self._white, self._black, self._turn, self._game_state, self._hash))
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+    def __hash__(self):
+        return self._hash
+
+
+    def __eq__(self, other):
+        if not isinstance(other, Position):
+            return NotImplemented
+
+        return (self._hash == other._hash and self._turn == other._turn and self._game_state == other._game_state
+                and self._white == other._white and self._black == other._black)
+
+
+    def __repr__(self):
+        return "Position(turn=%s, game_state=%s, hash=%016x)" % (self._turn, self._game_state, self._hash)
+
+
+    def get_team_snapshot(self, team_color):
+        """Returns the (square indexes, move counts) snapshot of the passed team (WHITE or BLACK)"""
+
+        if team_color == "WHITE":
+            return self._white
+
+        return self._black
+
+
+    def get_squares(self, team_color):
+        """Returns a list of the 16 squares (eg. 'a2', or CAPTURED) of the passed team's pieces, in ChessTeam piece
+        order, in the form ChessVar.load_position accepts"""
+
+        return ["CAPTURED" if index is None else INDEX_TO_SQUARE[index]
+                for index in self.get_team_snapshot(team_color)[0]]
+
+
+    def get_moves(self, team_color):
+        """Returns a list of the 16 move counts of the passed team's pieces, in ChessTeam piece order"""
+
+        return list(self.get_team_snapshot(team_color)[1])
+
+
+    def get_turn(self):
+        """Returns whose turn it is, WHITE or BLACK"""
+
+        return self._turn
+
+
+    def get_game_state(self):
+        """Returns the game state: UNFINISHED, WHITE_WON, BLACK_WON or DRAW"""
+
+        return self._game_state
+
+
+    def get_hash(self):
+        """Returns the Zobrist hash of the position"""
+
+        return self._hash
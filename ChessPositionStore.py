@@ -0,0 +1,344 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Compact binary encoding of ChessVar positions, and an on-disk store of encoded positions. A position
+# is encoded in POSITION_BYTES (35) bytes: one byte per piece giving its square index (255 if it has been captured)
+# for white's 16 pieces and then black's, in ChessTeam piece order; one byte holding whose turn it is and the game
+# state; and two bytes with one "has moved" bit per pawn (only pawns need it, since it decides whether a pawn may move
+# two squares forward). Move counts of other pieces are not kept. The PositionStore keeps such positions in an
+# append-only file of fixed-size records, each holding the position's Zobrist hash, the encoded position, and an
+# analysis score and depth. The file is memory-mapped, so any record can be read by number without loading the rest,
+# and a second memory-mapped file holds an open-addressing hash index from Zobrist hash to record numbers, so that a
+# position can be looked up without scanning the store. Neither file is ever read into Python objects as a whole.
+# The record count and the index's entry count are written to the file headers on every append, so a store that was
+# not closed properly loses at most the record being appended, and an index that does not match the records it
+# covers is rebuilt from them when the store is opened.
+
+import mmap
+import os
+import struct
+
+from ChessBoard import INDEX_TO_SQUARE, SQUARE_TO_INDEX
+from ChessVar import ChessVar
+
+POSITION_BYTES = 35
+
+CAPTURED_INDEX = 255
+
+GAME_STATES = ("UNFINISHED", "WHITE_WON", "BLACK_WON", "DRAW")
+
+# record: Zobrist hash, encoded position, search depth, score
+RECORD_FORMAT = struct.Struct("<Q35sHi")
+RECORD_BYTES = RECORD_FORMAT.size
+
+# header of the records file: magic, version, record size, number of records
+STORE_HEADER = struct.Struct("<4sHHQ")
+STORE_MAGIC = b"CVPS"
+
+# header of the index file: magic, version, number of slots, number of used slots; each slot is (hash, record + 1)
+INDEX_HEADER = struct.Struct("<4sHHQQ")
+INDEX_MAGIC = b"CVPI"
+INDEX_SLOT = struct.Struct("<QQ")
+
+VERSION = 2
+
+
+def encode_position(game):
+    """Returns the POSITION_BYTES byte encoding of the passed ChessVar game's current position"""
+
+    squares = bytearray()
+    moved_bits = 0
+    pawn_number = 0
+
+    for team_color in ("WHITE", "BLACK"):
+        team = game.get_team(team_color)
+        for piece_name in team.get_piece_names():
+            square = team.get_piece_location(piece_name)
+            if square == "CAPTURED":
+                squares.append(CAPTURED_INDEX)
+            else:
+                squares.append(SQUARE_TO_INDEX[square])
+
+            if team.get_piece_type(piece_name) == "pawn":
+                if team.get_piece_moves(piece_name) > 0:
+                    moved_bits |= 1 << pawn_number
+                pawn_number += 1
+
+    flags = GAME_STATES.index(game.get_game_state()) << 1
+    if game.get_turn() == "BLACK":
+        flags |= 1
+
+    return bytes(squares) + struct.pack("<BH", flags, moved_bits)
+
+
+def decode_position(data, game=None):
+    """Sets up the position encoded in the passed bytes on the passed ChessVar game (or on a new one) and returns the
+    game. Pawns marked as moved are given one move; every other piece is given zero moves"""
+
+    if game is None:
+        game = ChessVar()
+
+    flags, moved_bits = struct.unpack_from("<BH", data, 32)
+    squares = []
+    moves = []
+    pawn_number = 0
+
+    for piece_number in range(32):
+        if data[piece_number] == CAPTURED_INDEX:
+            squares.append("CAPTURED")
+        else:
+            squares.append(INDEX_TO_SQUARE[data[piece_number]])
+
+        # the first 8 pieces of each team are its pawns
+        if piece_number % 16 < 8:
+            moves.append((moved_bits >> pawn_number) & 1)
+            pawn_number += 1
+        else:
+            moves.append(0)
+
+    turn = "BLACK" if flags & 1 else "WHITE"
+    game.load_position(squares[:16], squares[16:], turn, GAME_STATES[flags >> 1], moves[:16], moves[16:])
+
+    return game
+
+
+class PositionStore:
+    """The PositionStore class is an append-only, memory-mapped store of encoded positions with a hash index. Its data
+    members are the open records file and its memory map, the open index file and its memory map, and the record and
+    index slot counts. Records are numbered from 0 in the order they are appended. Use it as a context manager, or call
+    close when done, so that both files are flushed to disk"""
+
+    def __init__(self, path, initial_capacity=1024):
+        """Opens the store at the passed path, creating it if it does not exist. The records are kept in the file at
+        path and the hash index in path + '.index'. Both files grow as needed, starting with room for
+        initial_capacity records"""
+
+        self._path = path
+        self._index_path = path + ".index"
+
+        if os.path.exists(path) == False:
+            with open(path, "wb") as new_file:
+                new_file.write(STORE_HEADER.pack(STORE_MAGIC, VERSION, RECORD_BYTES, 0))
+                new_file.truncate(STORE_HEADER.size + initial_capacity * RECORD_BYTES)
+
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, version, record_bytes, self._count = STORE_HEADER.unpack_from(self._map, 0)
+        if magic != STORE_MAGIC:
+            raise ValueError("%s is not a position store" % path)
+        if version != VERSION or record_bytes != RECORD_BYTES:
+            raise ValueError("%s was written by another version of the position store" % path)
+
+        if os.path.exists(self._index_path) == False:
+            self.create_index(max(16, initial_capacity * 2))
+        self._index_file = open(self._index_path, "r+b")
+        self._index_map = mmap.mmap(self._index_file.fileno(), 0)
+        magic, version, slot_bytes, self._slots, self._used_slots = INDEX_HEADER.unpack_from(self._index_map, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError("%s is not a position store index" % self._index_path)
+
+        # every record has exactly one index entry, so any other number of entries means the store was not closed
+        # properly while a record was being appended or the index was growing
+        if version != VERSION or self._used_slots != self._count:
+            self.rebuild_index()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+
+    def __len__(self):
+        """Returns the number of records in the store"""
+
+        return self._count
+
+
+    def create_index(self, slots):
+        """Creates an empty index file with the passed number of slots (a power of two)"""
+
+        size = 1
+        while size < slots:
+            size *= 2
+
+        with open(self._index_path, "wb") as index_file:
+            index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, VERSION, INDEX_SLOT.size, size, 0))
+            index_file.truncate(INDEX_HEADER.size + size * INDEX_SLOT.size)
+
+
+    def rebuild_index(self):
+        """Replaces the index with a new one holding an entry for every record in the store"""
+
+        self._index_map.close()
+        self._index_file.close()
+
+        self.create_index(max(16, self._count * 2))
+        self._index_file = open(self._index_path, "r+b")
+        self._index_map = mmap.mmap(self._index_file.fileno(), 0)
+        self._slots = INDEX_HEADER.unpack_from(self._index_map, 0)[3]
+        self._used_slots = 0
+        for record_number in range(self._count):
+            self.add_to_index(RECORD_FORMAT.unpack_from(self._map, STORE_HEADER.size + record_number *
+                                                        RECORD_BYTES)[0], record_number)
+
+
+    def get_record_capacity(self):
+        """Returns how many records fit in the records file before it has to grow"""
+
+        return (len(self._map) - STORE_HEADER.size) // RECORD_BYTES
+
+
+    def grow_records(self):
+        """Doubles the size of the records file and maps it again"""
+
+        new_size = STORE_HEADER.size + max(1, self.get_record_capacity()) * 2 * RECORD_BYTES
+        self._map.close()
+        self._file.truncate(new_size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+
+    def add_to_index(self, position_hash, record_number):
+        """Adds the passed hash and record number to the index, using linear probing from the hash's home slot. The
+        index is rebuilt twice as large once it is more than 70% full"""
+
+        if (self._used_slots + 1) * 10 > self._slots * 7:
+            self.grow_index()
+
+        slot = position_hash & (self._slots - 1)
+        while True:
+            offset = INDEX_HEADER.size + slot * INDEX_SLOT.size
+            if INDEX_SLOT.unpack_from(self._index_map, offset)[1] == 0:
+                INDEX_SLOT.pack_into(self._index_map, offset, position_hash, record_number + 1)
+                self._used_slots += 1
+                self.write_index_header()
+                return
+            slot = (slot + 1) & (self._slots - 1)
+
+
+    def grow_index(self):
+        """Rebuilds the index with twice as many slots, re-inserting every entry of the old index"""
+
+        old_map = self._index_map
+        old_slots = self._slots
+        entries = []
+        for slot in range(old_slots):
+            position_hash, stored = INDEX_SLOT.unpack_from(old_map, INDEX_HEADER.size + slot * INDEX_SLOT.size)
+            if stored != 0:
+                entries.append((position_hash, stored - 1))
+        old_map.close()
+        self._index_file.close()
+
+        self.create_index(old_slots * 2)
+        self._index_file = open(self._index_path, "r+b")
+        self._index_map = mmap.mmap(self._index_file.fileno(), 0)
+        self._slots = old_slots * 2
+        self._used_slots = 0
+        for position_hash, record_number in entries:
+            self.add_to_index(position_hash, record_number)
+
+
+    def append(self, game, score=0, depth=0):
+        """Appends the passed ChessVar game's current position to the store, along with an analysis score and search
+        depth, and returns its record number"""
+
+        return self.append_encoded(game.get_hash(), encode_position(game), score, depth)
+
+
+    def append_encoded(self, position_hash, position_data, score=0, depth=0):
+        """Appends an already encoded position with its Zobrist hash, score and depth, and returns its record number"""
+
+        if self._count >= self.get_record_capacity():
+            self.grow_records()
+
+        # the record is written before the count that makes it part of the store, and the count before the index
+        # entry that points to it
+        record_number = self._count
+        RECORD_FORMAT.pack_into(self._map, STORE_HEADER.size + record_number * RECORD_BYTES, position_hash,
+                                position_data, depth, score)
+        self._count += 1
+        self.write_store_header()
+        self.add_to_index(position_hash, record_number)
+
+        return record_number
+
+
+    def get_record(self, record_number):
+        """Returns the (hash, encoded position, depth, score) tuple of the passed record number, read straight from the
+        memory map"""
+
+        if record_number < 0 or record_number >= self._count:
+            raise IndexError("record %d is not in the store" % record_number)
+
+        return RECORD_FORMAT.unpack_from(self._map, STORE_HEADER.size + record_number * RECORD_BYTES)
+
+
+    def get_game(self, record_number):
+        """Returns a new ChessVar game set up at the position of the passed record number"""
+
+        return decode_position(self.get_record(record_number)[1])
+
+
+    def find(self, position_hash):
+        """Returns a list of the record numbers whose position has the passed Zobrist hash, in the order they were
+        appended"""
+
+        record_numbers = []
+        slot = position_hash & (self._slots - 1)
+        while True:
+            stored_hash, stored = INDEX_SLOT.unpack_from(self._index_map, INDEX_HEADER.size + slot * INDEX_SLOT.size)
+            if stored == 0:
+                break
+            if stored_hash == position_hash and stored <= self._count:
+                record_numbers.append(stored - 1)
+            slot = (slot + 1) & (self._slots - 1)
+
+        record_numbers.sort()
+        return record_numbers
+
+
+    def lookup(self, game):
+        """Returns a list of the record numbers that hold exactly the passed game's current position (the hash is
+        checked in the index and the encoded position is compared to rule out hash collisions)"""
+
+        position_data = encode_position(game)
+
+        return [record_number for record_number in self.find(game.get_hash())
+                if self.get_record(record_number)[1] == position_data]
+
+
+    def write_store_header(self):
+        """Writes the record count to the records file header"""
+
+        STORE_HEADER.pack_into(self._map, 0, STORE_MAGIC, VERSION, RECORD_BYTES, self._count)
+
+
+    def write_index_header(self):
+        """Writes the slot and entry counts to the index file header"""
+
+        INDEX_HEADER.pack_into(self._index_map, 0, INDEX_MAGIC, VERSION, INDEX_SLOT.size, self._slots,
+                               self._used_slots)
+
+
+    def flush(self):
+        """Writes the record and index counts to the file headers and flushes both memory maps to disk"""
+
+        self.write_store_header()
+        self.write_index_header()
+        self._map.flush()
+        self._index_map.flush()
+
+
+    def close(self):
+        """Flushes and closes the store"""
+
+        if self._map.closed:
+            return
+
+        self.flush()
+        self._map.close()
+        self._file.close()
+        self._index_map.close()
+        self._index_file.close()
@@ -0,0 +1,343 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: A forced-win solver for ChessVar based on depth-first proof-number search (df-pn). Because this variant
+# is won by capturing the last piece of any type, many positions hold short forced wins, and a solver that only asks
+# "can the side to move force a win within N plies?" finds them far faster than an alpha-beta search to the same depth.
+# The solver works on an AND/OR tree: at OR nodes the attacker (the side to move at the start) needs one winning move,
+# and at AND nodes every move of the defender must lose. Each node has a proof number (how many leaves still have to
+# be proven to prove it) and a disproof number, and the search always works on the most proving node, going depth
+# first with thresholds so that it only climbs back up when the numbers of a node have grown past what its parent
+# allows. A position is proven as soon as a move wins, and disproven when N plies pass without a win or the team to
+# move is stuck. Numbers are kept in a proof table keyed by position hash and plies remaining. Finished results are
+# kept in two more dictionaries, as the fewest plies a position has been proven in and the most it has been disproven
+# in, so that a proof within n plies also answers every question about more plies, and a disproof every question about
+# fewer. The tables are kept between queries, so asking about the same or related positions again is faster. Each
+# query runs within an optional node and time budget, and returns the winning line when it proves the win. Run this
+# file to solve a position from the command line, for example: python ChessProof.py --plies 5 --moves e2e4 d7d5
+
+import argparse
+import json
+import sys
+import time
+
+from ChessBoard import INDEX_TO_SQUARE
+from ChessSearch import SearchStopped
+from ChessVar import ChessVar
+
+# proof and disproof numbers never go above this, which stands for infinity
+INFINITY = 10 ** 9
+
+# largest number of positions kept in the proof table before it is cleared
+DEFAULT_MAX_ENTRIES = 1000000
+
+# nodes between time limit checks
+CHECK_INTERVAL = 1024
+
+TEAM_COLORS = ("WHITE", "BLACK")
+
+
+class ProofSolver:
+    """The ProofSolver class proves or disproves forced wins with df-pn. Its data members are, for each attacking team,
+    the proof table of unfinished (proof number, disproof number) pairs keyed by (position hash, plies remaining), the
+    dictionary of the fewest plies each position has been proven in and the dictionary of the most plies each position
+    has been disproven in; the largest number of proof table entries; and the node counter, limits and attacking team
+    of the query currently running"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        """Receives the largest number of proof table entries to keep. Finished results are kept for as long as the
+        solver is used, unless clear is called"""
+
+        self._max_entries = max_entries
+        self._tables = {team_color: {} for team_color in TEAM_COLORS}
+        self._proven = {team_color: {} for team_color in TEAM_COLORS}
+        self._disproven = {team_color: {} for team_color in TEAM_COLORS}
+        self._nodes = 0
+        self._node_limit = None
+        self._deadline = None
+        self._next_check = CHECK_INTERVAL
+        self._attacker = "WHITE"
+
+
+    def clear(self):
+        """Empties the proof table and forgets every finished result"""
+
+        for team_color in TEAM_COLORS:
+            self._tables[team_color].clear()
+            self._proven[team_color].clear()
+            self._disproven[team_color].clear()
+
+
+    def get_statistics(self):
+        """Returns a dictionary with the number of proof table entries and of proven and disproven positions kept"""
+
+        return {
+            "entries"     : sum(len(table) for table in self._tables.values()),
+            "proven"      : sum(len(proven) for proven in self._proven.values()),
+            "disproven"   : sum(len(disproven) for disproven in self._disproven.values()),
+            "max_entries" : self._max_entries
+        }
+
+
+    def count_node(self):
+        """Counts one node and every CHECK_INTERVAL nodes checks the limits of the query. Raises SearchStopped if the
+        node or time budget has run out"""
+
+        if self._node_limit is not None and self._nodes >= self._node_limit:
+            raise SearchStopped()
+        self._nodes += 1
+
+        if self._nodes >= self._next_check:
+            self._next_check = self._nodes + CHECK_INTERVAL
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                raise SearchStopped()
+
+
+    def look_up(self, position_hash, remaining):
+        """Returns the (proof number, disproof number) pair of the position with the passed hash and plies remaining,
+        for the current attacker. A position not in the tables starts at (1, 1)"""
+
+        proven_plies = self._proven[self._attacker].get(position_hash)
+        if proven_plies is not None and proven_plies <= remaining:
+            return (0, INFINITY)
+
+        disproven_plies = self._disproven[self._attacker].get(position_hash)
+        if disproven_plies is not None and disproven_plies >= remaining:
+            return (INFINITY, 0)
+
+        return self._tables[self._attacker].get((position_hash, remaining), (1, 1))
+
+
+    def store(self, position_hash, remaining, proof_number, disproof_number):
+        """Records the numbers of the position with the passed hash and plies remaining. A finished result moves the
+        position from the proof table to the proven or disproven dictionary"""
+
+        table = self._tables[self._attacker]
+
+        if proof_number == 0:
+            proven = self._proven[self._attacker]
+            if position_hash not in proven or remaining < proven[position_hash]:
+                proven[position_hash] = remaining
+            table.pop((position_hash, remaining), None)
+
+        elif disproof_number == 0:
+            disproven = self._disproven[self._attacker]
+            if position_hash not in disproven or remaining > disproven[position_hash]:
+                disproven[position_hash] = remaining
+            table.pop((position_hash, remaining), None)
+
+        else:
+            if len(table) >= self._max_entries:
+                table.clear()
+            table[(position_hash, remaining)] = (proof_number, disproof_number)
+
+
+    def get_children(self, game, remaining):
+        """Returns a list with one [move, hash, numbers] entry per legal move of the game's current position, where
+        numbers is the fixed (proof number, disproof number) pair of a move that ends the search (it wins, or it uses
+        up the last ply without winning) and None for any other move"""
+
+        children = []
+        for move in game.generate_move_indexes():
+            game.execute_move(move[0], move[1])
+            game_state = game.get_game_state()
+            if game_state != "UNFINISHED":
+                numbers = (0, INFINITY) if game_state == self._attacker + "_WON" else (INFINITY, 0)
+            elif remaining == 1:
+                numbers = (INFINITY, 0)
+            else:
+                numbers = None
+            children.append([move, game.get_hash(), numbers])
+            game.pop()
+
+        return children
+
+
+    def search_node(self, game, remaining, proof_threshold, disproof_threshold):
+        """The df-pn search of the game's current position with the passed plies remaining. Expands the most proving
+        child again and again until the node is proven or disproven or one of its numbers reaches its threshold, then
+        stores the node's numbers and returns them"""
+
+        self.count_node()
+        position_hash = game.get_hash()
+        children = self.get_children(game, remaining)
+        or_node = game.get_turn() == self._attacker
+
+        if children == []:
+            self.store(position_hash, remaining, INFINITY, 0)       # the team to move is stuck: no win
+            return (INFINITY, 0)
+
+        while True:
+            best = None
+            best_numbers = None
+            second = INFINITY
+            proof_number = INFINITY if or_node else 0
+            disproof_number = 0 if or_node else INFINITY
+
+            for child in children:
+                numbers = child[2] if child[2] is not None else self.look_up(child[1], remaining - 1)
+                if or_node:
+                    disproof_number = min(disproof_number + numbers[1], INFINITY)
+                    key = numbers[0]
+                    if key < proof_number:
+                        second = proof_number
+                        proof_number = key
+                        best, best_numbers = child, numbers
+                    elif key < second:
+                        second = key
+                else:
+                    proof_number = min(proof_number + numbers[0], INFINITY)
+                    key = numbers[1]
+                    if key < disproof_number:
+                        second = disproof_number
+                        disproof_number = key
+                        best, best_numbers = child, numbers
+                    elif key < second:
+                        second = key
+
+            if best is None:
+                best, best_numbers = children[0], (INFINITY, INFINITY)
+
+            if proof_number >= proof_threshold or disproof_number >= disproof_threshold:
+                self.store(position_hash, remaining, proof_number, disproof_number)
+                return (proof_number, disproof_number)
+
+            if or_node:
+                child_proof_threshold = min(proof_threshold, second + 1)
+                child_disproof_threshold = min(disproof_threshold - disproof_number + best_numbers[1], INFINITY)
+            else:
+                child_proof_threshold = min(proof_threshold - proof_number + best_numbers[0], INFINITY)
+                child_disproof_threshold = min(disproof_threshold, second + 1)
+
+            game.execute_move(best[0][0], best[0][1])
+            try:
+                self.search_node(game, remaining - 1, child_proof_threshold, child_disproof_threshold)
+            finally:
+                game.pop()
+
+
+    def get_proof_plies(self, game, remaining):
+        """Returns the fewest plies within which the game's current position is known to be a win for the attacker, 0
+        if the move that led to it won, or None if it has not been proven within the passed plies remaining"""
+
+        if game.get_game_state() == self._attacker + "_WON":
+            return 0
+
+        proven_plies = self._proven[self._attacker].get(game.get_hash())
+        if proven_plies is not None and proven_plies <= remaining:
+            return proven_plies
+
+        return None
+
+
+    def get_winning_line(self, game, remaining):
+        """Returns the winning line of a proven position as a list of (source square, destination square) pairs. The
+        attacker plays the move proven to win in the fewest plies, and the defender the move that holds out longest"""
+
+        line = []
+        played = 0
+
+        while game.get_game_state() == "UNFINISHED" and remaining > 0:
+            or_node = game.get_turn() == self._attacker
+            best_move = None
+            best_plies = None
+
+            for move in game.generate_move_indexes():
+                game.execute_move(move[0], move[1])
+                plies = self.get_proof_plies(game, remaining - 1)
+                game.pop()
+                if plies is None:
+                    continue
+                if best_plies is None or (or_node and plies < best_plies) or (not or_node and plies > best_plies):
+                    best_move, best_plies = move, plies
+
+            if best_move is None:
+                break
+
+            game.execute_move(best_move[0], best_move[1])
+            played += 1
+            line.append((INDEX_TO_SQUARE[best_move[0]], INDEX_TO_SQUARE[best_move[1]]))
+            remaining -= 1
+
+        for ply in range(played):
+            game.pop()
+
+        return line
+
+
+    def solve(self, game, max_plies, node_limit=None, time_limit=None):
+        """Proves or disproves that the team to move in the passed ChessVar game can force a win within max_plies
+        plies, within an optional node and time budget. The game is left as it was. Returns a dictionary with the
+        result ("proven", "disproven", or "unknown" if the budget ran out), the winning line when proven (a list of
+        (source square, destination square) pairs), the root proof and disproof numbers, the nodes searched and the
+        time taken in seconds"""
+
+        start_time = time.perf_counter()
+        self._attacker = game.get_turn()
+        self._nodes = 0
+        self._node_limit = node_limit
+        self._deadline = start_time + time_limit if time_limit is not None else None
+        self._next_check = CHECK_INTERVAL
+
+        # finished results are only dropped between queries, so that the winning line can always be read back
+        if len(self._proven[self._attacker]) + len(self._disproven[self._attacker]) >= self._max_entries:
+            self._proven[self._attacker].clear()
+            self._disproven[self._attacker].clear()
+
+        result = {
+            "result"          : "unknown",
+            "line"            : [],
+            "proof_number"    : 1,
+            "disproof_number" : 1,
+            "nodes"           : 0,
+            "time"            : 0.0
+        }
+
+        if game.get_game_state() != "UNFINISHED" or max_plies < 1:
+            numbers = (INFINITY, 0)
+        else:
+            numbers = self.look_up(game.get_hash(), max_plies)
+            if numbers[0] != 0 and numbers[1] != 0:
+                try:
+                    numbers = self.search_node(game, max_plies, INFINITY, INFINITY)
+                except SearchStopped:
+                    numbers = self.look_up(game.get_hash(), max_plies)
+
+        result["proof_number"], result["disproof_number"] = numbers
+        if numbers[0] == 0:
+            result["result"] = "proven"
+            result["line"] = self.get_winning_line(game, max_plies)
+        elif numbers[1] == 0:
+            result["result"] = "disproven"
+
+        result["nodes"] = self._nodes
+        result["time"] = time.perf_counter() - start_time
+
+        return result
+
+
+def main(arguments=None):
+    """Command line entry point. Plays the passed moves from the starting position, then proves or disproves a forced
+    win for the team to move and prints the result as JSON"""
+
+    parser = argparse.ArgumentParser(description="Prove or disprove that the side to move in a ChessVar position can "
+                                                 "force a win within a number of plies.")
+    parser.add_argument("--plies", type=int, default=5, help="plies within which the win must come (default 5)")
+    parser.add_argument("--nodes", type=int, default=None, help="node budget (default: none)")
+    parser.add_argument("--time", type=float, default=None, help="time budget in seconds (default: none)")
+    parser.add_argument("--moves", nargs="*", default=[], help="moves to play first, such as e2e4 e7e5")
+    options = parser.parse_args(arguments)
+
+    game = ChessVar()
+    for move in options.moves:
+        if game.make_move(move[:2], move[2:]) == False:
+            parser.error("illegal move %s" % move)
+
+    result = ProofSolver().solve(game, options.plies, options.nodes, options.time)
+    print(json.dumps(result))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
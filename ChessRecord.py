@@ -0,0 +1,354 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: A game-record format for ChessVar with a streaming reader and writer, so archives of any size can be
+# written and read one game at a time. A record is a block of header lines in the form [Name "Value"], a blank line,
+# the moves, and then the result, which is a game state: WHITE_WON, BLACK_WON, DRAW or UNFINISHED. Moves are written as a
+# source square and a destination square run together, and each white move is numbered. Records are separated by a
+# blank line, and lines starting with % are comments. For example:
+#
+#   [Event "Club night"]
+#   [White "Ada"]
+#   [Black "Grace"]
+#   [Result "WHITE_WON"]
+#
+#   1. e2e4 e7e5 2. d1h5 b8c6 3. h5f7 WHITE_WON
+#
+# read_records is a generator that reads lines from a file (or any iterable of lines) and yields one GameRecord as
+# soon as each game ends, so only the game being read is ever held in memory. A record with a header that cannot be
+# read, or that ends without a result, is yielded as a malformed GameRecord, and reading carries on from the first
+# header line of the next record, so one bad record never loses the rest of the archive. A GameRecord keeps its move
+# text as it was read and only splits it into moves when they are asked for, so scanning an archive by its headers
+# costs little more than reading it. RecordWriter writes each record straight to its file. record_game makes a record
+# from a ChessVar game using get_move_history, which reads the moves off the game's undo stack, so games keep their
+# history as they are played at no extra cost.
+
+from ChessBoard import SQUARE_TO_INDEX
+from ChessVar import ChessVar
+
+RESULTS = ("WHITE_WON", "BLACK_WON", "DRAW", "UNFINISHED")
+
+# headers written first, in this order, when present; any others follow in the order they were added
+HEADER_ORDER = ("Event", "Site", "Date", "Round", "White", "Black", "Result")
+
+# width that the move text is wrapped to when written
+LINE_WIDTH = 80
+
+RECORD_EXTENSION = ".cvg"
+
+
+class RecordError(Exception):
+    """Raised when a game record cannot be read. The message gives the line number of the problem"""
+
+
+def format_move(move):
+    """Returns the passed (source square, destination square) pair in record form, such as 'e2e4'"""
+
+    return move[0] + move[1]
+
+
+def parse_record_move(token):
+    """Returns the (source square, destination square) pair of a move written in record form, such as 'e2e4', or None
+    if the token is not a move on the board"""
+
+    if len(token) != 4 or token[:2] not in SQUARE_TO_INDEX or token[2:] not in SQUARE_TO_INDEX:
+        return None
+
+    return (token[:2], token[2:])
+
+
+class GameRecord:
+    """The GameRecord class is one recorded game. Its data members are the dictionary of headers, the move text (the
+    moves as written in the record, not yet split into moves), the list of moves once it has been split, the result,
+    the line number the record started on (None for records that were not read from a file), and the reason the
+    record could not be read (None unless it is malformed)"""
+
+    def __init__(self, headers=None, moves=None, result="UNFINISHED", line_number=None, move_text=None, error=None):
+        """Receives the headers, the list of (source square, destination square) moves and the result. The reader
+        passes the unsplit move text and the line number instead of the moves, and the error message of a record it
+        could not read"""
+
+        if result not in RESULTS:
+            raise ValueError("unknown result %s" % result)
+
+        self._headers = dict(headers) if headers is not None else {}
+        self._moves = list(moves) if moves is not None else None
+        self._move_text = move_text if move_text is not None else ""
+        self._result = result
+        self._line_number = line_number
+        self._error = error
+        if self._moves is None and move_text is None:
+            self._moves = []
+
+
+    def get_headers(self):
+        """Returns the dictionary of headers"""
+
+        return self._headers
+
+
+    def get_header(self, name, default=None):
+        """Returns the value of the passed header, or default if the record does not have it"""
+
+        return self._headers.get(name, default)
+
+
+    def set_header(self, name, value):
+        """Sets the passed header to the passed value, which is stored as a string"""
+
+        self._headers[name] = str(value)
+
+
+    def get_result(self):
+        """Returns the result of the game: WHITE_WON, BLACK_WON, DRAW or UNFINISHED"""
+
+        return self._result
+
+
+    def get_line_number(self):
+        """Returns the line number the record started on in the file it was read from, or None"""
+
+        return self._line_number
+
+
+    def get_error(self):
+        """Returns the message describing why the record could not be read, or None if it is not malformed"""
+
+        return self._error
+
+
+    def get_moves(self):
+        """Returns the list of (source square, destination square) moves. A record that was read from a file splits its
+        move text the first time this is called. Raises RecordError if the record is malformed or the move text holds
+        something that is not a move or a move number"""
+
+        if self._error is not None:
+            raise RecordError(self._error)
+
+        if self._moves is None:
+            moves = []
+            for token in self._move_text.split():
+                if token[-1] == "." and token[:-1].isdigit():
+                    continue
+                move = parse_record_move(token)
+                if move is None:
+                    raise RecordError("line %s: cannot read move %s" % (self._line_number, token))
+                moves.append(move)
+            self._moves = moves
+
+        return self._moves
+
+
+    def get_ply_count(self):
+        """Returns the number of moves in the record"""
+
+        return len(self.get_moves())
+
+
+    def replay(self, game=None):
+        """Makes every move of the record on a new ChessVar game (or on the passed game) and returns the game. Raises
+        RecordError if a move is illegal or the game's final state does not match the recorded result"""
+
+        if game is None:
+            game = ChessVar()
+
+        for ply, move in enumerate(self.get_moves(), 1):
+            if game.make_move(move[0], move[1]) == False:
+                raise RecordError("line %s: illegal move %s at ply %d" % (self._line_number, format_move(move), ply))
+
+        if game.get_game_state() != self._result:
+            raise RecordError("line %s: the moves end in %s but the result is %s" %
+                              (self._line_number, game.get_game_state(), self._result))
+
+        return game
+
+
+    def to_text(self):
+        """Returns the record in the text format described at the top of this file, ending with a newline. The Result
+        header is always set to match the result"""
+
+        headers = dict(self._headers)
+        headers["Result"] = self._result
+        names = [name for name in HEADER_ORDER if name in headers]
+        names += [name for name in headers if name not in HEADER_ORDER]
+
+        lines = ['[%s "%s"]' % (name, escape_header_value(headers[name])) for name in names]
+        lines.append("")
+
+        # a move number is kept on the same line as the white move it numbers
+        tokens = []
+        for ply, move in enumerate(self.get_moves()):
+            if ply % 2 == 0:
+                tokens.append("%d. %s" % (ply // 2 + 1, format_move(move)))
+            else:
+                tokens.append(format_move(move))
+        tokens.append(self._result)
+
+        line = ""
+        for token in tokens:
+            if line != "" and len(line) + 1 + len(token) > LINE_WIDTH:
+                lines.append(line)
+                line = token
+            elif line == "":
+                line = token
+            else:
+                line += " " + token
+        lines.append(line)
+
+        return "\n".join(lines) + "\n"
+
+
+def escape_header_value(value):
+    """Returns the passed header value with backslashes and double quotes escaped"""
+
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def parse_header(line, line_number):
+    """Returns the (name, value) pair of a header line such as [White "Ada"]. Raises RecordError if the line is not a
+    header"""
+
+    if line[-1] != "]" or " " not in line:
+        raise RecordError("line %d: cannot read header %s" % (line_number, line))
+
+    name, value = line[1:-1].split(" ", 1)
+    value = value.strip()
+    if len(value) < 2 or value[0] != '"' or value[-1] != '"':
+        raise RecordError("line %d: header value must be quoted: %s" % (line_number, line))
+
+    return name, value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+
+
+def read_records(lines):
+    """Generator that reads game records from the passed iterable of lines (such as an open file) and yields one
+    GameRecord per game, as soon as the game's result has been read. The moves are not split until get_moves is called
+    on the record. A record with a header that cannot be read, or that ends without a result, is yielded as a
+    malformed record (see GameRecord.get_error), and the rest of it is skipped up to the first header line after a
+    blank line, where the next record starts"""
+
+    headers = {}
+    move_lines = []
+    start_line = None
+    line_number = 0
+    skipping = False
+    after_blank_line = True
+
+    for line in lines:
+        line_number += 1
+        line = line.strip()
+        if line == "":
+            after_blank_line = True
+            continue
+        if line.startswith("%"):
+            continue
+
+        starts_record = line.startswith("[") and after_blank_line
+        after_blank_line = False
+        if skipping:
+            if starts_record == False:
+                continue
+            skipping = False
+
+        # a header line after a blank line that follows move text starts the next record, so the pending record
+        # never got its result
+        if starts_record and move_lines != []:
+            yield GameRecord(headers, line_number=start_line,
+                             error="line %d: record ends without a result" % start_line)
+            headers = {}
+            move_lines = []
+            start_line = None
+
+        if start_line is None:
+            start_line = line_number
+
+        if line.startswith("[") and move_lines == []:
+            try:
+                name, value = parse_header(line, line_number)
+            except RecordError as error:
+                yield GameRecord(headers, line_number=start_line, error=str(error))
+                headers = {}
+                start_line = None
+                skipping = True
+                continue
+            headers[name] = value
+            continue
+
+        # the last token of the last line of the move text is the result
+        tokens = line.rsplit(None, 1)
+        if tokens[-1] in RESULTS:
+            move_lines.append(tokens[0] if len(tokens) == 2 else "")
+            yield GameRecord(headers, result=tokens[-1], line_number=start_line, move_text=" ".join(move_lines))
+            headers = {}
+            move_lines = []
+            start_line = None
+        else:
+            move_lines.append(line)
+
+    if start_line is not None:
+        yield GameRecord(headers, line_number=start_line, error="line %d: record ends without a result" % start_line)
+
+
+def record_game(game, headers=None):
+    """Returns a GameRecord of the passed ChessVar game's moves so far (from get_move_history) and its current game
+    state as the result, with the passed headers, if any"""
+
+    return GameRecord(headers, game.get_move_history(), game.get_game_state())
+
+
+class RecordWriter:
+    """The RecordWriter class writes game records to a text file as they are given to it, with a blank line between
+    records. Its data members are the file and the number of records written. Use it as a context manager, or call
+    close, to close a file it opened itself"""
+
+    def __init__(self, file, mode="w"):
+        """Receives an open text file, or a path to open with the passed mode ("w" to start a new file or "a" to add to
+        an existing one)"""
+
+        if isinstance(file, str):
+            self._file = open(file, mode)
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+        self._records = 0
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+
+    def get_record_count(self):
+        """Returns the number of records written"""
+
+        return self._records
+
+
+    def write(self, record):
+        """Writes the passed GameRecord"""
+
+        if self._records > 0:
+            self._file.write("\n")
+        self._file.write(record.to_text())
+        self._records += 1
+
+
+    def write_game(self, game, headers=None):
+        """Writes a record of the passed ChessVar game, with the passed headers, if any"""
+
+        self.write(record_game(game, headers))
+
+
+    def close(self):
+        """Flushes the file, and closes it if the writer opened it"""
+
+        if self._file is None:
+            return
+
+        self._file.flush()
+        if self._owns_file:
+            self._file.close()
+        self._file = None
@@ -0,0 +1,226 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Bulk replay and validation of recorded ChessVar games. Game records are read one line at a time from a
+# file (or any other iterable of lines), each record is replayed through make_move, and one result per game is
+# produced as soon as that game has been checked. Everything is done with generators, so only the game currently
+# being replayed is ever held in memory, no matter how large the input is. Each line holds one game, either as a JSON
+# object such as {"id": "game-17", "moves": ["e2e4", "e7e5"]} (moves may also be ["e2", "e4"] pairs) or as a plain
+# list of moves separated by spaces, such as "e2e4 e7e5 d1h5". A move can be written as "e2e4" or "e2-e4". Blank lines
+# and lines starting with # are skipped. The result of each game records whether every move was legal, the first
+# illegal ply (counting from 1) and why it was rejected, and the final game state. Files in the multi-line game-record
+# format of ChessRecord.py are read with the "record" format, which gives each game its Id header (or the line it
+# starts on) as id. Run this file from the command line to validate a file and write the results as JSON lines, for
+# example: python ChessReplay.py games.txt
+
+import argparse
+import json
+import sys
+
+from ChessBoard import SQUARE_TO_INDEX
+from ChessInstrumentation import MoveInstrumentation
+from ChessRecord import RecordError, read_records
+from ChessVar import ChessVar
+
+
+def parse_move(move):
+    """Converts a single recorded move into a (source square, destination square) pair. The move may be a string
+    such as 'e2e4' or 'e2-e4', or a two item list or tuple such as ['e2', 'e4']. Returns None if the move cannot be
+    read or names a square that is not on the board"""
+
+    if isinstance(move, str):
+        move = move.strip().replace("-", "")
+        if len(move) != 4:
+            return None
+        move = (move[:2], move[2:])
+
+    elif isinstance(move, (list, tuple)) == False or len(move) != 2:
+        return None
+
+    source_square, destination_square = move
+    if isinstance(source_square, str) == False or isinstance(destination_square, str) == False:
+        return None
+
+    if source_square not in SQUARE_TO_INDEX or destination_square not in SQUARE_TO_INDEX:
+        return None
+
+    return (source_square, destination_square)
+
+
+def read_game_records(lines, record_format="auto"):
+    """Generator that reads game records from the passed iterable of lines (such as an open file) and yields one
+    (game id, list of moves) pair per game. record_format can be "json", "plain", "record" (ChessRecord game records),
+    or "auto" to decide line by line (lines starting with { are read as JSON). Games without an id are given their line
+    number as id. The moves are yielded as they were recorded (None for a record that cannot be read, which
+    replay_game reports as malformed); parse_move is applied while replaying"""
+
+    if record_format == "record":
+        for record in read_records(lines):
+            try:
+                moves = record.get_moves()
+            except RecordError:
+                moves = None
+            yield (record.get_header("Id", record.get_line_number()), moves)
+        return
+
+    line_number = 0
+    for line in lines:
+        line_number += 1
+        line = line.strip()
+        if line == "" or line.startswith("#"):
+            continue
+
+        if record_format == "json" or (record_format == "auto" and line.startswith("{")):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield (line_number, None)
+                continue
+            if isinstance(record, dict) == False:
+                yield (line_number, None)
+                continue
+            yield (record.get("id", line_number), record.get("moves"))
+
+        else:
+            yield (line_number, line.split())
+
+
+def format_recorded_move(recorded_move):
+    """Returns the passed recorded move as a string for a result: the move itself if it is a string, and otherwise its
+    JSON text (or its repr if it cannot be written as JSON)"""
+
+    if isinstance(recorded_move, str):
+        return recorded_move
+
+    try:
+        return json.dumps(recorded_move)
+    except (TypeError, ValueError):
+        return repr(recorded_move)
+
+
+def replay_game(moves, game=None):
+    """Replays the passed list of recorded moves through make_move on a new ChessVar game (or on the passed game) and
+    returns a result dictionary. "valid" is True if every move was legal, "plies" is the number of moves that were
+    made, and "illegal_ply", "illegal_move" and "reason" describe the first move that could not be made (the reason is
+    "malformed" for a move that cannot be read, "game_over" for a move recorded after a team won, and "illegal" for
+    any other rejected move). "game_state" is the state of the game after the last legal move"""
+
+    if game is None:
+        game = ChessVar()
+
+    result = {
+        "valid"        : True,
+        "plies"        : 0,
+        "illegal_ply"  : None,
+        "illegal_move" : None,
+        "reason"       : None,
+        "game_state"   : game.get_game_state()
+    }
+
+    if isinstance(moves, list) == False:
+        result["valid"] = False
+        result["illegal_ply"] = 1
+        result["reason"] = "malformed"
+        return result
+
+    for recorded_move in moves:
+        move = parse_move(recorded_move)
+
+        if move is None:
+            reason = "malformed"
+        elif game.get_game_state() != "UNFINISHED":
+            reason = "game_over"
+        elif game.make_move(move[0], move[1]) == False:
+            reason = "illegal"
+        else:
+            result["plies"] += 1
+            continue
+
+        result["valid"] = False
+        result["illegal_ply"] = result["plies"] + 1
+        result["illegal_move"] = format_recorded_move(recorded_move)
+        result["reason"] = reason
+        break
+
+    result["game_state"] = game.get_game_state()
+    return result
+
+
+def replay_games(lines, record_format="auto", instrumentation=None):
+    """Generator that lazily validates every game record in the passed iterable of lines and yields one result
+    dictionary per game, in input order. Each result is the one made by replay_game with the game's "id" added. If a
+    ChessInstrumentation.MoveInstrumentation is passed, it is attached to every game replayed"""
+
+    for game_id, moves in read_game_records(lines, record_format):
+        game = ChessVar()
+        if instrumentation is not None:
+            instrumentation.attach(game)
+        result = replay_game(moves, game)
+        if instrumentation is not None:
+            instrumentation.detach(game)
+        result["id"] = game_id
+        yield result
+
+
+def main(arguments=None):
+    """Command line entry point. Validates every game in the input file (or standard input), writes one JSON result
+    line per game to the output file (or standard output), and prints a summary to standard error. Returns 1 if any
+    game contained an illegal move, 0 otherwise"""
+
+    parser = argparse.ArgumentParser(description="Replay recorded ChessVar games and report the first illegal ply of "
+                                                 "each game.")
+    parser.add_argument("input", nargs="?", default="-", help="file of game records (default: stdin)")
+    parser.add_argument("--output", default="-", help="file to write JSON result lines to (default: stdout)")
+    parser.add_argument("--format", choices=["auto", "json", "plain", "record"], default="auto",
+                        help="format of the game records (default: decide per line)")
+    parser.add_argument("--invalid-only", action="store_true", help="only write results of games with illegal moves")
+    parser.add_argument("--profile", choices=["json", "prometheus"], default=None,
+                        help="time each stage of make_move and write the totals to standard error in this format")
+    options = parser.parse_args(arguments)
+
+    instrumentation = None
+    if options.profile is not None:
+        instrumentation = MoveInstrumentation()
+
+    if options.input == "-":
+        input_file = sys.stdin
+    else:
+        input_file = open(options.input)
+
+    if options.output == "-":
+        output_file = sys.stdout
+    else:
+        output_file = open(options.output, "w")
+
+    totals = {"games": 0, "valid": 0, "invalid": 0, "WHITE_WON": 0, "BLACK_WON": 0, "UNFINISHED": 0}
+    try:
+        for result in replay_games(input_file, options.format, instrumentation):
+            totals["games"] += 1
+            totals[result["game_state"]] = totals.get(result["game_state"], 0) + 1
+            if result["valid"]:
+                totals["valid"] += 1
+                if options.invalid_only:
+                    continue
+            else:
+                totals["invalid"] += 1
+            output_file.write(json.dumps(result) + "\n")
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    print(json.dumps(totals), file=sys.stderr)
+    if options.profile == "json":
+        print(instrumentation.to_json(indent=2), file=sys.stderr)
+    elif options.profile == "prometheus":
+        sys.stderr.write(instrumentation.to_prometheus())
+
+    if totals["invalid"] > 0:
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,473 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: A move-choosing search engine for ChessVar. ChessSearch runs an iterative deepening alpha-beta
+# (negamax) search directly on a ChessVar game, walking the move tree with execute_move and pop instead of copying
+# the game. Moves are ordered with the transposition table's best move first, then captures (most valuable victim
+# first, where capturing the last piece of a type beats everything), then killer moves and the history heuristic. At
+# the end of the main search a quiescence search keeps looking at captures so that positions are not scored in the
+# middle of an exchange. Each search runs within a depth limit and an optional time and node budget; when the budget
+# runs out the best move of the deepest finished iteration is returned. Positions are scored by ChessEvaluation, which
+# understands that this variant is won by capturing the last piece of any type. If endgame tablebases are passed
+# (see ChessTablebase), positions they cover are scored from the tables instead of being searched. A game in play
+# holds all six types until it ends, so the tables only cover reduced positions set up with ChessVar.load_position,
+# where they follow the same rule as make_move (any capture of a team missing a type ends the game). A position that
+# repeats one earlier in the game or in the search is scored as a draw without being searched, which cuts cycles of
+# quiet moves short, and games ended by the optional draw rules of ChessVar are scored as draws.
+
+import time
+
+from ChessBoard import INDEX_TO_SQUARE, SQUARE_MASKS
+from ChessEvaluation import WIN_SCORE, PIECE_STRENGTH, evaluate, get_capture_value
+from TranspositionTable import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+
+MAX_DEPTH = 64
+INFINITY = WIN_SCORE + 1
+
+# scores this close to WIN_SCORE are wins (or losses) a known number of plies away
+WIN_THRESHOLD = WIN_SCORE - 1000
+
+# the clock and the stop conditions are checked once every this many nodes
+CHECK_INTERVAL = 1024
+
+
+class SearchStopped(Exception):
+    """Raised inside the search tree when the time or node budget has run out. It is caught by ChessSearch.search,
+    which takes back every move the search made before returning"""
+
+
+def score_to_table(score, ply):
+    """Converts a win or loss score found ply plies below the root into one measured from the current position, so
+    that it can be stored in the transposition table and reused at any ply"""
+
+    if score > WIN_THRESHOLD:
+        return score + ply
+    if score < -WIN_THRESHOLD:
+        return score - ply
+
+    return score
+
+
+def score_from_table(score, ply):
+    """Converts a score read from the transposition table back into one measured from the root (the reverse of
+    score_to_table)"""
+
+    if score > WIN_THRESHOLD:
+        return score - ply
+    if score < -WIN_THRESHOLD:
+        return score + ply
+
+    return score
+
+
+class ChessSearch:
+    """The ChessSearch class chooses moves for a ChessVar game. Its data members are the game being searched, the
+    transposition table (which can be shared with other searches and evaluation code), the killer move and history
+    heuristic tables used for move ordering, the node counter, and the limits of the search currently running. The
+    search method runs the iterative deepening search and returns a dictionary describing the best move found"""
+
+    def __init__(self, game, transposition_table=None, tablebases=None):
+        """Receives the ChessVar game to search and, optionally, a TranspositionTable to use (a new 16 MB table is
+        made if none is passed) and an object with a probe(game) method, such as a ChessTablebase.TablebaseSet, that
+        returns the distance to the end of the game of positions it covers and None for others"""
+
+        if transposition_table is None:
+            transposition_table = TranspositionTable()
+
+        self._game = game
+        self._table = transposition_table
+        self._tablebases = tablebases
+        self._killers = [[None, None] for ply in range(MAX_DEPTH + 1)]
+        self._history = {}
+        self._nodes = 0
+        self._next_check = CHECK_INTERVAL
+        self._deadline = None
+        self._requested_deadline = None
+        self._node_limit = None
+        self._stop_event = None
+        self._stop_requested = False
+        self._root_best = None
+
+
+    def get_transposition_table(self):
+        """Returns the TranspositionTable used by this search"""
+
+        return self._table
+
+
+    def get_nodes(self):
+        """Returns the number of nodes visited by the most recent (or currently running) search"""
+
+        return self._nodes
+
+
+    def stop(self):
+        """Asks the search that is currently running (usually on another thread) to stop at the next node it visits,
+        instead of waiting for the next regular limit check. It returns the best move of its deepest finished iteration
+        as usual"""
+
+        self._stop_requested = True
+        self._next_check = 0
+
+
+    def set_deadline(self, time_limit):
+        """Gives the search that is currently running (usually on another thread) a time limit of time_limit seconds
+        from now, or an earlier one if it already has a deadline sooner than that. If the search has not started yet,
+        the limit applies to it when it does"""
+
+        deadline = time.perf_counter() + time_limit
+        self._requested_deadline = deadline
+        if self._deadline is None or deadline < self._deadline:
+            self._deadline = deadline
+        self._next_check = 0
+
+
+    def count_node(self):
+        """Counts one visited node, and every CHECK_INTERVAL nodes checks whether the time or node budget has run out.
+        Raises SearchStopped if it has"""
+
+        self._nodes += 1
+        if self._nodes >= self._next_check:
+            self._next_check = self._nodes + CHECK_INTERVAL
+            self.check_limits()
+
+
+    def check_limits(self):
+        """Raises SearchStopped if the search has gone past its deadline or node limit, its stop event is set, or stop
+        has been called"""
+
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchStopped()
+
+        if self._node_limit is not None and self._nodes >= self._node_limit:
+            raise SearchStopped()
+
+        if self._stop_event is not None and self._stop_event.is_set():
+            raise SearchStopped()
+
+        if self._stop_requested:
+            raise SearchStopped()
+
+
+    def order_moves(self, moves, best_move, ply):
+        """Returns the passed list of (source index, destination index) moves sorted so that the most promising moves
+        are searched first: the transposition table's best move, then captures ordered by victim value and then by the
+        cheapest attacker, then this ply's killer moves, then quiet moves by their history heuristic score"""
+
+        game = self._game
+        team = game.get_team(game.get_turn())
+        if game.get_turn() == "WHITE":
+            other_team = game.get_team("BLACK")
+        else:
+            other_team = game.get_team("WHITE")
+
+        enemy = other_team.get_occupied()
+        killers = self._killers[min(ply, MAX_DEPTH)]
+        history = self._history
+        scored_moves = []
+
+        for move in moves:
+            if move == best_move:
+                order = 4 * INFINITY
+            elif enemy & SQUARE_MASKS[move[1]]:
+                attacker_type = team.get_piece_type(team.identify_piece_by_index(move[0]))
+                order = 2 * INFINITY + get_capture_value(other_team, move[1]) - PIECE_STRENGTH[attacker_type] // 10
+            elif move == killers[0] or move == killers[1]:
+                order = INFINITY
+            else:
+                order = history.get(move, 0)
+            scored_moves.append((order, move))
+
+        scored_moves.sort(reverse=True)
+
+        return [move for order, move in scored_moves]
+
+
+    def generate_captures(self):
+        """Returns the moves of the turn team that capture a piece of the other team, ordered by victim value"""
+
+        game = self._game
+        if game.get_turn() == "WHITE":
+            enemy = game.get_team("BLACK").get_occupied()
+        else:
+            enemy = game.get_team("WHITE").get_occupied()
+
+        captures = [move for move in game.generate_move_indexes() if enemy & SQUARE_MASKS[move[1]]]
+
+        return self.order_moves(captures, None, 0)
+
+
+    def quiescence(self, alpha, beta, ply):
+        """Searches only captures from the current position until it is quiet, so that the evaluation is not taken in
+        the middle of an exchange. The team to move may also "stand pat" and keep the static evaluation if no capture
+        improves on it"""
+
+        self.count_node()
+        game = self._game
+
+        if game.get_game_state() == "DRAW":
+            return 0
+        if game.get_game_state() != "UNFINISHED":
+            return -(WIN_SCORE - ply)
+
+        best_score = evaluate(game)
+        if best_score >= beta:
+            return best_score
+        if best_score > alpha:
+            alpha = best_score
+
+        for move in self.generate_captures():
+            game.execute_move(move[0], move[1])
+            score = -self.quiescence(-beta, -alpha, ply + 1)
+            game.pop()
+
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        return best_score
+
+
+    def alpha_beta(self, depth, alpha, beta, ply):
+        """The main negamax alpha-beta search. Returns the score of the current position from the point of view of the
+        team to move, searched depth plies deep (plus the quiescence search). Results are stored in and read from the
+        transposition table, and moves after the first are searched with a null window first (principal variation
+        search) and only searched again with the full window if they turn out better"""
+
+        game = self._game
+
+        if game.get_game_state() != "UNFINISHED":
+            self.count_node()
+            if game.get_game_state() == "DRAW":
+                return 0
+            return -(WIN_SCORE - ply)
+
+        # a position that has already occurred in the game or the search is a cycle, which cannot make progress
+        if ply > 0 and game.is_repetition():
+            self.count_node()
+            return 0
+
+        if self._tablebases is not None and ply > 0:
+            distance = self._tablebases.probe(game)
+            if distance is not None:
+                self.count_node()
+                if distance > 0:
+                    return WIN_SCORE - (ply + distance)
+                if distance < 0:
+                    return -(WIN_SCORE - (ply - distance))
+                return 0
+
+        if depth <= 0:
+            return self.quiescence(alpha, beta, ply)
+
+        self.count_node()
+        position_hash = game.get_hash()
+        best_move = None
+        entry = self._table.probe(position_hash)
+        if entry is not None:
+            score, entry_depth, bound, best_move = entry
+            if entry_depth >= depth:
+                score = score_from_table(score, ply)
+                if bound == EXACT:
+                    return score
+                if bound == LOWER_BOUND and score >= beta:
+                    return score
+                if bound == UPPER_BOUND and score <= alpha:
+                    return score
+
+        moves = game.generate_move_indexes()
+        if moves == []:
+            return 0                            # a team with no legal moves cannot make progress - score it as even
+
+        original_alpha = alpha
+        best_score = -INFINITY
+        first_move = True
+
+        for move in self.order_moves(moves, best_move, ply):
+            game.execute_move(move[0], move[1])
+            if first_move == True:
+                score = -self.alpha_beta(depth - 1, -beta, -alpha, ply + 1)
+                first_move = False
+            else:
+                score = -self.alpha_beta(depth - 1, -alpha - 1, -alpha, ply + 1)
+                if alpha < score < beta:
+                    score = -self.alpha_beta(depth - 1, -beta, -alpha, ply + 1)
+            game.pop()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        self.record_cutoff(move, depth, ply)
+                        break
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+
+        self._table.store(position_hash, depth, score_to_table(best_score, ply), bound, best_move)
+        return best_score
+
+
+    def record_cutoff(self, move, depth, ply):
+        """Remembers a quiet move that caused a beta cutoff as a killer move for this ply and raises its history
+        heuristic score, so that it is tried early in sibling positions"""
+
+        game = self._game
+        if game.get_turn() == "WHITE":
+            enemy = game.get_team("BLACK").get_occupied()
+        else:
+            enemy = game.get_team("WHITE").get_occupied()
+
+        if enemy & SQUARE_MASKS[move[1]]:
+            return                              # captures are already ordered first, so they are not recorded
+
+        killers = self._killers[min(ply, MAX_DEPTH)]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+
+        self._history[move] = self._history.get(move, 0) + depth * depth
+
+
+    def search_root(self, depth, moves):
+        """Searches every root move to the passed depth and returns the best (score, move) pair. The best move found
+        so far is kept in _root_best so that an interrupted iteration can still report it"""
+
+        game = self._game
+        alpha = -INFINITY
+        beta = INFINITY
+        best_move = None
+
+        for move in moves:
+            game.execute_move(move[0], move[1])
+            if best_move is None:
+                score = -self.alpha_beta(depth - 1, -beta, -alpha, 1)
+            else:
+                score = -self.alpha_beta(depth - 1, -alpha - 1, -alpha, 1)
+                if score > alpha:
+                    score = -self.alpha_beta(depth - 1, -beta, -alpha, 1)
+            game.pop()
+
+            if score > alpha:
+                alpha = score
+                best_move = move
+                self._root_best = (alpha, move)
+
+        self._table.store(game.get_hash(), depth, alpha, EXACT, best_move)
+        return alpha, best_move
+
+
+    def get_principal_variation(self, max_length):
+        """Follows the best moves stored in the transposition table from the current position and returns them as a
+        list of (source square, destination square) pairs, at most max_length moves long"""
+
+        game = self._game
+        line = []
+
+        while len(line) < max_length:
+            entry = self._table.probe(game.get_hash())
+            if entry is None or entry[3] is None or entry[3] not in game.generate_move_indexes():
+                break
+            game.execute_move(entry[3][0], entry[3][1])
+            line.append(entry[3])
+
+        for move in line:
+            game.pop()
+
+        return [(INDEX_TO_SQUARE[source], INDEX_TO_SQUARE[destination]) for source, destination in line]
+
+
+    def search(self, max_depth=MAX_DEPTH, time_limit=None, node_limit=None, callback=None, stop_event=None,
+               first_depth=1):
+        """Runs an iterative deepening search of the game's current position: a full search to first_depth, then the
+        next depth, and so on up to max_depth, stopping early when time_limit seconds have passed, node_limit nodes
+        have been visited, the passed stop_event (anything with an is_set method, such as a threading.Event or
+        multiprocessing.Event) is set, or a forced win or loss has been found. After every finished iteration the
+        passed callback (if any) is called with the result so far. Returns a dictionary with the best move as a (source
+        square, destination square) pair (None if there are no legal moves), its score, the depth reached, the
+        principal variation, the number of nodes visited and the time taken in seconds"""
+
+        game = self._game
+        start_time = time.perf_counter()
+        root_ply_count = game.get_ply_count()
+
+        self._table.new_search()
+        self._nodes = 0
+        self._next_check = CHECK_INTERVAL
+        self._deadline = None
+        if time_limit is not None:
+            self._deadline = start_time + time_limit
+        if self._requested_deadline is not None:
+            if self._deadline is None or self._requested_deadline < self._deadline:
+                self._deadline = self._requested_deadline
+            self._requested_deadline = None
+        self._node_limit = node_limit
+        self._stop_event = stop_event
+        self._stop_requested = False
+        if stop_event is not None and stop_event.is_set():
+            self._next_check = 0                # stopped before it started: give up at the first node
+
+        result = {
+            "move"                : None,
+            "score"               : 0,
+            "depth"               : 0,
+            "principal_variation" : [],
+            "nodes"               : 0,
+            "time"                : 0.0
+        }
+
+        moves = game.generate_move_indexes()
+        if moves == []:
+            return result
+
+        best_move = self.order_moves(moves, None, 0)[0]
+        best_score = 0
+        for depth in range(min(first_depth, max_depth), max_depth + 1):
+            self._root_best = None
+            try:
+                score, move = self.search_root(depth, self.order_moves(moves, best_move, 0))
+            except SearchStopped:
+                while game.get_ply_count() > root_ply_count:
+                    game.pop()
+                # the first move searched in an iteration is the previous best, so any move that beat it is better
+                if self._root_best is not None and self._root_best[1] != best_move:
+                    best_score, best_move = self._root_best
+                break
+
+            best_score, best_move = score, move
+            result["depth"] = depth
+            result["move"] = (INDEX_TO_SQUARE[best_move[0]], INDEX_TO_SQUARE[best_move[1]])
+            result["score"] = best_score
+            result["principal_variation"] = self.get_principal_variation(depth)
+            result["nodes"] = self._nodes
+            result["time"] = time.perf_counter() - start_time
+            if callback is not None:
+                callback(dict(result))
+
+            if abs(best_score) > WIN_THRESHOLD:
+                break
+
+        result["move"] = (INDEX_TO_SQUARE[best_move[0]], INDEX_TO_SQUARE[best_move[1]])
+        result["score"] = best_score
+        result["nodes"] = self._nodes
+        result["time"] = time.perf_counter() - start_time
+        if result["principal_variation"] == [] or result["principal_variation"][0] != result["move"]:
+            result["principal_variation"] = [result["move"]]
+
+        return result
+
+
+def choose_move(game, max_depth=MAX_DEPTH, time_limit=1.0, node_limit=None):
+    """Convenience function that searches the passed ChessVar game with a fresh ChessSearch and returns the best move
+    found as a (source square, destination square) pair, or None if there are no legal moves"""
+
+    return ChessSearch(game).search(max_depth, time_limit, node_limit)["move"]
@@ -0,0 +1,250 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Self-play simulation runner for ChessVar, for studying the balance of this variant's rules over large
+# numbers of games. Games are split into batches and the batches are played in parallel by a pool of worker
+# processes. Every game gets its own random generator, seeded from the run's seed and the game's number, so a run
+# gives exactly the same results no matter how many processes play it or in which order the batches finish. Workers
+# do not send individual games back to the parent process: each batch is summed into a SelfPlayStatistics object
+# (wins by color, the piece type whose capture decided each game, and a histogram of game lengths), and those
+# summaries are merged as they arrive. A player is either "random", which picks uniformly among the legal moves, or
+# "engine:N", which plays the best move of a ChessSearch to depth N. Games that only shuffle pieces can be cut short
+# with ChessVar's optional draw rules (a repetition limit and a limit on plies without a capture). Run this file from
+# the command line to play a batch of games and print the statistics as JSON, for example:
+# python ChessSelfPlay.py --games 1000 --processes 8
+
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+import time
+
+from ChessBoard import PIECE_TYPES, SQUARE_TO_INDEX
+from ChessSearch import ChessSearch
+from ChessVar import ChessVar
+from TranspositionTable import TranspositionTable
+
+# game lengths are counted in buckets of this many plies
+HISTOGRAM_BUCKET_PLIES = 10
+
+
+class SelfPlayStatistics:
+    """The SelfPlayStatistics class sums up the results of many self-play games. Its data members count the games
+    played, the games won by each team, the games that reached the ply limit without a winner, the piece type whose
+    last piece was captured in each won game (separately for each winning team), the total number of plies played, and
+    a histogram of game lengths. Statistics from different workers are combined with merge"""
+
+    def __init__(self):
+        """All counters start at zero"""
+
+        self._games = 0
+        self._results = {"WHITE_WON": 0, "BLACK_WON": 0, "DRAW": 0, "UNFINISHED": 0}
+        self._winning_piece_types = {
+            "WHITE_WON": {piece_type: 0 for piece_type in PIECE_TYPES},
+            "BLACK_WON": {piece_type: 0 for piece_type in PIECE_TYPES}
+        }
+        self._total_plies = 0
+        self._length_histogram = {}
+
+
+    def add_game(self, game_state, winning_piece_type, plies):
+        """Counts one finished game given its final game state, the type of the piece whose capture won it (None if
+        nobody won), and its length in plies"""
+
+        self._games += 1
+        self._results[game_state] = self._results.get(game_state, 0) + 1
+        if winning_piece_type is not None:
+            self._winning_piece_types[game_state][winning_piece_type] += 1
+
+        self._total_plies += plies
+        bucket = plies // HISTOGRAM_BUCKET_PLIES * HISTOGRAM_BUCKET_PLIES
+        self._length_histogram[bucket] = self._length_histogram.get(bucket, 0) + 1
+
+
+    def merge(self, other):
+        """Adds every count of another SelfPlayStatistics object to this one"""
+
+        self._games += other._games
+        for game_state, count in other._results.items():
+            self._results[game_state] = self._results.get(game_state, 0) + count
+
+        for game_state, counts in other._winning_piece_types.items():
+            for piece_type, count in counts.items():
+                self._winning_piece_types[game_state][piece_type] += count
+
+        self._total_plies += other._total_plies
+        for bucket, count in other._length_histogram.items():
+            self._length_histogram[bucket] = self._length_histogram.get(bucket, 0) + count
+
+
+    def get_games(self):
+        """Returns the number of games counted"""
+
+        return self._games
+
+
+    def to_dict(self):
+        """Returns the statistics as a dictionary that can be written out as JSON, including the win rate of each team
+        and the average game length"""
+
+        win_rates = {}
+        average_plies = 0.0
+        if self._games > 0:
+            for game_state, count in self._results.items():
+                win_rates[game_state] = count / self._games
+            average_plies = self._total_plies / self._games
+
+        return {
+            "games"               : self._games,
+            "results"             : dict(self._results),
+            "win_rates"           : win_rates,
+            "winning_piece_types" : {state: dict(counts) for state, counts in self._winning_piece_types.items()},
+            "average_plies"       : average_plies,
+            "length_histogram"    : {str(bucket): self._length_histogram[bucket]
+                                     for bucket in sorted(self._length_histogram)}
+        }
+
+
+def get_winning_piece_type(game):
+    """Returns the piece type that the losing team has no pieces of left in a finished game, or None if the game is
+    not finished"""
+
+    if game.get_game_state() == "WHITE_WON":
+        losing_team = game.get_team("BLACK")
+    elif game.get_game_state() == "BLACK_WON":
+        losing_team = game.get_team("WHITE")
+    else:
+        return None
+
+    for piece_type in PIECE_TYPES:
+        if losing_team.check_type_for_captured_pieces(piece_type):
+            return piece_type
+
+    return None
+
+
+def choose_player_move(game, player, generator, moves):
+    """Returns the (source index, destination index) move that the passed player picks from the passed list of legal
+    moves of the game's current position. player is "random" or "engine:N"; random choices are drawn from the passed
+    random generator"""
+
+    if player == "random":
+        return generator.choice(moves)
+
+    depth = int(player.split(":")[1])
+    search = ChessSearch(game, TranspositionTable(1024 * 1024))
+    move = search.search(max_depth=depth)["move"]
+
+    return (SQUARE_TO_INDEX[move[0]], SQUARE_TO_INDEX[move[1]])
+
+
+def play_game(white_player, black_player, generator, max_plies, draw_rules=(None, None)):
+    """Plays one game between the two passed players until a team wins, a draw rule ends it, or max_plies plies have
+    been played. draw_rules is the (repetition limit, quiet ply limit) pair passed to ChessVar.set_draw_rules. Returns
+    a (final game state, winning piece type, number of plies) tuple"""
+
+    game = ChessVar()
+    game.set_draw_rules(*draw_rules)
+    plies = 0
+
+    while plies < max_plies:
+        moves = game.generate_move_indexes()
+        if moves == []:
+            break                               # the game is over, or the team to move is stuck
+        if game.get_turn() == "WHITE":
+            move = choose_player_move(game, white_player, generator, moves)
+        else:
+            move = choose_player_move(game, black_player, generator, moves)
+        game.execute_move(move[0], move[1])
+        plies += 1
+
+    return (game.get_game_state(), get_winning_piece_type(game), plies)
+
+
+def play_batch(batch):
+    """Worker process entry point. Plays the games numbered first_game to first_game + game_count - 1 described by the
+    passed (first_game, game_count, seed, white_player, black_player, max_plies, draw_rules) tuple and returns their
+    summed SelfPlayStatistics. Each game's random generator is seeded from the run seed and the game number"""
+
+    first_game, game_count, seed, white_player, black_player, max_plies, draw_rules = batch
+    statistics = SelfPlayStatistics()
+
+    for game_number in range(first_game, first_game + game_count):
+        generator = random.Random("%s:%d" % (seed, game_number))
+        statistics.add_game(*play_game(white_player, black_player, generator, max_plies, draw_rules))
+
+    return statistics
+
+
+def generate_batches(games, batch_size, seed, white_player, black_player, max_plies, draw_rules):
+    """Generator that splits the run into batch descriptions for play_batch"""
+
+    for first_game in range(0, games, batch_size):
+        yield (first_game, min(batch_size, games - first_game), seed, white_player, black_player, max_plies,
+               draw_rules)
+
+
+def run_self_play(games, processes=None, seed=0, white_player="random", black_player="random", max_plies=400,
+                  batch_size=50, callback=None, draw_rules=(None, None)):
+    """Plays the passed number of games across a pool of worker processes (one per CPU if processes is None; with 1
+    process the games are played in this process) and returns the merged SelfPlayStatistics. The callback, if any, is
+    called with the statistics merged so far each time a batch finishes. draw_rules is the (repetition limit, quiet
+    ply limit) pair every game is played with"""
+
+    statistics = SelfPlayStatistics()
+    batches = generate_batches(games, batch_size, seed, white_player, black_player, max_plies, draw_rules)
+
+    if processes == 1:
+        for batch in batches:
+            statistics.merge(play_batch(batch))
+            if callback is not None:
+                callback(statistics)
+        return statistics
+
+    with multiprocessing.Pool(processes) as pool:
+        for batch_statistics in pool.imap_unordered(play_batch, batches):
+            statistics.merge(batch_statistics)
+            if callback is not None:
+                callback(statistics)
+
+    return statistics
+
+
+def main(arguments=None):
+    """Command line entry point. Plays the requested games and prints the merged statistics as JSON, with progress
+    written to standard error"""
+
+    parser = argparse.ArgumentParser(description="Play ChessVar games against itself across worker processes and "
+                                                 "report aggregated statistics.")
+    parser.add_argument("--games", type=int, default=100, help="number of games to play (default 100)")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", default="0", help="seed of the run; the same seed gives the same results")
+    parser.add_argument("--white", default="random", help='white player: "random" or "engine:N" (default random)')
+    parser.add_argument("--black", default="random", help='black player: "random" or "engine:N" (default random)')
+    parser.add_argument("--max-plies", type=int, default=400, help="plies before a game is stopped (default 400)")
+    parser.add_argument("--batch-size", type=int, default=50, help="games per worker task (default 50)")
+    parser.add_argument("--repetition-limit", type=int, default=None,
+                        help="draw a game when a position occurs this many times (default: no limit)")
+    parser.add_argument("--quiet-ply-limit", type=int, default=None,
+                        help="draw a game after this many plies without a capture (default: no limit)")
+    options = parser.parse_args(arguments)
+
+    start_time = time.perf_counter()
+
+    def report(statistics):
+        print("%d/%d games" % (statistics.get_games(), options.games), file=sys.stderr)
+
+    statistics = run_self_play(options.games, options.processes, options.seed, options.white, options.black,
+                               options.max_plies, options.batch_size, report,
+                               (options.repetition_limit, options.quiet_ply_limit))
+
+    summary = statistics.to_dict()
+    summary["seconds"] = time.perf_counter() - start_time
+    print(json.dumps(summary, indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
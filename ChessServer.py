@@ -0,0 +1,522 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: An asyncio host for many concurrent ChessVar games, served over a local socket (a unix socket or a TCP
+# port on localhost) or over standard input and output, so it runs with no outside services. All games live in one
+# process and one event loop; a game is only a ChessVar object plus a little bookkeeping, so thousands of games cost
+# little memory and no threads. Clients send one JSON object per line and get one JSON object per line back. Each
+# request has a "command" and may have an "id", which is copied into the reply:
+#   {"command": "new"}                                              -> {"ok": true, "game": "1", ...state...}
+#   {"command": "move", "game": "1", "source": "e2", "destination": "e4"} -> {"ok": true, "result": true, ...state...}
+#   {"command": "state", "game": "1"}                               -> {"ok": true, ...state...}
+#   {"command": "subscribe", "game": "1"} / {"command": "unsubscribe", "game": "1"}
+#   {"command": "close", "game": "1"}                               -> the game is removed
+#   {"command": "list"}                                             -> {"ok": true, "games": [...]}
+# Failed requests get {"ok": false, "error": "..."}. Moves on the same game are applied one at a time (each game has
+# its own lock), while moves on different games never wait for each other. Every connection subscribed to a game is
+# sent an event line for each move made on it ({"event": "move", ...}), for each change of its game state
+# ({"event": "state", ...}), and when it is closed or evicted ({"event": "closed", ...}). Events are queued per
+# connection, so a slow client never holds up a move. Finished games are evicted a short while after they end and
+# idle games after a longer while. Run this file to start a server, for example: python ChessServer.py --unix
+# /tmp/chessvar.sock
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from ChessBoard import SQUARE_TO_INDEX
+from ChessVar import ChessVar
+
+# seconds a finished game is kept (so subscribers can read its final state) and seconds an unfinished game may go
+# without a request before it is evicted
+FINISHED_TIMEOUT = 60.0
+IDLE_TIMEOUT = 3600.0
+
+# seconds between eviction sweeps
+SWEEP_INTERVAL = 5.0
+
+# events waiting to be written to one connection; a connection that falls this far behind is dropped
+EVENT_QUEUE_SIZE = 1024
+
+# longest request line accepted, in bytes
+MAX_LINE_BYTES = 65536
+
+# connections the operating system may queue before the server accepts them; many clients tend to connect at once
+LISTEN_BACKLOG = 4096
+
+
+class RequestError(Exception):
+    """Raised while handling a request that cannot be carried out. Its message is sent back to the client as the
+    error of the reply"""
+
+
+def get_game_summary(game):
+    """Returns a dictionary describing the passed ChessVar game's current position: its game state, whose turn it is,
+    the number of moves made, and the square of every piece of each team (captured pieces are left out)"""
+
+    summary = {
+        "game_state" : game.get_game_state(),
+        "turn"       : game.get_turn(),
+        "plies"      : game.get_ply_count()
+    }
+    for team_color in ("WHITE", "BLACK"):
+        team = game.get_team(team_color)
+        summary[team_color.lower()] = {piece_name: team.get_piece_location(piece_name)
+                                       for piece_name in team.get_piece_names()
+                                       if team.get_piece_location(piece_name) != "CAPTURED"}
+
+    return summary
+
+
+class GameSession:
+    """The GameSession class is one hosted game. Its data members are the game id, the ChessVar game, the lock that
+    makes moves on the game one at a time, the set of connections subscribed to it, and the times it was last used and
+    finished (None while it is unfinished)"""
+
+    def __init__(self, game_id):
+        """Creates a new game with the passed id"""
+
+        self._game_id = game_id
+        self._game = ChessVar()
+        self._lock = asyncio.Lock()
+        self._subscribers = set()
+        self._last_used = time.monotonic()
+        self._finished_at = None
+
+
+    def get_game_id(self):
+        """Returns the game id"""
+
+        return self._game_id
+
+
+    def get_game(self):
+        """Returns the ChessVar game"""
+
+        return self._game
+
+
+    def get_lock(self):
+        """Returns the asyncio lock that moves on this game hold"""
+
+        return self._lock
+
+
+    def get_subscribers(self):
+        """Returns the set of connections subscribed to this game"""
+
+        return self._subscribers
+
+
+    def touch(self):
+        """Records that the game has just been used"""
+
+        self._last_used = time.monotonic()
+        if self._finished_at is None and self._game.get_game_state() != "UNFINISHED":
+            self._finished_at = self._last_used
+
+
+    def is_expired(self, now, finished_timeout, idle_timeout):
+        """Returns True if the game finished more than finished_timeout seconds ago or has not been used for more than
+        idle_timeout seconds"""
+
+        if self._finished_at is not None and now - self._finished_at > finished_timeout:
+            return True
+
+        return now - self._last_used > idle_timeout
+
+
+class Connection:
+    """The Connection class is one client of the server. Its data members are the function that writes a line to the
+    client, the function that cuts the client off, the queue of event and reply lines waiting to be written, the ids
+    of the games it is subscribed to, and whether it has been dropped"""
+
+    def __init__(self, write_line, disconnect=None):
+        """Receives an async function that writes one line (a str without its newline) to the client, and an optional
+        function that closes the client's transport when the connection is dropped"""
+
+        self._write_line = write_line
+        self._disconnect = disconnect
+        self._queue = asyncio.Queue(EVENT_QUEUE_SIZE)
+        self._subscriptions = set()
+        self._dropped = False
+
+
+    def get_subscriptions(self):
+        """Returns the set of game ids this connection is subscribed to"""
+
+        return self._subscriptions
+
+
+    def is_dropped(self):
+        """Returns True if the connection has been dropped for falling too far behind"""
+
+        return self._dropped
+
+
+    def send(self, message):
+        """Queues the passed dictionary to be written to the client as a JSON line. If the queue is full the
+        connection is dropped instead of making the caller wait"""
+
+        if self._dropped:
+            return
+
+        try:
+            self._queue.put_nowait(json.dumps(message))
+        except asyncio.QueueFull:
+            self.drop()
+
+
+    def drop(self):
+        """Marks the connection as dropped and closes the client's transport, so a client that has stopped reading
+        does not stay connected until it sends another line"""
+
+        if self._dropped:
+            return
+
+        self._dropped = True
+        if self._disconnect is not None:
+            self._disconnect()
+
+
+    async def run_writer(self):
+        """Writes queued lines to the client until the connection is closed (a None is queued) or dropped"""
+
+        while True:
+            line = await self._queue.get()
+            if line is None or self._dropped:
+                return
+            await self._write_line(line)
+
+
+    def close(self):
+        """Makes run_writer return once every line queued so far has been written"""
+
+        try:
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            self.drop()
+
+
+class GameHost:
+    """The GameHost class holds every hosted game and carries out client requests on them. Its data members are the
+    dictionary of GameSession objects by game id, the number used for the next game id, the eviction timeouts, and the
+    eviction task while it runs"""
+
+    def __init__(self, finished_timeout=FINISHED_TIMEOUT, idle_timeout=IDLE_TIMEOUT):
+        """Receives the number of seconds finished games and idle games are kept before they are evicted"""
+
+        self._sessions = {}
+        self._next_game_number = 1
+        self._finished_timeout = finished_timeout
+        self._idle_timeout = idle_timeout
+        self._sweeper = None
+
+
+    def get_game_count(self):
+        """Returns the number of games being hosted"""
+
+        return len(self._sessions)
+
+
+    def get_session(self, game_id):
+        """Returns the GameSession with the passed id, raising RequestError if there is none"""
+
+        session = self._sessions.get(str(game_id))
+        if session is None:
+            raise RequestError("no game with id %s" % game_id)
+
+        return session
+
+
+    def create_game(self):
+        """Creates a new game and returns its GameSession"""
+
+        game_id = str(self._next_game_number)
+        self._next_game_number += 1
+        session = GameSession(game_id)
+        self._sessions[game_id] = session
+
+        return session
+
+
+    async def make_move(self, game_id, source_square, destination_square):
+        """Makes the passed move on the game with the passed id, holding that game's lock so that moves on one game are
+        made one at a time. Sends a move event (and a state event if the game state changed) to every subscriber and
+        returns the make_move result"""
+
+        session = self.get_session(game_id)
+        async with session.get_lock():
+            game = session.get_game()
+            previous_state = game.get_game_state()
+            result = game.make_move(source_square, destination_square)
+            session.touch()
+
+            event = {"event": "move", "game": session.get_game_id(), "source": source_square,
+                     "destination": destination_square, "result": result}
+            event.update(get_game_summary(game))
+            self.publish(session, event)
+            if game.get_game_state() != previous_state:
+                self.publish(session, {"event": "state", "game": session.get_game_id(),
+                                       "game_state": game.get_game_state()})
+
+        return result
+
+
+    def publish(self, session, event):
+        """Sends the passed event to every connection subscribed to the passed session"""
+
+        for connection in list(session.get_subscribers()):
+            connection.send(event)
+
+
+    def subscribe(self, game_id, connection):
+        """Subscribes the passed Connection to the game with the passed id"""
+
+        session = self.get_session(game_id)
+        session.get_subscribers().add(connection)
+        connection.get_subscriptions().add(session.get_game_id())
+        session.touch()
+
+
+    def unsubscribe(self, game_id, connection):
+        """Unsubscribes the passed Connection from the game with the passed id, if it is still hosted"""
+
+        session = self._sessions.get(str(game_id))
+        if session is not None:
+            session.get_subscribers().discard(connection)
+        connection.get_subscriptions().discard(str(game_id))
+
+
+    def close_game(self, game_id, reason="closed"):
+        """Removes the game with the passed id and tells its subscribers why"""
+
+        session = self.get_session(game_id)
+        del self._sessions[session.get_game_id()]
+        self.publish(session, {"event": "closed", "game": session.get_game_id(), "reason": reason})
+        for connection in session.get_subscribers():
+            connection.get_subscriptions().discard(session.get_game_id())
+
+
+    def evict_expired(self):
+        """Closes every finished or idle game that has been kept longer than its timeout and returns how many were
+        closed"""
+
+        now = time.monotonic()
+        expired = [game_id for game_id, session in self._sessions.items()
+                   if session.is_expired(now, self._finished_timeout, self._idle_timeout)]
+        for game_id in expired:
+            if self._sessions[game_id].get_game().get_game_state() != "UNFINISHED":
+                self.close_game(game_id, "finished")
+            else:
+                self.close_game(game_id, "idle")
+
+        return len(expired)
+
+
+    async def run_sweeper(self, interval=SWEEP_INTERVAL):
+        """Evicts expired games every interval seconds until cancelled"""
+
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_expired()
+
+
+    def start(self, interval=SWEEP_INTERVAL):
+        """Starts the eviction task on the running event loop"""
+
+        if self._sweeper is None:
+            self._sweeper = asyncio.ensure_future(self.run_sweeper(interval))
+
+
+    def stop(self):
+        """Stops the eviction task"""
+
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+
+    async def handle_request(self, request, connection):
+        """Carries out one request dictionary from the passed Connection and returns the reply dictionary"""
+
+        command = request.get("command")
+
+        if command == "new":
+            session = self.create_game()
+            if request.get("subscribe", False):
+                self.subscribe(session.get_game_id(), connection)
+            reply = {"ok": True, "game": session.get_game_id()}
+            reply.update(get_game_summary(session.get_game()))
+            return reply
+
+        if command == "move":
+            for field in ("game", "source", "destination"):
+                if not isinstance(request.get(field), str):
+                    raise RequestError("move needs a %s string" % field)
+            source = request["source"].lower()
+            destination = request["destination"].lower()
+            for square in (source, destination):
+                if square not in SQUARE_TO_INDEX:
+                    raise RequestError("%s is not a square on the board" % square)
+            result = await self.make_move(request["game"], source, destination)
+            reply = {"ok": True, "game": request["game"], "result": result}
+            reply.update(get_game_summary(self.get_session(request["game"]).get_game()))
+            return reply
+
+        if command == "state":
+            session = self.get_session(request.get("game"))
+            session.touch()
+            reply = {"ok": True, "game": session.get_game_id()}
+            reply.update(get_game_summary(session.get_game()))
+            return reply
+
+        if command == "subscribe":
+            self.subscribe(request.get("game"), connection)
+            return {"ok": True, "game": str(request.get("game"))}
+
+        if command == "unsubscribe":
+            self.unsubscribe(request.get("game"), connection)
+            return {"ok": True, "game": str(request.get("game"))}
+
+        if command == "close":
+            self.close_game(request.get("game"))
+            return {"ok": True, "game": str(request.get("game"))}
+
+        if command == "list":
+            return {"ok": True, "games": [{"game": game_id, "game_state": session.get_game().get_game_state()}
+                                          for game_id, session in self._sessions.items()]}
+
+        raise RequestError("unknown command %s" % command)
+
+
+    async def serve_connection(self, reader, write_line, disconnect=None):
+        """Reads request lines from the passed asyncio StreamReader until it is closed, writing a reply line for each
+        (and event lines for subscribed games) through the passed async write_line function. disconnect, if passed,
+        is called to close the client's transport if the connection is dropped"""
+
+        connection = Connection(write_line, disconnect)
+        writer_task = asyncio.ensure_future(connection.run_writer())
+
+        try:
+            while connection.is_dropped() == False:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    connection.send({"ok": False, "error": "request line too long"})
+                    break
+                if line == b"":
+                    break
+                if line.strip() == b"":
+                    continue
+
+                request = {}
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        request = {}
+                        raise RequestError("a request must be a JSON object")
+                    reply = await self.handle_request(request, connection)
+                except (RequestError, ValueError) as error:
+                    reply = {"ok": False, "error": str(error)}
+                if "id" in request:
+                    reply["id"] = request["id"]
+                connection.send(reply)
+        finally:
+            for game_id in list(connection.get_subscriptions()):
+                self.unsubscribe(game_id, connection)
+            connection.close()
+            await writer_task
+
+
+async def serve_stream(host, reader, writer):
+    """Serves one socket connection for the passed GameHost"""
+
+    async def write_line(line):
+        writer.write(line.encode() + b"\n")
+        await writer.drain()
+
+    try:
+        await host.serve_connection(reader, write_line, writer.transport.abort)
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def start_unix_server(host, path):
+    """Starts serving the passed GameHost on a unix socket at the passed path and returns the asyncio Server"""
+
+    return await asyncio.start_unix_server(lambda reader, writer: serve_stream(host, reader, writer), path,
+                                           limit=MAX_LINE_BYTES, backlog=LISTEN_BACKLOG)
+
+
+async def start_tcp_server(host, port, address="127.0.0.1"):
+    """Starts serving the passed GameHost on a TCP port (on localhost by default) and returns the asyncio Server"""
+
+    return await asyncio.start_server(lambda reader, writer: serve_stream(host, reader, writer), address, port,
+                                      limit=MAX_LINE_BYTES, backlog=LISTEN_BACKLOG)
+
+
+async def serve_stdio(host):
+    """Serves the passed GameHost as a single connection over standard input and output, until input ends"""
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=MAX_LINE_BYTES)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    async def write_line(line):
+        sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+
+    await host.serve_connection(reader, write_line)
+
+
+async def run_server(options):
+    """Runs the server described by the parsed command line options until it is stopped"""
+
+    host = GameHost(options.finished_timeout, options.idle_timeout)
+    host.start()
+
+    try:
+        if options.stdio:
+            await serve_stdio(host)
+            return
+
+        if options.unix is not None:
+            server = await start_unix_server(host, options.unix)
+        else:
+            server = await start_tcp_server(host, options.port)
+        async with server:
+            await server.serve_forever()
+    finally:
+        host.stop()
+
+
+def main(arguments=None):
+    """Command line entry point"""
+
+    parser = argparse.ArgumentParser(description="Host many ChessVar games over a local socket or standard input "
+                                                 "and output, with one JSON request or reply per line.")
+    transport = parser.add_mutually_exclusive_group(required=True)
+    transport.add_argument("--unix", metavar="PATH", help="serve on a unix socket at PATH")
+    transport.add_argument("--port", type=int, help="serve on this TCP port on localhost")
+    transport.add_argument("--stdio", action="store_true", help="serve one client over standard input and output")
+    parser.add_argument("--finished-timeout", type=float, default=FINISHED_TIMEOUT,
+                        help="seconds a finished game is kept (default %g)" % FINISHED_TIMEOUT)
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT,
+                        help="seconds an unused game is kept (default %g)" % IDLE_TIMEOUT)
+    options = parser.parse_args(arguments)
+
+    try:
+        asyncio.run(run_server(options))
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,584 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: Retrograde endgame tablebases for low-material ChessVar positions. A table covers one material
+# configuration, named by the pieces of each team with white first, such as "NKvK" (white knight and king against the
+# black king). Letters are P, R, N, B, Q and K, in ChessBoard.PIECE_TYPES order. For every placement of those pieces
+# and either team to move, the table stores whether the team to move wins, loses or cannot force a result, and in how
+# many plies (distance to the capture that ends the game). Pieces move by the same rules as ChessVar (ChessBoard's
+# attack tables; a pawn on its starting row may move two squares, and there is no promotion), and the game ends by
+# ChessVar's own rule: a team loses when one of its pieces is captured and it is then missing a piece type. A team
+# that holds all six types only loses when the last piece of a type is captured, but a team that is already missing
+# a type (as every team of a table small enough to build is) loses as soon as any of its pieces is captured. So the
+# value of a position is the result make_move reaches from that position set up with ChessVar.load_position, as long
+# as exactly the pawns on their starting row are unmoved (the tables assume so); other positions are not probed. Tables
+# are built by retrograde analysis: positions that end the game (or leave the table through a capture into a smaller
+# table, which can only happen to a team holding all six types, and which is generated first) are resolved first,
+# and results are then propagated backwards through un-moves in order of distance, so every position is visited a
+# handful of times.
+# The number of positions is 2 * 64^pieces, so tables of up to three pieces build in seconds and four pieces is the
+# practical limit. Each table is written to disk as a small header followed by one signed value per position (one
+# byte, or two if any distance is over 127): positive n means the team to move wins in n plies, negative n means it
+# loses in n plies, and 0 means neither team can force a win. Tables are memory-mapped when probed. Run this file to
+# build tables, for example: python ChessTablebase.py NKvK RKvK --directory tables
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from ChessBoard import PIECE_TYPES, SQUARE_MASKS, KNIGHT_ATTACKS, KING_ATTACKS, mask_to_indexes, count_bits, \
+    piece_targets, rook_attacks, bishop_attacks, queen_attacks
+
+PIECE_LETTERS = {"pawn": "P", "rook": "R", "knight": "N", "bishop": "B", "queen": "Q", "king": "K"}
+LETTER_PIECES = {letter: piece_type for piece_type, letter in PIECE_LETTERS.items()}
+
+TEAM_COLORS = ("WHITE", "BLACK")
+
+# header: magic, version, bytes per value, number of pieces, configuration name
+TABLE_HEADER = struct.Struct("<4sHBB24s")
+TABLE_MAGIC = b"CVTB"
+VERSION = 2
+
+TABLE_EXTENSION = ".cvtb"
+
+# rows (0-7) pawns start on, and the first index past the board edge they can never stand behind
+PAWN_START_COLUMN = {"WHITE": 1, "BLACK": 6}
+
+# bitboards of the squares of each team's starting row of pawns
+PAWN_START_MASKS = {team_color: 0xFF << (8 * row) for team_color, row in PAWN_START_COLUMN.items()}
+
+
+def parse_configuration(name):
+    """Converts a configuration name such as "NKvK" into a list of (team color, piece type) pairs, white's pieces
+    first and each team's pieces in PIECE_TYPES order"""
+
+    white_letters, black_letters = name.upper().split("V")
+    pieces = []
+    for team_color, letters in (("WHITE", white_letters), ("BLACK", black_letters)):
+        if letters == "":
+            raise ValueError("each team needs at least one piece: %s" % name)
+        types = sorted((LETTER_PIECES[letter] for letter in letters), key=PIECE_TYPES.index)
+        pieces.extend((team_color, piece_type) for piece_type in types)
+
+    return pieces
+
+
+def configuration_name(pieces):
+    """Converts a list of (team color, piece type) pairs into its configuration name (the reverse of
+    parse_configuration)"""
+
+    letters = {"WHITE": [], "BLACK": []}
+    for team_color, piece_type in sorted(pieces, key=lambda piece: (TEAM_COLORS.index(piece[0]),
+                                                                    PIECE_TYPES.index(piece[1]))):
+        letters[team_color].append(PIECE_LETTERS[piece_type])
+
+    return "".join(letters["WHITE"]) + "v" + "".join(letters["BLACK"])
+
+
+def get_game_configuration(game):
+    """Returns the configuration name and the list of piece square indexes (in configuration order) of the passed
+    ChessVar game's current position"""
+
+    letters = {}
+    squares = []
+    for team_color in TEAM_COLORS:
+        team = game.get_team(team_color)
+        letters[team_color] = ""
+        for piece_type in PIECE_TYPES:
+            letters[team_color] += PIECE_LETTERS[piece_type] * team.get_piece_count(piece_type)
+            squares.extend(mask_to_indexes(team.get_bitboard(piece_type)))
+
+    return letters["WHITE"] + "v" + letters["BLACK"], squares
+
+
+def get_exposed_teams(pieces):
+    """Returns the set of team colors that hold fewer than all six piece types in the passed list of (team color,
+    piece type) pairs. ChessVar ends the game as soon as a piece of such a team is captured"""
+
+    held_types = {"WHITE": set(), "BLACK": set()}
+    for team_color, piece_type in pieces:
+        held_types[team_color].add(piece_type)
+
+    return {team_color for team_color in TEAM_COLORS if len(held_types[team_color]) < len(PIECE_TYPES)}
+
+
+def has_table_pawns(game):
+    """Returns True if the pawns of the passed ChessVar game that have not moved are exactly its pawns on their
+    starting row, which is what the tables assume. A pawn given no moves on another row (as load_position does by
+    default) may still move two squares, and a pawn that has moved off and back cannot, so such positions are not in
+    the tables"""
+
+    for team_color in TEAM_COLORS:
+        team = game.get_team(team_color)
+        if team.get_unmoved_pawns() != team.get_bitboard("pawn") & PAWN_START_MASKS[team_color]:
+            return False
+
+    return True
+
+
+def is_valid_pawn_square(team_color, index):
+    """Returns False if a pawn of the passed team can never stand on the passed square (behind its starting row)"""
+
+    if team_color == "WHITE":
+        return index >= 8
+
+    return index < 56
+
+
+class Tablebase:
+    """The Tablebase class gives read access to one generated table. Its data members are the configuration name, its
+    list of pieces, the open table file and its memory map, and a view of the values laid over the memory map"""
+
+    def __init__(self, path):
+        """Opens and memory-maps the table file at the passed path"""
+
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, value_bytes, piece_count, name = TABLE_HEADER.unpack_from(self._map, 0)
+        if magic != TABLE_MAGIC:
+            raise ValueError("%s is not a tablebase file" % path)
+        if version != VERSION:
+            raise ValueError("%s was built by another version of the tablebase rules; build it again" % path)
+
+        self._name = name.rstrip(b"\0").decode()
+        self._pieces = parse_configuration(self._name)
+        self._values = memoryview(self._map)[TABLE_HEADER.size:].cast("b" if value_bytes == 1 else "h")
+
+
+    def get_name(self):
+        """Returns the configuration name of the table, such as "NKvK\""""
+
+        return self._name
+
+
+    def probe_squares(self, squares, turn):
+        """Returns the stored value for the passed list of piece square indexes (in configuration order) with the
+        passed team (WHITE or BLACK) to move"""
+
+        index = 0
+        for square in reversed(squares):
+            index = index * 64 + square
+
+        return self._values[index * 2 + TEAM_COLORS.index(turn)]
+
+
+    def probe(self, game):
+        """Returns the stored value of the passed ChessVar game's current position (positive: the team to move wins in
+        that many plies, negative: it loses in that many plies, 0: no forced result), or None if the game is over or
+        its material does not match this table or its unmoved pawns are not the ones the table assumes (see
+        has_table_pawns)"""
+
+        if game.get_game_state() != "UNFINISHED" or has_table_pawns(game) == False:
+            return None
+
+        name, squares = get_game_configuration(game)
+        if name != self._name:
+            return None
+
+        return self.probe_squares(squares, game.get_turn())
+
+
+    def close(self):
+        """Closes the table file"""
+
+        self._values.release()
+        self._map.close()
+        self._file.close()
+
+
+class TablebaseSet:
+    """The TablebaseSet class probes whichever table in a directory matches a game's material. Tables are opened the
+    first time they are needed. Its data members are the directory, the largest number of pieces of any table in it,
+    and the tables opened so far"""
+
+    def __init__(self, directory):
+        """Finds every table file in the passed directory"""
+
+        self._directory = directory
+        self._tables = {}
+        self._max_pieces = 0
+        for file_name in os.listdir(directory):
+            if file_name.endswith(TABLE_EXTENSION):
+                name = file_name[:-len(TABLE_EXTENSION)]
+                self._tables[name] = None
+                self._max_pieces = max(self._max_pieces, len(parse_configuration(name)))
+
+
+    def get_names(self):
+        """Returns a sorted list of the configuration names available"""
+
+        return sorted(self._tables)
+
+
+    def probe(self, game):
+        """Returns the value of the game's current position from the matching table, or None if there is none or its
+        unmoved pawns are not the ones the tables assume (see has_table_pawns)"""
+
+        if game.get_game_state() != "UNFINISHED":
+            return None
+
+        occupied = game.get_team("WHITE").get_occupied() | game.get_team("BLACK").get_occupied()
+        if count_bits(occupied) > self._max_pieces:
+            return None
+
+        if has_table_pawns(game) == False:
+            return None
+
+        name, squares = get_game_configuration(game)
+        if name not in self._tables:
+            return None
+
+        if self._tables[name] is None:
+            self._tables[name] = Tablebase(os.path.join(self._directory, name + TABLE_EXTENSION))
+
+        return self._tables[name].probe_squares(squares, game.get_turn())
+
+
+    def close(self):
+        """Closes every table opened so far"""
+
+        for table in self._tables.values():
+            if table is not None:
+                table.close()
+
+
+class TablebaseGenerator:
+    """The TablebaseGenerator class builds the table of one configuration by retrograde analysis. Its data members are
+    the list of pieces, how many pieces of each (team, type) the configuration has, the teams that are missing a
+    piece type (and so lose on any capture), the tables of the smaller configurations that captures lead into, and
+    the arrays used while building: the value of each position, whether
+    it is resolved, how many of its moves stay inside the table and are not yet known to lose, and what its captures
+    lead to"""
+
+    def __init__(self, name, subtables):
+        """Receives the configuration name and a dictionary of already built Tablebase (or TablebaseGenerator) objects
+        for every configuration one capture away"""
+
+        self._name = name
+        self._pieces = parse_configuration(name)
+        self._piece_count = len(self._pieces)
+        self._type_counts = {}
+        for piece in self._pieces:
+            self._type_counts[piece] = self._type_counts.get(piece, 0) + 1
+        self._exposed_teams = get_exposed_teams(self._pieces)
+        self._subtables = subtables
+        self._values = None
+
+
+    def get_name(self):
+        """Returns the configuration name"""
+
+        return self._name
+
+
+    def probe_squares(self, squares, turn):
+        """Returns the value of a position of this table once it has been built (same as Tablebase.probe_squares)"""
+
+        index = 0
+        for square in reversed(squares):
+            index = index * 64 + square
+
+        return self._values[index * 2 + TEAM_COLORS.index(turn)]
+
+
+    def decode(self, index):
+        """Returns the list of piece square indexes of the passed position index (without the team-to-move bit)"""
+
+        squares = []
+        for piece in range(self._piece_count):
+            index, square = divmod(index, 64)
+            squares.append(square)
+
+        return squares
+
+
+    def encode(self, squares):
+        """Returns the position index (without the team-to-move bit) of the passed list of piece square indexes"""
+
+        index = 0
+        for square in reversed(squares):
+            index = index * 64 + square
+
+        return index
+
+
+    def is_valid(self, squares):
+        """Returns True if no two pieces share a square and no pawn stands behind its starting row"""
+
+        if len(set(squares)) != len(squares):
+            return False
+
+        for (team_color, piece_type), square in zip(self._pieces, squares):
+            if piece_type == "pawn" and is_valid_pawn_square(team_color, square) == False:
+                return False
+
+        return True
+
+
+    def get_masks(self, squares):
+        """Returns a dictionary of the occupied squares bitboard of each team"""
+
+        masks = {"WHITE": 0, "BLACK": 0}
+        for (team_color, piece_type), square in zip(self._pieces, squares):
+            masks[team_color] |= SQUARE_MASKS[square]
+
+        return masks
+
+
+    def scan_moves(self, squares, turn):
+        """Looks at every legal move of the passed team in the passed position and returns a tuple of: the number of
+        moves, the number of non-capturing moves (which stay in this table), the fastest win a capture leads to (0 if
+        none), the slowest loss a capture leads to (0 if none), and whether some capture leads to a position with no
+        forced result"""
+
+        masks = self.get_masks(squares)
+        other = "BLACK" if turn == "WHITE" else "WHITE"
+        move_count = 0
+        quiet_count = 0
+        best_win = 0
+        worst_loss = 0
+        drawing_capture = False
+
+        for piece_number, (team_color, piece_type) in enumerate(self._pieces):
+            if team_color != turn:
+                continue
+
+            source = squares[piece_number]
+            unmoved = piece_type == "pawn" and source // 8 == PAWN_START_COLUMN[team_color]
+            targets = piece_targets(piece_type, team_color, source, masks[turn], masks[other], unmoved)
+
+            for destination in mask_to_indexes(targets):
+                move_count += 1
+                if masks[other] & SQUARE_MASKS[destination] == 0:
+                    quiet_count += 1
+                    continue
+
+                captured_number = squares.index(destination)
+                if other in self._exposed_teams or self._type_counts[self._pieces[captured_number]] == 1:
+                    best_win = 1                # the capture leaves the other team missing a type, which wins
+                    continue
+
+                new_squares = list(squares)
+                new_squares[piece_number] = destination
+                del new_squares[captured_number]
+                new_pieces = list(self._pieces)
+                del new_pieces[captured_number]
+                value = self._subtables[configuration_name(new_pieces)].probe_squares(new_squares, other)
+
+                if value < 0:
+                    if best_win == 0 or -value + 1 < best_win:
+                        best_win = -value + 1
+                elif value > 0:
+                    worst_loss = max(worst_loss, value + 1)
+                else:
+                    drawing_capture = True
+
+        return move_count, quiet_count, best_win, worst_loss, drawing_capture
+
+
+    def generate_predecessors(self, squares, turn):
+        """Generator that yields the position indexes (with the team-to-move bit) of every position from which the
+        team that is not to move could have reached the passed position with a non-capturing move"""
+
+        mover = "BLACK" if turn == "WHITE" else "WHITE"
+        mover_bit = TEAM_COLORS.index(mover)
+        masks = self.get_masks(squares)
+        occupied = masks["WHITE"] | masks["BLACK"]
+        empty = ~occupied
+        base_index = self.encode(squares)
+
+        for piece_number, (team_color, piece_type) in enumerate(self._pieces):
+            if team_color != mover:
+                continue
+
+            square = squares[piece_number]
+            if piece_type == "knight":
+                origins = KNIGHT_ATTACKS[square] & empty
+            elif piece_type == "king":
+                origins = KING_ATTACKS[square] & empty
+            elif piece_type == "rook":
+                origins = rook_attacks(square, occupied) & empty
+            elif piece_type == "bishop":
+                origins = bishop_attacks(square, occupied) & empty
+            elif piece_type == "queen":
+                origins = queen_attacks(square, occupied) & empty
+            else:
+                origins = self.get_pawn_origins(mover, square, occupied)
+
+            weight = 64 ** piece_number
+            for origin in mask_to_indexes(origins):
+                yield (base_index + (origin - square) * weight) * 2 + mover_bit
+
+
+    def get_pawn_origins(self, team_color, square, occupied):
+        """Returns the bitboard of squares a pawn of the passed team now on the passed square could have come from with
+        a non-capturing move: one square back, or two squares back onto its starting row"""
+
+        step = 8 if team_color == "WHITE" else -8
+        one_back = square - step
+        if one_back < 0 or one_back > 63 or occupied & SQUARE_MASKS[one_back]:
+            return 0
+
+        if is_valid_pawn_square(team_color, one_back) == False:
+            return 0
+
+        origins = SQUARE_MASKS[one_back]
+        two_back = one_back - step
+        if two_back // 8 == PAWN_START_COLUMN[team_color] and occupied & SQUARE_MASKS[two_back] == 0:
+            origins |= SQUARE_MASKS[two_back]
+
+        return origins
+
+
+    def build(self, progress=None):
+        """Runs the retrograde analysis and fills in the value of every position. progress, if passed, is called with
+        a short message after each stage"""
+
+        position_count = 64 ** self._piece_count
+        size = position_count * 2
+        values = array("h", bytes(2 * size))
+        resolved = bytearray(size)
+        remaining = array("H", bytes(2 * size))
+        exit_win = array("H", bytes(2 * size))
+        exit_loss = array("H", bytes(2 * size))
+        drawing_exit = bytearray(size)
+        buckets = {}
+
+        # first pass: count the moves of every position and resolve what its captures lead to
+        for index in range(position_count):
+            squares = self.decode(index)
+            if self.is_valid(squares) == False:
+                resolved[index * 2] = 1
+                resolved[index * 2 + 1] = 1
+                continue
+
+            for turn_bit, turn in enumerate(TEAM_COLORS):
+                position = index * 2 + turn_bit
+                move_count, quiet_count, best_win, worst_loss, drawing_capture = self.scan_moves(squares, turn)
+                if move_count == 0:
+                    resolved[position] = 1      # the team to move is stuck, so nobody can force a win
+                    continue
+
+                remaining[position] = quiet_count
+                exit_win[position] = best_win
+                exit_loss[position] = worst_loss
+                drawing_exit[position] = drawing_capture
+
+                if best_win > 0:
+                    buckets.setdefault(best_win, []).append(position)
+                elif quiet_count == 0 and drawing_capture == False:
+                    buckets.setdefault(worst_loss, []).append(position)
+
+        if progress is not None:
+            progress("%s: scanned %d positions" % (self._name, size))
+
+        # retrograde pass: resolve positions in order of distance. Wins are always an odd number of plies away and
+        # losses an even number, so the distance alone says which a bucket holds
+        distance = 1
+        while buckets:
+            for position in buckets.pop(distance, []):
+                if resolved[position]:
+                    continue
+                resolved[position] = 1
+                if distance % 2 == 1:
+                    values[position] = distance
+                else:
+                    values[position] = -distance
+
+                squares = self.decode(position >> 1)
+                for predecessor in self.generate_predecessors(squares, TEAM_COLORS[position & 1]):
+                    if resolved[predecessor]:
+                        continue
+                    if distance % 2 == 0:
+                        # the predecessor can move into a lost position, so it wins
+                        buckets.setdefault(distance + 1, []).append(predecessor)
+                        continue
+
+                    remaining[predecessor] -= 1
+                    if remaining[predecessor] == 0 and exit_win[predecessor] == 0 and \
+                            drawing_exit[predecessor] == 0:
+                        # every move of the predecessor leads to a win for the other team
+                        loss = max(distance, exit_loss[predecessor] - 1) + 1
+                        buckets.setdefault(loss, []).append(predecessor)
+            distance += 1
+
+        if progress is not None:
+            progress("%s: resolved up to %d plies" % (self._name, distance - 1))
+
+        self._values = values
+
+
+    def write(self, path):
+        """Writes the built table to the passed path, using one byte per position if every distance fits"""
+
+        largest = max(max(self._values), -min(self._values))
+        value_bytes = 1 if largest <= 127 else 2
+
+        with open(path, "wb") as table_file:
+            table_file.write(TABLE_HEADER.pack(TABLE_MAGIC, VERSION, value_bytes, self._piece_count,
+                                               self._name.encode()))
+            if value_bytes == 1:
+                table_file.write(array("b", self._values).tobytes())
+            else:
+                table_file.write(self._values.tobytes())
+
+
+def generate_tablebase(name, directory, progress=None, built=None):
+    """Builds the table of the named configuration in the passed directory, first building (or opening, if they are
+    already on disk) the tables of every smaller configuration its captures lead into. Returns the path of the table
+    file"""
+
+    if built is None:
+        built = {}
+
+    pieces = parse_configuration(name)
+    name = configuration_name(pieces)
+    path = os.path.join(directory, name + TABLE_EXTENSION)
+    if os.path.exists(path):
+        if name not in built:
+            built[name] = Tablebase(path)
+        return path
+
+    type_counts = {}
+    for piece in pieces:
+        type_counts[piece] = type_counts.get(piece, 0) + 1
+    exposed_teams = get_exposed_teams(pieces)
+
+    # every capture that does not end the game leads into the configuration without the captured piece
+    subtables = {}
+    for captured_number, piece in enumerate(pieces):
+        if piece[0] not in exposed_teams and type_counts[piece] > 1:
+            smaller = configuration_name(pieces[:captured_number] + pieces[captured_number + 1:])
+            if smaller not in subtables:
+                generate_tablebase(smaller, directory, progress, built)
+                subtables[smaller] = built[smaller]
+
+    generator = TablebaseGenerator(name, subtables)
+    generator.build(progress)
+    generator.write(path)
+    built[name] = generator
+
+    return path
+
+
+def main(arguments=None):
+    """Command line entry point. Builds the requested tables, and the smaller tables they depend on"""
+
+    parser = argparse.ArgumentParser(description="Build ChessVar endgame tablebases by retrograde analysis.")
+    parser.add_argument("configurations", nargs="+", help='configurations to build, such as "NKvK"')
+    parser.add_argument("--directory", default=".", help="directory to write the tables to (default: current)")
+    options = parser.parse_args(arguments)
+
+    os.makedirs(options.directory, exist_ok=True)
+    for name in options.configurations:
+        path = generate_tablebase(name, options.directory, lambda message: print(message, file=sys.stderr))
+        print(path)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,693 +1,1251 @@
-# Author: Mackenzie Anderson
-# GitHub username: mkenzieanderson
-# Date: December 7, 2023
-# Description: Programs a variant form of chess. In this form of chess, a team wins once all that team has captured
-# all of the pieces of a single type. The board starting position and the restrictions on each piece type movement
-# remains the same as standard chess. Special moves, such as castling, en passant, and pawn promotion, are not
-# permitted in this version of chess. There is no check or checkmate. The ChessVar class contains private data members
-# for two ChessTeam objects (Black and White team), a data member to keep track of whose turn it is, and a data
-# member to track the state of the game (unfinished vs. a team has won). The ChessVar methods contain various get
-# and set methods for its data members, and methods for making and validating moves and captures. The ChessTeam
-# class has a dictionary data member to keep track of a team's pieces and their specific locations, and a list that
-# tracks current squares that are occupied by that team's pieces. The ChessTeam methods include various get and set
-# methods for its data members, and methods to check whether pieces of one type have all been captured
-
-class ChessTeam:
-    """The ChessTeam class holds information about a team’s pieces. Its three data members include the team color, a
-    list of all the squares (coordinates) that are currently occupied by this team’s pieces, and a dictionary that stores
-    each piece by name (key) and each piece’s current location, type, and number of times moved (value, which is a list
-    with these three information pieces). This class has get and set methods for both of its data members, a method that
-    checks the list of occupied squares to determine whether a certain square is currently occupied, and two methods
-    that work in conjunction to determine whether all pieces of a single type have been captured. There is also a method
-    that specifically checks whether a pawn move is valid"""
-
-
-    def __init__(self, team_color, starting_squares_list):
-        """A string of the team color (BLACK or WHITE) and a  list containing the 16 piece starting square coordinates
-        (eg. ‘a1’) will be the passed parameters. The _team_color data member is assigned to the team_color passed
-        parameter, and the _squares_in_use data member will be set equal to this passed list.  The _pieces data member
-        will be a dictionary with piece names as the key (eg. “PAWN7”) and their type (eg. “pawn”), number of times the
-        piece has moved (eg. 3) and current square location (eg. ‘a7’) all in a list as the value. This dictionary is
-        created by iterating through the passed list of starting_spaces to assign each piece with its starting value"""
-
-        self._team_color = team_color
-        self._squares_in_use = starting_squares_list
-
-        self._pieces = {
-            "PAWN1"   : ["pawn", 0],
-            "PAWN2"   : ["pawn", 0],
-            "PAWN3"   : ["pawn", 0],
-            "PAWN4"   : ["pawn", 0],
-            "PAWN5"   : ["pawn", 0],
-            "PAWN6"   : ["pawn", 0],
-            "PAWN7"   : ["pawn", 0],
-            "PAWN8"   : ["pawn", 0],
-            "ROOK1"   : ["rook", 0],
-            "ROOK2"   : ["rook", 0],
-            "KNIGHT1" : ["knight", 0],
-            "KNIGHT2" : ["knight", 0],
-            "BISHOP1" : ["bishop", 0],
-            "BISHOP2" : ["bishop", 0],
-            "QUEEN"   : ["queen", 0],
-            "KING"    : ["king", 0]
-        }
-
-        counter = 0
-        for piece in self._pieces:
-            self._pieces[piece].append(starting_squares_list[counter])
-            counter += 1
-
-
-    def identify_piece_by_location(self, square):
-        """This method will receive a square coordinate (eg. 'a2') and will iterate through the _pieces dictionary until
-        it finds a piece that is on that square. The method will return the name (which is a _pieces key) of that piece"""
-
-        for piece in self._pieces:
-            if self._pieces[piece][2] == square:
-                return piece
-
-
-    def get_piece_type(self, piece_name):
-        """This method will return the piece type given the name of the piece. This information is stored as the first
-        value list item in the _pieces dictionary"""
-
-        return self._pieces[piece_name][0]
-
-
-    def update_piece_location(self, source_square, destination_square):
-        """Updates the location of a single piece in the _pieces dictionary. It takes in the source_square, which are
-        the coordinates (eg. ‘a1’) of where the piece currently is. The other passed parameter is destination_square,
-        which is where the user wants the piece to move. It will iterate through the _pieces dictionary until it finds
-        a current location value that matches the value of source_square. This current location value is changed to
-        that of destination_square. Additionally, update_squares_in_use is called to remove the source_square from
-        the squares_in_use list, and add the destination_square to this list. That piece's number of moves is also
-        increased by one, unless the piece is captured."""
-
-        for piece in self._pieces:
-            if source_square == self._pieces[piece][2]:
-                moving_piece = piece
-
-        self._pieces[moving_piece][2] = destination_square
-        self.update_squares_in_use(source_square, destination_square)
-
-        if destination_square != "CAPTURED":
-            self._pieces[moving_piece][1] += 1
-
-
-    def check_square_for_piece(self, this_square):
-        """Takes in a specific square location (eg. ‘a7’). Returns True if that specific square has that team’s piece
-        on it (is in _squares_in_use). Returns False if that space is not occupied by one of this team’s pieces."""
-
-        for square in self._squares_in_use:
-            if this_square == square:
-                return True
-
-        return False
-
-
-    def update_squares_in_use(self, old_square, new_square):
-        """Takes in the coordinate of square that a piece is already on, and the coordinate of a square that this
-        piece will move to. Removes the old_square coordinate from _squares_in_use list, and adds the new_square
-        coordinate to the squares_in_use list. If new_square is None, then this implies that the piece has been
-        captured. In this case, remove the old_square value from the list, but do not add new_square to the list"""
-
-        self._squares_in_use.remove(old_square)
-
-        if new_square == "CAPTURED":
-            return
-
-        self._squares_in_use.append(new_square)
-
-
-    def check_type_for_captured_pieces(self, piece_type):
-        """This method will iterate through each of the piece types in the _pieces dictionary and checks each piece's
-        location for CAPTURED. If all pieces of one type are captured, then this method will return True. If there still
-        exists pieces on the board of every type, then this method will return False"""
-
-        for piece in self._pieces:
-            if piece_type == self._pieces[piece][0]:
-                if "CAPTURED" != self._pieces[piece][2]:
-                    return False
-
-        return True
-
-
-    def check_for_captured_pieces(self):
-        """This method will call check_type_for_captured_pieces for each of the six chess piece types. If any of these
-        calls returns True (meaning, all pieces of that type are captured), then immediately return True to indicate
-        that all pieces of one type have been captured, and this team has been defeated. Return False if all calls
-        return a False value, indicating that there exists pieces of all type that are still on the board"""
-
-        if self.check_type_for_captured_pieces("pawn") == True:
-            return True
-
-        if self.check_type_for_captured_pieces("rook") == True:
-            return True
-
-        if self.check_type_for_captured_pieces("knight") == True:
-            return True
-
-        if self.check_type_for_captured_pieces("bishop") == True:
-            return True
-
-        if self.check_type_for_captured_pieces("queen") == True:
-            return True
-
-        if self.check_type_for_captured_pieces("king") == True:
-            return True
-
-        return False
-
-
-    def check_pawn_move(self, piece_name, other_team, source_row, source_column, destination_square, destination_row,
-                        destination_column):
-        """This method will check whether the (source_row, source_column) to (destination_row, destination_column) move
-        represents a valid move. First, use the team color to determine whether the move attempts to move backwards,
-        which would be invalid (return False). Then, check that a piece of the opposite team exists on the destination
-        square if the pawn attempts to move diagonally by 1. Return True if both of these conditions are met (valid pawn
-        capture), or return False if not. Next, check for valid non-capture pawn moves If the pawn attempts to move
-        2 spaces forward, it must be the first time that pawn has moved (check moves portion of the pieces dictionary
-        to validate this). Or, the pawn can move just one space forward. Return True if either of these conditions are
-        met. At this point, if the attempted move did not meet any of the above conditions, it is not a valid pawn move
-        and False will be returned."""
-
-        if self._team_color == "WHITE":
-            if destination_column - source_column < 1:
-                return False                        # attempted to move backwards or sideways - invalid move
-
-        else:
-            if source_column - destination_column < 1:
-                return False                        # attempted to move backwards or sideways - invalid move
-
-        # check that a piece from the other team is in the destination square if pawn attempts to move diagonally
-        if abs(destination_row - source_row) == 1 and abs(destination_column - source_column) == 1:
-            if other_team.check_square_for_piece(destination_square) == True:
-                return True
-            else:
-                return False
-
-        if other_team.check_square_for_piece(destination_square) == False and source_row == destination_row:
-            # A pawn can only move two spaces forward if it is the first time that pawn has moved in the game
-            if abs(destination_column - source_column) == 2 and self._pieces[piece_name][1] == 0:
-                return True
-            if abs(destination_column - source_column) == 1:
-                return True
-
-        return False
-
-
-
-class ChessVar:
-    """ ChessVar, in conjunction with ChessTeam, carries out the functions of a Chess (variant form) game. Its data
-    members include _black_team and _white_team, which are both ChessTeam objects, _turn which tracks whoevers turn it
-    is, and _game_state which stores the current state of the game. There are also two static data members dictionaries
-    that contain row letters and their corresponding integer values. The __init__ method is the first place where
-    ChessVar will need to communicate with ChessTeam in order to initialize the two ChessTeam object data members. The
-    ChessVar class has get and set methods for the _turn and _game_state data members. There is a method to check whether
-    a move resulted in a victory (uses ChessTeam methods to determine whether all pieces of a certain type are gone).
-    The majority of these methods in this class are dedicated to determining whether a move (and possibly capture) are
-    valid. Methods from ChessTeam are called on multiple occasions during the process of checking the validity of move
-    in order to determine whether there are pieces on certain squares, and to extract information about pieces being
-    moved or captured."""
-
-    def __init__(self):
-        """ All data members will be private. The _black_team data member will be a ChessTeam object and will need to
-        pass a list of starting square positions of its 16 pieces. The _white_team data member will be a ChessTeam object
-        and will likewise need to pass a list of its 16 starting squares. The _turn data member tracks whose turn it is.
-        _turn will be initialized to “WHITE” since White always goes first in chess. The _game_state data member will
-        track the status of the game. It will be initialized to “UNFINISHED” as the game just started. The letter_to_int
-        and int_to_letters data members use dictionaries to track how each row letter pairs with an integer value, and
-        will be used to translate the row letters into integer values and vice versa for the purpose of checking move
-        validity"""
-
-        black_starting_squares = ["a7", "b7", "c7", "d7", "e7", "f7", "g7", "h7", "a8", "h8", "b8", "g8", "c8", "f8", "d8", "e8"]
-        white_starting_squares = ["a2", "b2", "c2", "d2", "e2", "f2", "g2", "h2", "a1", "h1", "b1", "g1", "c1", "f1", "d1", "e1"]
-        self._black_team = ChessTeam("BLACK", black_starting_squares)
-        self._white_team = ChessTeam("WHITE", white_starting_squares)
-        self._turn = "WHITE"
-        self._game_state = "UNFINISHED"
-
-        self._letter_to_int = {
-                                'a' : 1,
-                                'b' : 2,
-                                'c' : 3,
-                                'd' : 4,
-                                'e' : 5,
-                                'f' : 6,
-                                'g' : 7,
-                                'h' : 8
-                            }
-
-        self._int_to_letter = {
-                                1 : 'a',
-                                2 : 'b',
-                                3 : 'c',
-                                4 : 'd',
-                                5 : 'e',
-                                6 : 'f',
-                                7 : 'g',
-                                8 : 'h'
-                            }
-
-
-    def set_turn(self):
-        """Changes the value of the _turn private data member from WHITE to BLACK or from BLACK to WHITE depending on
-        the current value of _turn"""
-
-        if self._turn == "WHITE":
-            self._turn = "BLACK"
-
-        else:
-            self._turn = "WHITE"
-
-
-    def get_game_state(self):
-        """Returns the value of the _game_state private data member, which can be UNFINISHED, WHITE_WON or BLACK_WON"""
-
-        return self._game_state
-
-
-    def set_game_state(self, new_state):
-        """ Changes the value of the _game_state data member. Expected to only be called by the check_for_victory method,
-         and only once per game. It must receive either BLACK_WON or WHITE_WON, which will be assigned as the new value
-         for _game_state """
-
-        self._game_state = new_state
-
-
-    def generate_pawn_path(self, source_row, source_column, destination_column):
-        """Given the (source_row, source_column) and (destination_row, destination_column) coordinates, this method will
-        return a list of each square (eg. 'a2') that the pawn passes on its way to the destination square. This list does
-        not include the source and destination squares"""
-
-        pawn_path = []
-        if source_column - destination_column == 2:     # A black pawn is moving two spaces on its first turn
-            this_square = self._int_to_letter[source_row] + str(source_column-1)
-            pawn_path.append(this_square)
-
-        if source_column - destination_column == -2:    # A white pawn is moving two spaces on its first turn
-            this_square = self._int_to_letter[source_row] + str(source_column+1)
-            pawn_path.append(this_square)
-
-        return pawn_path
-
-
-    def check_rook_move(self, source_row, source_column, destination_row, destination_column):
-        """This method will check whether the passed (source_row, source_column) and (destination_row, destination_column)
-         coordinates represents a valid move for a rook. One (but not both) of these conditions must be true: either the
-         two column values of source_square and destination_square must be equivalent, or the two row values. Returns True
-         if it is a valid move, False otherwise."""
-
-        if source_row == destination_row and source_column != destination_column:
-            return True
-
-        if source_row != destination_row and source_column == destination_column:
-            return True
-
-        return False
-
-
-    def generate_rook_path(self, source_row, source_column, destination_row, destination_column):
-        """Given the (source_row, source_column) and (destination_row, destination_column) coordinates, this method will
-        return a list of each square (eg. 'a2') that the rook passes on its way to the destination square. This list does
-        not include the source and destination squares"""
-
-        rook_path = []
-        if source_row == destination_row:
-            this_row = self._int_to_letter[source_row]
-            if source_column > destination_column:      # rook is moving backwards (from white side POV)
-                this_column = source_column - 1
-                while this_column > destination_column:
-                    this_square = this_row + str(this_column)
-                    rook_path.append(this_square)
-                    this_column -= 1
-
-            else:                                       # rook is moving forwards (from white side POV)
-                this_column = source_column + 1
-                while this_column < destination_column:
-                    this_square = this_row + str(this_column)
-                    rook_path.append(this_square)
-                    this_column += 1
-        else:
-            this_column = str(source_column)
-            if source_row > destination_row:            # rook is moving to the left (from white side POV)
-                this_row = source_row - 1
-                while this_row > destination_row:
-                    this_square = self._int_to_letter[this_row] + this_column
-                    rook_path.append(this_square)
-                    this_row -= 1
-            else:                                       # rook is moving to the right (from white side POV)
-                this_row = source_row + 1
-                while this_row < destination_row:
-                    this_square = self._int_to_letter[this_row] + this_column
-                    rook_path.append(this_square)
-                    this_row += 1
-
-        return rook_path
-
-
-    def check_knight_move(self, source_row, source_column, destination_row, destination_column):
-        """This method will check whether the passed (source_row, source_column) and (destination_row, destination_column)
-        coordinates represent a valid move for a Knight. One of the following conditions must be met. If the source
-        coordinate is (x,y), then the destination coordinate can only be (x +/- 1, y +/- 2) or (x +/- 2, y +/- 1) in
-        order for the move to be valid. Return True if valid move, False otherwise."""
-
-        if abs(source_row - destination_row) == 1 and abs(source_column - destination_column) == 2:
-            return True
-
-        if abs(source_row - destination_row) == 2 and abs(source_column - destination_column) == 1:
-            return True
-
-        return False
-
-
-    def check_bishop_move(self, source_row, source_column, destination_row, destination_column):
-        """This method will check whether the passed (source_row, source_column) and (destination_row, destination_column)
-        coordinates represent a valid move for a Bishop. If the source coordinate is (x,y) and p is some integer, then
-        the destination coordinate can only be (x +/- p, y +/- p) in order for the move to be valid. Return True if
-        valid move, False otherwise."""
-
-        if abs(source_row - destination_row) == abs(source_column - destination_column):
-            return True
-
-        return False
-
-
-    def generate_bishop_path(self, source_row, source_column, destination_row, destination_column):
-        """Given the (source_row, source_column) and (destination_row, destination_column) coordinates, this method will
-        return a list of each square (eg. 'a2') that the bishop passes on its way to the destination square. This list does
-        not include the source and destination squares"""
-
-        bishop_path = []
-
-        if source_row > destination_row and source_column > destination_column:     # moving backward, left (white POV)
-            this_row = source_row - 1
-            this_column = source_column - 1
-            while this_row > destination_row:
-                this_square = self._int_to_letter[this_row] + str(this_column)
-                bishop_path.append(this_square)
-                this_row -= 1
-                this_column -= 1
-
-        if source_row > destination_row and source_column < destination_column:     # moving backward, right (white POV)
-            this_row = source_row - 1
-            this_column = source_column + 1
-            while this_row > destination_row:
-                this_square = self._int_to_letter[this_row] + str(this_column)
-                bishop_path.append(this_square)
-                this_row -= 1
-                this_column += 1
-
-        if source_row < destination_row and source_column > destination_column:     # moving forward, left (white POV)
-            this_row = source_row + 1
-            this_column = source_column - 1
-            while this_row < destination_row:
-                this_square = self._int_to_letter[this_row] + str(this_column)
-                bishop_path.append(this_square)
-                this_row += 1
-                this_column -= 1
-
-        if source_row < destination_row and source_column < destination_column:     # moving forward, right (white POV)
-            this_row = source_row + 1
-            this_column = source_column + 1
-            while this_row < destination_row:
-                this_square = self._int_to_letter[this_row] + str(this_column)
-                bishop_path.append(this_square)
-                this_row += 1
-                this_column += 1
-
-        return bishop_path
-
-
-    def check_queen_move(self, source_row, source_column, destination_row, destination_column):
-        """This method will check whether the passed (source_row, source_column) and (destination_row, destination_column)
-        coordinates represent a valid move for a Queen. This method will call check_rook_move and check_bishop_move. If
-        one of these method calls returns True, then the move is valid (the queen can move like a rook or a bishop).
-        Return true if valid move, False otherwise"""
-
-        if self.check_rook_move(source_row, source_column, destination_row, destination_column) == True:
-            return True
-
-        if self.check_bishop_move(source_row, source_column, destination_row, destination_column) == True:
-            return True
-
-        return False
-
-
-    def generate_queen_path(self, source_row, source_column, destination_row, destination_column):
-        """Given the (source_row, source_column) and (destination_row, destination_column) coordinates, this method will
-        return a list of each square (eg. 'a2') that the queen passes on its way to the destination square. This list does
-        not include the source and destination squares"""
-
-        queen_path = self.generate_bishop_path(source_row, source_column, destination_row, destination_column)
-        if queen_path == []:
-            queen_path = self.generate_rook_path(source_row, source_column, destination_row, destination_column)
-
-        return queen_path
-
-
-    def check_king_move(self, source_row, source_column, destination_row, destination_column):
-        """This method will check whether the passed (source_row, source_column) and (destination_row, destination_column)
-        coordinates represent a valid move for a King. If the source coordinate is (x,y), then the destination coordinate
-        can only be (x +/- 1 , y) or (x , y +/- 1) or (x +/- 1, y +/- 1) for the move to be valid. Return True is the
-        move is valid, False otherwise."""
-
-        if abs(source_row - destination_row) == 1 and source_column == destination_column:
-            return True
-
-        if source_row == destination_row and abs(source_column - destination_column) == 1:
-            return True
-
-        if abs(source_row - destination_row) == 1 and abs(source_column - destination_column) == 1:
-            return True
-
-        return False
-
-
-    def check_for_victory(self):
-        """This method will call the ChessTeam check_for_captured_pieces method for whatever team is passed to this
-         method. If this method is called, that means that one of the passed team's pieces has just been captured.
-         If check_for_captured_pieces returns True, that means that all pieces of one type have been captured, and
-         the other team has won. Call set_game_state to update the game state accordingly, and return True. A False
-         return implies there still exists at least one piece of each type on the board for that team - return False"""
-
-        if self._turn == "BLACK":
-            if self._white_team.check_for_captured_pieces() == True:
-                self.set_game_state("BLACK_WON")
-                return True
-            else:
-                return False
-
-        else:
-            if self._black_team.check_for_captured_pieces() == True:
-                self.set_game_state("WHITE_WON")
-                return True
-            else:
-                return False
-
-
-    def check_path_for_pieces(self, list_of_squares):
-        """This method will be called by the is_valid_move method. It will receive a list of square (coordinates). Then,
-        it will need to iterate through each square in the list and call check_square_for_pieces() each iteration for both
-        teams. If check_square_for_pieces() ever returns True, then there exists some piece in the path of the move that
-        is being attempted. Return True if any piece is detected, False otherwise"""
-
-        for square in list_of_squares:
-            if self._white_team.check_square_for_piece(square) == True:
-                return True
-            if self._black_team.check_square_for_piece(square) == True:
-                return True
-
-        return False
-
-
-    def check_if_turn_team_piece_is_being_moved(self, source_square):
-        """This method will be called by make_move to determine whether the attempted move is moving a piece of the
-        team whose turn it is. Return True if a turn team's piece is on the source square, return False otherwise"""
-
-        if self._turn == "WHITE":
-            if self._white_team.check_square_for_piece(source_square) == True:
-                return True
-
-        if self._turn == "BLACK":
-            if self._black_team.check_square_for_piece(source_square) == True:
-                return True
-
-        return False
-
-
-    def check_piece_type_for_valid_move(self, piece_name, piece_type, source_row, source_column, destination_square,
-                           destination_row, destination_column):
-        """This method uses the passed piece_type information to call the correct method that will check whether the
-        attempted move is valid based on that piece type. This method returns what is returned by that specifically
-        called method. Will return True if the move is valid based on the piece type movement restrictions, return False
-        if the move is not valid for that piece type"""
-
-        if piece_type == "pawn":
-            if self._turn == "WHITE":
-                return self._white_team.check_pawn_move(piece_name, self._black_team, source_row, source_column,
-                                                        destination_square, destination_row, destination_column)
-            else:
-                return self._black_team.check_pawn_move(piece_name, self._white_team, source_row, source_column,
-                                                         destination_square, destination_row, destination_column)
-
-        if piece_type == "rook":
-            return self.check_rook_move(source_row, source_column, destination_row, destination_column)
-
-        if piece_type == "knight":
-            return self.check_knight_move(source_row, source_column, destination_row, destination_column)
-
-        if piece_type == "bishop":
-            return self.check_bishop_move(source_row, source_column, destination_row, destination_column)
-
-        if piece_type == "queen":
-            return self.check_queen_move(source_row, source_column, destination_row, destination_column)
-
-        else:
-            return self.check_king_move(source_row, source_column, destination_row, destination_column)
-
-
-    def generate_piece_path(self, piece_type, source_row, source_column, destination_row, destination_column):
-        """This method will call the appropriate piece type-specific path generator. Will only be used by is_valid_move
-        to check generate the path of a pawn, rook, bishop, or queen that can be used to validate that there are no pieces
-        along this path that would result in an invalid move"""
-
-        if piece_type == "rook":
-            piece_path = self.generate_rook_path(source_row, source_column, destination_row, destination_column)
-        elif piece_type == "bishop":
-            piece_path = self.generate_bishop_path(source_row, source_column, destination_row, destination_column)
-        elif piece_type == "queen":
-            piece_path = self.generate_queen_path(source_row, source_column, destination_row, destination_column)
-        else:
-            piece_path = self.generate_pawn_path(source_row, source_column, destination_column)
-
-        return piece_path
-
-
-    def check_path_for_pieces(self, piece_path):
-        """This method will receive a list whose elements are the square coordinates (eg. 'a2') that a piece passes through
-        on its way to the destination square. This method will iterate through each square in the list and check whether
-        pieces from either the black or white team exist in these squares. If a piece is ever on one of these squares,
-        then return True (a piece is in the path, not a valid move). Otherwise, return False (path is clear of pieces)"""
-
-        for square in piece_path:
-            if self._white_team.check_square_for_piece(square) == True:
-                return True
-            if self._black_team.check_square_for_piece(square) == True:
-                return True
-
-        return False
-
-
-    def process_capture(self, destination_square):
-        """If a valid capture has occurred, then this method will update the location of the captured piece to reflect that
-        it has been captured, then will call the check_for_victory method to determine whether this capture has resulted
-        in a victory"""
-
-        if self._turn == "WHITE":
-            self._black_team.update_piece_location(destination_square, "CAPTURED")
-
-        else:
-            self._white_team.update_piece_location(destination_square, "CAPTURED")
-
-        self.check_for_victory()
-
-
-    def check_for_valid_capture(self, destination_square):
-        """This method will be called by is_valid_move to determine whether a capture is valid. If a piece attempts to
-        capture one of its own pieces, then the capture is not valid and the entire move is not valid. If the piece is
-        moving to an empty square, return True to indicate there are no issues with an invalid capture. If the piece is
-        capturing a piece from the other team (valid capture), then call process_capture to update the location of the
-        captured piece and check whether this capture resulted in a victory"""
-
-        if self._turn == "WHITE":
-            if self._white_team.check_square_for_piece(destination_square) == True:     # attempting to capture own piece
-                return False
-            if self._black_team.check_square_for_piece(destination_square) == False:    # piece is moving to an empty space
-                return True
-            else:
-                self.process_capture(destination_square)
-                return True
-
-        else:
-            if self._black_team.check_square_for_piece(destination_square) == True:     # attempting to capture own piece
-                return False
-            if self._white_team.check_square_for_piece(destination_square) == False:    # piece is moving to an empty space
-                return True
-            else:
-                self.process_capture(destination_square)
-                return True
-
-
-    def is_valid_move(self, piece_name, piece_type, source_square, source_row, source_column, destination_square,
-                           destination_row, destination_column):
-        """This method will be called by make_move to determine whether the move is valid based on various restrictions.
-        First, is_valid_move calls the specific method that will determine whether the movement matches how that specific
-        piece type can move. Next, is_valid_move validates that a pawn, rook, bishop, or queen does not attempt to move
-        through other pieces. Finally, is_valid_move calls the is_valid_capture method to verify that the piece does not
-        attempt to capture itself. If any of these tests fail, then is_valid_move will immediately return False, indicating
-        and invalid move. If all the tests pass, then update the location of the piece that has moved, change the turn,
-        and return True"""
-
-        if self.check_piece_type_for_valid_move(piece_name, piece_type, source_row, source_column, destination_square,
-                           destination_row, destination_column) == False:
-            return False
-
-        # if the piece is a pawn, rook, bishop, or queen, it is necessary to check if these pieces attempt to move
-        # through existing pieces on their way to the destination square
-        if piece_type != "king" and piece_type != "knight":
-            piece_path = self.generate_piece_path(piece_type, source_row, source_column, destination_row, destination_column)
-            if piece_path != []:
-                # If check_path_for_pieces returns True, this means there exists a piece along the path, not valid
-                if self.check_path_for_pieces(piece_path) == True:
-                    return False
-
-        # Call is_valid_capture to verify that a piece does not attempt to capture itself. is_valid_capture will also
-        # modify the locations of a captured piece and check for a victory in the case that a piece is captured
-        if self.check_for_valid_capture(destination_square) == False:
-            return False
-
-        # all the tests have passed. This was a valid move. Now, call the update_piece_location method to update the
-        # location of the moving piece. Then call set_turn to switch the turn to the other team.
-        if self._turn == "WHITE":
-            self._white_team.update_piece_location(source_square, destination_square)
-        else:
-            self._black_team.update_piece_location(source_square, destination_square)
-
-        self.set_turn()
-        return True
-
-
-    def make_move(self, source_square, destination_square):
-        """This method will receive coordinates (eg. 'a2') for the source square and the destination square, in that
-        order. First, make_move will confirm that the move starts with square that contains a piece from the team whose
-        turn it is. If this test passes, then the method will extract the integer values for the source row, source column
-        destination row, and destination column. Then, the method will call is_valid_move, which does all the heavy lifting
-        for determining whether a move is valid based on the type of piece being moved. is_valid_move also updates the
-        moving (and captured) piece location, checks for victory, and changes the turn if a move is valid. make_move will
-        return True is the move (and capture, if applicable) is indeed valid, False is not valid"""
-
-        # return False if the game is over, and someone has already won
-        if self._game_state != "UNFINISHED":
-            return False
-
-        # not a valid move if the turn does not start with moving a piece from the team whose turn it is
-        if self.check_if_turn_team_piece_is_being_moved(source_square) == False:
-            return False
-
-        # extract the piece name and type of the piece that is moving
-        if self._turn == "WHITE":
-            piece_name = self._white_team.identify_piece_by_location(source_square)
-            piece_type = self._white_team.get_piece_type(piece_name)
-        else:
-            piece_name = self._black_team.identify_piece_by_location(source_square)
-            piece_type = self._black_team.get_piece_type(piece_name)
-
-        # Assign specific integer values for the source row and column, and for the destination row and column
-        source_row = self._letter_to_int[source_square[0]]
-        source_column = int(source_square[1])
-        destination_row = self._letter_to_int[destination_square[0]]
-        destination_column = int(destination_square[1])
-
-        return(self.is_valid_move(piece_name, piece_type, source_square, source_row, source_column, destination_square,
-                           destination_row, destination_column))
\ No newline at end of file
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: December 7, 2023
+# Description: Programs a variant form of chess. In this form of chess, a team wins once all that team has captured
+# all of the pieces of a single type. The board starting position and the restrictions on each piece type movement
+# remains the same as standard chess. Special moves, such as castling, en passant, and pawn promotion, are not
+# permitted in this version of chess. There is no check or checkmate. The ChessVar class contains private data members
+# for two ChessTeam objects (Black and White team), a data member to keep track of whose turn it is, and a data
+# member to track the state of the game (unfinished vs. a team has won). The ChessVar methods contain various get
+# and set methods for its data members, and methods for making and validating moves and captures. The ChessTeam
+# class has a dictionary data member to keep track of a team's pieces and their specific locations, and bitboards that
+# track the current squares that are occupied by that team's pieces. The ChessTeam methods include various get and set
+# methods for its data members, and methods to check whether pieces of one type have all been captured. Both classes
+# run on the bitboard board core in ChessBoard.py: each team keeps one 64-bit mask per piece type and one mask of all
+# its occupied squares, so checking whether a square is occupied is a single bitwise AND
+
+from ChessBoard import PIECE_TYPES, INDEX_TO_SQUARE, SQUARE_TO_INDEX, SQUARE_MASKS, squares_to_mask, mask_to_squares, \
+    mask_to_indexes, piece_targets, BETWEEN, ZOBRIST_PIECE_KEYS, ZOBRIST_UNMOVED_PAWN_KEYS, ZOBRIST_BLACK_TO_MOVE
+from ChessPosition import Position
+
+
+# names of each team's 16 pieces, in the fixed order used by square and move lists, and the type of each
+PIECE_NAMES = ("PAWN1", "PAWN2", "PAWN3", "PAWN4", "PAWN5", "PAWN6", "PAWN7", "PAWN8", "ROOK1", "ROOK2", "KNIGHT1",
+               "KNIGHT2", "BISHOP1", "BISHOP2", "QUEEN", "KING")
+PIECE_NAME_TYPES = ("pawn",) * 8 + ("rook", "rook", "knight", "knight", "bishop", "bishop", "queen", "king")
+
+# translate the row letters into integer values and vice versa for the purpose of checking move validity. They are
+# shared by every game
+LETTER_TO_INT = {
+                    'a' : 1,
+                    'b' : 2,
+                    'c' : 3,
+                    'd' : 4,
+                    'e' : 5,
+                    'f' : 6,
+                    'g' : 7,
+                    'h' : 8
+                }
+
+INT_TO_LETTER = {
+                    1 : 'a',
+                    2 : 'b',
+                    3 : 'c',
+                    4 : 'd',
+                    5 : 'e',
+                    6 : 'f',
+                    7 : 'g',
+                    8 : 'h'
+                }
+
+
+class ChessTeam:
+    """The ChessTeam class holds information about a team’s pieces. Its data members include the team color, a
+    dictionary that stores each piece by name (key) and each piece’s current location, type, and number of times moved
+    (value, which is a list with these three information pieces), and the bitboards that describe where the pieces are.
+    There is one bitboard per piece type, one bitboard of every square occupied by this team, one bitboard of the pawns
+    that have not moved yet, and a 64 item list that maps a square index to the name of the piece standing on it. The
+    _snapshot data member caches the team's last exported snapshot (see get_snapshot) until a piece moves. This class
+    has get and set methods for its data members, a method that checks the occupied squares to determine whether a
+    certain square is currently occupied, and two methods that work in conjunction to determine whether all pieces of a
+    single type have been captured. There is also a method that specifically checks whether a pawn move is valid"""
+
+
+    def __init__(self, team_color, starting_squares_list=None, moves_list=None, snapshot=None, template=None):
+        """A string of the team color (BLACK or WHITE) and a  list containing the 16 piece starting square coordinates
+        (eg. ‘a1’) will be the passed parameters. A square may also be CAPTURED for a piece that is not on the board,
+        and an optional list of 16 move counts can be passed to set up a game that is already under way. The
+        _team_color data member is assigned to the team_color passed parameter. The squares and move counts are then
+        handed to set_snapshot, which builds the _pieces dictionary and the bitboards. A snapshot made by get_snapshot
+        can be passed instead of the squares and moves, which skips translating square strings, and another ChessTeam
+        can be passed as template, whose data members are then copied with copy_from instead of being built"""
+
+        self._team_color = team_color
+
+        if template is not None:
+            self.copy_from(template)
+            return
+
+        if snapshot is None:
+            squares = tuple(None if square == "CAPTURED" else SQUARE_TO_INDEX[square]
+                            for square in starting_squares_list)
+            if moves_list is None:
+                moves = (0,) * len(PIECE_NAMES)
+            else:
+                moves = tuple(moves_list)
+            snapshot = (squares, moves)
+
+        self.set_snapshot(snapshot)
+
+
+    def get_snapshot(self):
+        """Returns the team's pieces as an immutable (square indexes, move counts) pair of 16 item tuples in piece order,
+        where the square index of a captured piece is None. The pair is cached and handed out again until one of the
+        team's pieces moves or is captured, so snapshots of an unchanged team are shared rather than rebuilt"""
+
+        if self._snapshot is None:
+            pieces = self._pieces
+            squares = tuple(None if pieces[piece_name][2] == "CAPTURED" else SQUARE_TO_INDEX[pieces[piece_name][2]]
+                            for piece_name in PIECE_NAMES)
+            moves = tuple(pieces[piece_name][1] for piece_name in PIECE_NAMES)
+            self._snapshot = (squares, moves)
+
+        return self._snapshot
+
+
+    def set_snapshot(self, snapshot):
+        """Replaces the team's pieces with the ones in the passed (square indexes, move counts) snapshot (see
+        get_snapshot). The _pieces dictionary holds each piece's type, number of moves and square, and while it is
+        built each piece is also placed on the _bitboards masks for its type, on the _occupied mask, and in the
+        _piece_at list, and counted in _piece_counts. _empty_types counts the piece types that have no pieces left"""
+
+        squares, moves = snapshot
+        self._pieces = {}
+        self._bitboards = {piece_type: 0 for piece_type in PIECE_TYPES}
+        self._piece_counts = {piece_type: 0 for piece_type in PIECE_TYPES}
+        self._occupied = 0
+        self._unmoved_pawns = 0
+        self._piece_at = [None] * 64
+
+        for piece_name, piece_type, index, piece_moves in zip(PIECE_NAMES, PIECE_NAME_TYPES, squares, moves):
+            if index is None:
+                self._pieces[piece_name] = [piece_type, piece_moves, "CAPTURED"]
+                continue
+
+            self._pieces[piece_name] = [piece_type, piece_moves, INDEX_TO_SQUARE[index]]
+            self._bitboards[piece_type] |= SQUARE_MASKS[index]
+            self._piece_counts[piece_type] += 1
+            self._occupied |= SQUARE_MASKS[index]
+            self._piece_at[index] = piece_name
+            if piece_type == "pawn" and piece_moves == 0:
+                self._unmoved_pawns |= SQUARE_MASKS[index]
+
+        self._empty_types = 0
+        for piece_type in PIECE_TYPES:
+            if self._piece_counts[piece_type] == 0:
+                self._empty_types += 1
+
+        self._snapshot = snapshot
+
+
+    def copy_from(self, other_team):
+        """Makes this team an independent copy of the passed ChessTeam by copying its data members directly: the
+        bitboards and counters are plain integers, so only the _pieces lists, the two small dictionaries and the
+        _piece_at list need copying. This is several times faster than building the team again from a snapshot"""
+
+        self._team_color = other_team._team_color
+        self._pieces = {piece_name: list(piece) for piece_name, piece in other_team._pieces.items()}
+        self._bitboards = dict(other_team._bitboards)
+        self._piece_counts = dict(other_team._piece_counts)
+        self._occupied = other_team._occupied
+        self._unmoved_pawns = other_team._unmoved_pawns
+        self._piece_at = list(other_team._piece_at)
+        self._empty_types = other_team._empty_types
+        self._snapshot = other_team._snapshot
+
+
+    def restore_from(self, other_team):
+        """Makes this team's pieces the same as the passed ChessTeam's, of the same color, by overwriting this team's
+        own lists and dictionaries in place rather than making new ones, which is the cheapest way to put a team back
+        in a known position"""
+
+        pieces = self._pieces
+        for piece_name, piece in other_team._pieces.items():
+            pieces[piece_name][:] = piece
+        self._bitboards.update(other_team._bitboards)
+        self._piece_counts.update(other_team._piece_counts)
+        self._occupied = other_team._occupied
+        self._unmoved_pawns = other_team._unmoved_pawns
+        self._piece_at[:] = other_team._piece_at
+        self._empty_types = other_team._empty_types
+        self._snapshot = other_team._snapshot
+
+
+    def get_piece_names(self):
+        """Returns a list of the names of this team's 16 pieces (eg. "PAWN1"), always in the same order"""
+
+        return list(self._pieces)
+
+
+    def get_piece_location(self, piece_name):
+        """Returns the square (eg. 'a2') the named piece is on, or CAPTURED if it has been captured. This information is
+        stored as the third value list item in the _pieces dictionary"""
+
+        return self._pieces[piece_name][2]
+
+
+    def get_team_color(self):
+        """Returns the team color, which is either BLACK or WHITE"""
+
+        return self._team_color
+
+
+    def get_occupied(self):
+        """Returns the bitboard of every square that is currently occupied by one of this team's pieces"""
+
+        return self._occupied
+
+
+    def get_bitboard(self, piece_type):
+        """Returns the bitboard of every square that is currently occupied by this team's pieces of the passed type"""
+
+        return self._bitboards[piece_type]
+
+
+    def get_unmoved_pawns(self):
+        """Returns the bitboard of the squares of this team's pawns that have not moved yet (and so may move two squares
+        forward)"""
+
+        return self._unmoved_pawns
+
+
+    def get_squares_in_use(self):
+        """Returns a list of the squares (eg. 'a2') that are currently occupied by this team's pieces"""
+
+        return mask_to_squares(self._occupied)
+
+
+    def identify_piece_by_location(self, square):
+        """This method will receive a square coordinate (eg. 'a2') and will return the name (which is a _pieces key) of
+        the piece that is on that square, or None if this team has no piece there"""
+
+        return self._piece_at[SQUARE_TO_INDEX[square]]
+
+
+    def identify_piece_by_index(self, index):
+        """Same as identify_piece_by_location, but receives the square index (0-63) instead of the square coordinate"""
+
+        return self._piece_at[index]
+
+
+    def get_piece_type(self, piece_name):
+        """This method will return the piece type given the name of the piece. This information is stored as the first
+        value list item in the _pieces dictionary"""
+
+        return self._pieces[piece_name][0]
+
+
+    def get_piece_moves(self, piece_name):
+        """This method will return the number of times the named piece has moved. This information is stored as the
+        second value list item in the _pieces dictionary"""
+
+        return self._pieces[piece_name][1]
+
+
+    def move_piece(self, source_index, destination_index):
+        """Moves the piece on the source_index square to the destination_index square. The bitboard of the piece type
+        and the _occupied bitboard both have the source bit cleared and the destination bit set, the _piece_at list and
+        the _pieces dictionary are updated with the new location, and the piece's number of moves is increased by one.
+        The destination square is expected to be empty of this team's pieces"""
+
+        self._snapshot = None
+        piece_name = self._piece_at[source_index]
+        piece = self._pieces[piece_name]
+        move_mask = SQUARE_MASKS[source_index] | SQUARE_MASKS[destination_index]
+
+        self._bitboards[piece[0]] ^= move_mask
+        self._occupied ^= move_mask
+        self._unmoved_pawns &= ~SQUARE_MASKS[source_index]
+        self._piece_at[source_index] = None
+        self._piece_at[destination_index] = piece_name
+        piece[2] = INDEX_TO_SQUARE[destination_index]
+        piece[1] += 1
+
+        return piece_name
+
+
+    def remove_piece(self, index):
+        """Removes the piece on the passed square index from the board because it has been captured. Its bits are
+        cleared from the bitboards, its type's live piece counter goes down by one, and its location in the _pieces
+        dictionary becomes CAPTURED. Returns the name of the captured piece"""
+
+        self._snapshot = None
+        piece_name = self._piece_at[index]
+        piece = self._pieces[piece_name]
+
+        self._bitboards[piece[0]] &= ~SQUARE_MASKS[index]
+        self._occupied &= ~SQUARE_MASKS[index]
+        self._piece_counts[piece[0]] -= 1
+        if self._piece_counts[piece[0]] == 0:
+            self._empty_types += 1
+        self._unmoved_pawns &= ~SQUARE_MASKS[index]
+        self._piece_at[index] = None
+        piece[2] = "CAPTURED"
+
+        return piece_name
+
+
+    def unmove_piece(self, source_index, destination_index, previous_moves):
+        """Takes back a move of this team's piece by moving it from source_index (where it is now) back to
+        destination_index (where it came from) and setting its number of moves back to previous_moves. A pawn that had
+        not moved before the move taken back is marked as unmoved again"""
+
+        self._snapshot = None
+        piece_name = self._piece_at[source_index]
+        piece = self._pieces[piece_name]
+        move_mask = SQUARE_MASKS[source_index] | SQUARE_MASKS[destination_index]
+
+        self._bitboards[piece[0]] ^= move_mask
+        self._occupied ^= move_mask
+        self._piece_at[source_index] = None
+        self._piece_at[destination_index] = piece_name
+        piece[2] = INDEX_TO_SQUARE[destination_index]
+        piece[1] = previous_moves
+
+        if previous_moves == 0 and piece[0] == "pawn":
+            self._unmoved_pawns |= SQUARE_MASKS[destination_index]
+
+
+    def restore_piece(self, piece_name, index):
+        """Puts a captured piece back on the board at the passed square index and adds it back to its type's live piece
+        counter. The piece keeps the number of moves it had when it was captured"""
+
+        self._snapshot = None
+        piece = self._pieces[piece_name]
+
+        self._bitboards[piece[0]] |= SQUARE_MASKS[index]
+        self._occupied |= SQUARE_MASKS[index]
+        if self._piece_counts[piece[0]] == 0:
+            self._empty_types -= 1
+        self._piece_counts[piece[0]] += 1
+        self._piece_at[index] = piece_name
+        piece[2] = INDEX_TO_SQUARE[index]
+
+        if piece[1] == 0 and piece[0] == "pawn":
+            self._unmoved_pawns |= SQUARE_MASKS[index]
+
+
+    def update_piece_location(self, source_square, destination_square):
+        """Updates the location of a single piece in the _pieces dictionary. It takes in the source_square, which are
+        the coordinates (eg. ‘a1’) of where the piece currently is. The other passed parameter is destination_square,
+        which is where the user wants the piece to move, or CAPTURED if the piece has been captured. The piece is found
+        through the _piece_at list, and move_piece or remove_piece updates its location and the bitboards. That piece's
+        number of moves is also increased by one, unless the piece is captured."""
+
+        if destination_square == "CAPTURED":
+            self.remove_piece(SQUARE_TO_INDEX[source_square])
+        else:
+            self.move_piece(SQUARE_TO_INDEX[source_square], SQUARE_TO_INDEX[destination_square])
+
+
+    def check_square_for_piece(self, this_square):
+        """Takes in a specific square location (eg. ‘a7’). Returns True if that specific square has that team’s piece
+        on it (its bit is set in _occupied). Returns False if that space is not occupied by one of this team’s pieces,
+        or is not a square on the board."""
+
+        if this_square not in SQUARE_TO_INDEX:
+            return False
+
+        return self._occupied & SQUARE_MASKS[SQUARE_TO_INDEX[this_square]] != 0
+
+
+    def update_squares_in_use(self, old_square, new_square):
+        """Takes in the coordinate of square that a piece is already on, and the coordinate of a square that this
+        piece will move to. The piece on old_square is moved to new_square on the bitboards. If new_square is CAPTURED,
+        then this implies that the piece has been captured. In this case, the piece is removed from the bitboards"""
+
+        self.update_piece_location(old_square, new_square)
+
+
+    def get_piece_count(self, piece_type):
+        """Returns the number of this team's pieces of the passed type that have not been captured (eg. 2 for "knight"
+        at the start of the game). The count is kept up to date by remove_piece and restore_piece"""
+
+        return self._piece_counts[piece_type]
+
+
+    def check_type_for_captured_pieces(self, piece_type):
+        """This method checks the live piece counter of the passed piece type. If all pieces of one type are captured,
+        the counter is 0 and this method will return True. If there still exists pieces on the board of that type, then
+        this method will return False"""
+
+        return self._piece_counts[piece_type] == 0
+
+
+    def check_for_captured_pieces(self):
+        """This method returns True if all pieces of any one type have been captured, meaning this team has been
+        defeated. Rather than checking each of the six piece types, it reads the _empty_types counter, which remove_piece
+        and restore_piece update whenever the count of a type reaches or leaves 0. Return False if there exists pieces
+        of all types that are still on the board"""
+
+        return self._empty_types > 0
+
+
+    def check_pawn_move(self, piece_name, other_team, source_row, source_column, destination_square, destination_row,
+                        destination_column):
+        """This method will check whether the (source_row, source_column) to (destination_row, destination_column) move
+        represents a valid move. First, use the team color to determine whether the move attempts to move backwards,
+        which would be invalid (return False). Then, check that a piece of the opposite team exists on the destination
+        square if the pawn attempts to move diagonally by 1. Return True if both of these conditions are met (valid pawn
+        capture), or return False if not. Next, check for valid non-capture pawn moves If the pawn attempts to move
+        2 spaces forward, it must be the first time that pawn has moved (check moves portion of the pieces dictionary
+        to validate this). Or, the pawn can move just one space forward. Return True if either of these conditions are
+        met. At this point, if the attempted move did not meet any of the above conditions, it is not a valid pawn move
+        and False will be returned."""
+
+        if self._team_color == "WHITE":
+            if destination_column - source_column < 1:
+                return False                        # attempted to move backwards or sideways - invalid move
+
+        else:
+            if source_column - destination_column < 1:
+                return False                        # attempted to move backwards or sideways - invalid move
+
+        # check that a piece from the other team is in the destination square if pawn attempts to move diagonally
+        if abs(destination_row - source_row) == 1 and abs(destination_column - source_column) == 1:
+            if other_team.check_square_for_piece(destination_square) == True:
+                return True
+            else:
+                return False
+
+        if other_team.check_square_for_piece(destination_square) == False and source_row == destination_row:
+            # A pawn can only move two spaces forward if it is the first time that pawn has moved in the game
+            if abs(destination_column - source_column) == 2 and self._pieces[piece_name][1] == 0:
+                return True
+            if abs(destination_column - source_column) == 1:
+                return True
+
+        return False
+
+
+
+def compute_position_hash(white_team, black_team, turn):
+    """Computes the Zobrist hash of the position made up of the two passed ChessTeams and the passed turn from scratch,
+    by XORing together the key of every piece on its square, the key of every pawn that has not moved yet, and the
+    black-to-move key if it is black's turn"""
+
+    position_hash = 0
+    for team in (white_team, black_team):
+        team_color = team.get_team_color()
+        for piece_type in PIECE_TYPES:
+            for index in mask_to_indexes(team.get_bitboard(piece_type)):
+                position_hash ^= ZOBRIST_PIECE_KEYS[team_color][piece_type][index]
+        for index in mask_to_indexes(team.get_unmoved_pawns()):
+            position_hash ^= ZOBRIST_UNMOVED_PAWN_KEYS[team_color][index]
+
+    if turn == "BLACK":
+        position_hash ^= ZOBRIST_BLACK_TO_MOVE
+
+    return position_hash
+
+
+# the starting squares of each team's 16 pieces, in PIECE_NAMES order
+WHITE_STARTING_SQUARES = ("a2", "b2", "c2", "d2", "e2", "f2", "g2", "h2", "a1", "h1", "b1", "g1", "c1", "f1", "d1", "e1")
+BLACK_STARTING_SQUARES = ("a7", "b7", "c7", "d7", "e7", "f7", "g7", "h7", "a8", "h8", "b8", "g8", "c8", "f8", "d8", "e8")
+
+# both teams in the starting position, built once and copied into every new or reset game, and the starting hash
+STARTING_TEAMS = {"WHITE": ChessTeam("WHITE", WHITE_STARTING_SQUARES),
+                  "BLACK": ChessTeam("BLACK", BLACK_STARTING_SQUARES)}
+STARTING_HASH = compute_position_hash(STARTING_TEAMS["WHITE"], STARTING_TEAMS["BLACK"], "WHITE")
+
+
+class ChessVar:
+    """ ChessVar, in conjunction with ChessTeam, carries out the functions of a Chess (variant form) game. Its data
+    members include _black_team and _white_team, which are both ChessTeam objects, _turn which tracks whoevers turn it
+    is, and _game_state which stores the current state of the game. Row letters are translated to integer values with
+    the module level LETTER_TO_INT and INT_TO_LETTER dictionaries. The __init__ method is the first place where
+    ChessVar will need to communicate with ChessTeam in order to initialize the two ChessTeam object data members. The
+    ChessVar class has get and set methods for the _turn and _game_state data members, and push and pop methods that make
+    and take back moves using an undo stack. A history of position hashes gives repetition counts and the optional
+    draw rules. There is a method to check whether a move resulted in a victory (uses ChessTeam methods to determine
+    whether all pieces of a certain type are gone).
+    The majority of these methods in this class are dedicated to determining whether a move (and possibly capture) are
+    valid. Methods from ChessTeam are called on multiple occasions during the process of checking the validity of move
+    in order to determine whether there are pieces on certain squares, and to extract information about pieces being
+    moved or captured."""
+
+    def __init__(self, position=None):
+        """ All data members will be private. The _black_team data member will be a ChessTeam object and will need to
+        pass a list of starting square positions of its 16 pieces. The _white_team data member will be a ChessTeam object
+        and will likewise need to pass a list of its 16 starting squares. Both teams are copied from the module level
+        STARTING_TEAMS, which are built from those squares only once. The _turn data member tracks whose turn it is.
+        _turn will be initialized to “WHITE” since White always goes first in chess. The _game_state data member will
+        track the status of the game. It will be initialized to “UNFINISHED” as the game just started. The row letters
+        are translated into integer values and back with the module level LETTER_TO_INT and INT_TO_LETTER dictionaries,
+        which every game shares. The _undo_stack data member is a list holding one small tuple per move made, which
+        records only what changed so that pop can take the move back. The _hash data member is the Zobrist hash of the
+        current position, which is updated with a few XORs every time a move is made. The _move_cache data member is
+        an optional ChessMoveCache.LegalMoveCache that make_move and is_legal consult first. The _position_counts data
+        member counts how many times each position hash has occurred in the line of play since the position was set up,
+        and _quiet_plies counts the plies since the last capture; both are kept up to date by execute_move and pop.
+        _repetition_limit and _quiet_ply_limit are the optional draw rules (None when a rule is off). If a Position is
+        passed, the game starts from that position instead of the starting position"""
+
+        self._move_cache = None
+        self._repetition_limit = None
+        self._quiet_ply_limit = None
+
+        if position is not None:
+            self.set_position(position)
+            return
+
+        self._black_team = ChessTeam("BLACK", template=STARTING_TEAMS["BLACK"])
+        self._white_team = ChessTeam("WHITE", template=STARTING_TEAMS["WHITE"])
+        self._turn = "WHITE"
+        self._game_state = "UNFINISHED"
+        self._undo_stack = []
+        self._hash = STARTING_HASH
+        self.reset_history()
+
+
+    @classmethod
+    def from_position(cls, position):
+        """Returns a new game set up in the passed Position, which can be any position made by get_position (or stored
+        and loaded again). The same as ChessVar(position)"""
+
+        return cls(position)
+
+
+    def reset(self):
+        """Puts the game back in the starting position in place, without making a new ChessVar: both teams are restored
+        from STARTING_TEAMS, the undo stack and position history are emptied, and the starting hash is restored. The
+        draw rules and the legal move cache are kept. This is the cheap way to start another game with an object that
+        is no longer needed, such as one from a GamePool"""
+
+        self._white_team.restore_from(STARTING_TEAMS["WHITE"])
+        self._black_team.restore_from(STARTING_TEAMS["BLACK"])
+        self._turn = "WHITE"
+        self._game_state = "UNFINISHED"
+        self._undo_stack = []
+        self._hash = STARTING_HASH
+        self.reset_history()
+
+
+    def get_position(self):
+        """Returns the current position as an immutable, hashable Position. The team snapshots inside it are shared
+        with every other Position taken while that team's pieces stayed where they are"""
+
+        return Position(self._white_team.get_snapshot(), self._black_team.get_snapshot(), self._turn,
+                        self._game_state, self._hash)
+
+
+    def set_position(self, position):
+        """Replaces the current position with the passed Position. The undo stack is emptied, and the hash is taken
+        from the Position rather than computed again"""
+
+        self._white_team = ChessTeam("WHITE", snapshot=position.get_team_snapshot("WHITE"))
+        self._black_team = ChessTeam("BLACK", snapshot=position.get_team_snapshot("BLACK"))
+        self._turn = position.get_turn()
+        self._game_state = position.get_game_state()
+        self._undo_stack = []
+        self._hash = position.get_hash()
+        self.reset_history()
+
+
+    def copy(self):
+        """Returns an independent copy of the game, including its undo stack, built from a Position snapshot instead of
+        copying every object the game holds. The undo records are immutable tuples, so only the list holding them is
+        copied. The copy shares the game's legal move cache, if it has one"""
+
+        game = ChessVar(self.get_position())
+        game._undo_stack = list(self._undo_stack)
+        game._position_counts = dict(self._position_counts)
+        game._quiet_plies = self._quiet_plies
+        game.set_draw_rules(self._repetition_limit, self._quiet_ply_limit)
+        game.set_move_cache(self._move_cache)
+
+        return game
+
+
+    def __deepcopy__(self, memo):
+        """copy.deepcopy of a ChessVar uses copy"""
+
+        return self.copy()
+
+
+    def load_position(self, white_squares, black_squares, turn="WHITE", game_state="UNFINISHED", white_moves=None,
+                      black_moves=None):
+        """Replaces the current position with the passed one. white_squares and black_squares are lists of the 16
+        squares (or CAPTURED) of each team's pieces, in the same order as the ChessTeam _pieces dictionary, and the
+        optional white_moves and black_moves lists give each piece's number of moves (a pawn with 0 moves may still
+        move two squares forward). The undo stack is emptied and the hash is computed for the new position"""
+
+        self._white_team = ChessTeam("WHITE", white_squares, white_moves)
+        self._black_team = ChessTeam("BLACK", black_squares, black_moves)
+        self._turn = turn
+        self._game_state = game_state
+        self._undo_stack = []
+        self._hash = self.compute_hash()
+        self.reset_history()
+
+
+    def compute_hash(self):
+        """Computes the Zobrist hash of the current position from scratch with compute_position_hash. execute_move and
+        pop keep _hash up to date incrementally, so this is only needed when the position is first set up (or to double
+        check the incremental hash)"""
+
+        return compute_position_hash(self._white_team, self._black_team, self._turn)
+
+
+    def get_hash(self):
+        """Returns the Zobrist hash (a 64-bit integer) of the current position. It covers piece placement, whose turn
+        it is, and which pawns have not moved yet"""
+
+        return self._hash
+
+
+    def get_turn(self):
+        """Returns the value of the _turn private data member, which is WHITE or BLACK"""
+
+        return self._turn
+
+
+    def set_turn(self):
+        """Changes the value of the _turn private data member from WHITE to BLACK or from BLACK to WHITE depending on
+        the current value of _turn"""
+
+        if self._turn == "WHITE":
+            self._turn = "BLACK"
+
+        else:
+            self._turn = "WHITE"
+
+
+    def get_move_cache(self):
+        """Returns the LegalMoveCache consulted by make_move and is_legal, or None if there is none"""
+
+        return self._move_cache
+
+
+    def set_move_cache(self, move_cache):
+        """Sets the LegalMoveCache (see ChessMoveCache.py) that make_move and is_legal consult before validating a move,
+        or removes it if None is passed. A cache can be shared by many games"""
+
+        self._move_cache = move_cache
+
+
+    def get_team(self, team_color):
+        """Returns the ChessTeam object of the passed team color (WHITE or BLACK)"""
+
+        if team_color == "WHITE":
+            return self._white_team
+
+        return self._black_team
+
+
+    def get_piece_count(self, team_color, piece_type):
+        """Returns how many pieces of the passed type the passed team (WHITE or BLACK) has left on the board, for
+        example get_piece_count("BLACK", "knight")"""
+
+        return self.get_team(team_color).get_piece_count(piece_type)
+
+
+    def get_ply_count(self):
+        """Returns the number of moves that have been made in this game and not taken back with pop"""
+
+        return len(self._undo_stack)
+
+
+    def get_move_history(self):
+        """Returns the list of (source square, destination square) pairs of the moves made in this game and not taken
+        back, oldest first, counting from the starting position (or from the last load_position or set_position). The
+        history is not kept separately: every move already leaves its square indexes on the undo stack, so making moves
+        costs nothing extra and the squares are only looked up when the history is asked for"""
+
+        return [(INDEX_TO_SQUARE[record[0]], INDEX_TO_SQUARE[record[1]]) for record in self._undo_stack]
+
+
+    def reset_history(self):
+        """Starts the position history over from the current position: it has occurred once, and no plies have been
+        played since a capture. Called whenever a position is set up"""
+
+        self._position_counts = {self._hash: 1}
+        self._quiet_plies = 0
+
+
+    def get_repetition_count(self):
+        """Returns how many times the current position has occurred in the line of play, counting this time (1 for a
+        position that has not occurred before). Positions are compared by their Zobrist hash"""
+
+        return self._position_counts.get(self._hash, 0)
+
+
+    def is_repetition(self):
+        """Returns True if the current position has occurred before in the line of play. A search can score such a
+        position as a draw and not search it again, since going round a cycle cannot make progress"""
+
+        return self._position_counts.get(self._hash, 0) > 1
+
+
+    def get_quiet_plies(self):
+        """Returns the number of plies played since the last capture (or since the position was set up)"""
+
+        return self._quiet_plies
+
+
+    def get_draw_rules(self):
+        """Returns the (repetition limit, quiet ply limit) pair of the draw rules, where None means the rule is off"""
+
+        return (self._repetition_limit, self._quiet_ply_limit)
+
+
+    def set_draw_rules(self, repetition_limit=None, quiet_ply_limit=None):
+        """Turns the optional draw rules on or off. With a repetition_limit, a move that brings about a position for the
+        repetition_limit-th time (eg. 3) draws the game. With a quiet_ply_limit, the game is drawn once that many plies
+        have been played without a capture. Both rules are off (None) by default, and then a game only ends when a team
+        wins"""
+
+        self._repetition_limit = repetition_limit
+        self._quiet_ply_limit = quiet_ply_limit
+
+
+    def check_for_draw(self):
+        """Called by execute_move when a draw rule is on. Sets the game state to DRAW and returns True if the current
+        position has reached the repetition limit or the game has reached the quiet ply limit. Otherwise returns False"""
+
+        if self._repetition_limit is not None and self._position_counts[self._hash] >= self._repetition_limit:
+            self.set_game_state("DRAW")
+            return True
+
+        if self._quiet_ply_limit is not None and self._quiet_plies >= self._quiet_ply_limit:
+            self.set_game_state("DRAW")
+            return True
+
+        return False
+
+
+    def get_game_state(self):
+        """Returns the value of the _game_state private data member, which can be UNFINISHED, WHITE_WON or BLACK_WON, or
+        DRAW if a draw rule has been turned on with set_draw_rules"""
+
+        return self._game_state
+
+
+    def set_game_state(self, new_state):
+        """ Changes the value of the _game_state data member. Expected to only be called by the check_for_victory method,
+         and only once per game. It must receive either BLACK_WON or WHITE_WON, which will be assigned as the new value
+         for _game_state. check_for_draw sets DRAW instead when a draw rule ends the game"""
+
+        self._game_state = new_state
+
+
+    def generate_path(self, source_row, source_column, destination_row, destination_column):
+        """Returns a list of each square (eg. 'a2') passed over when moving in a straight line (along a row, column or
+        diagonal) from the source coordinates to the destination coordinates, in order from the source square, without
+        the source and destination squares. The list is empty if the squares are next to each other or not in line.
+        is_valid_move does not use these lists: it checks the BETWEEN bitboard directly with check_path_between"""
+
+        source_index = (source_column - 1) * 8 + source_row - 1
+        destination_index = (destination_column - 1) * 8 + destination_row - 1
+        path = mask_to_squares(BETWEEN[source_index][destination_index])
+        if destination_index < source_index:
+            path.reverse()
+
+        return path
+
+
+    def generate_pawn_path(self, source_row, source_column, destination_column):
+        """Given the (source_row, source_column) and (destination_row, destination_column) coordinates, this method will
+        return a list of each square (eg. 'a2') that the pawn passes on its way to the destination square. This list does
+        not include the source and destination squares. The squares are read from the precomputed BETWEEN table"""
+
+        return self.generate_path(source_row, source_column, source_row, destination_column)
+
+
+    def check_rook_move(self, source_row, source_column, destination_row, destination_column):
+        """This method will check whether the passed (source_row, source_column) and (destination_row, destination_column)
+         coordinates represents a valid move for a rook. One (but not both) of these conditions must be true: either the
+         two column values of source_square and destination_square must be equivalent, or the two row values. Returns True
+         if it is a valid move, False otherwise."""
+
+        if source_row == destination_row and source_column != destination_column:
+            return True
+
+        if source_row != destination_row and source_column == destination_column:
+            return True
+
+        return False
+
+
+    def generate_rook_path(self, source_row, source_column, destination_row, destination_column):
+        """Given the (source_row, source_column) and (destination_row, destination_column) coordinates, this method will
+        return a list of each square (eg. 'a2') that the rook passes on its way to the destination square. This list does
+        not include the source and destination squares. The squares are read from the precomputed BETWEEN table"""
+
+        return self.generate_path(source_row, source_column, destination_row, destination_column)
+
+
+    def check_knight_move(self, source_row, source_column, destination_row, destination_column):
+        """This method will check whether the passed (source_row, source_column) and (destination_row, destination_column)
+        coordinates represent a valid move for a Knight. One of the following conditions must be met. If the source
+        coordinate is (x,y), then the destination coordinate can only be (x +/- 1, y +/- 2) or (x +/- 2, y +/- 1) in
+        order for the move to be valid. Return True if valid move, False otherwise."""
+
+        if abs(source_row - destination_row) == 1 and abs(source_column - destination_column) == 2:
+            return True
+
+        if abs(source_row - destination_row) == 2 and abs(source_column - destination_column) == 1:
+            return True
+
+        return False
+
+
+    def check_bishop_move(self, source_row, source_column, destination_row, destination_column):
+        """This method will check whether the passed (source_row, source_column) and (destination_row, destination_column)
+        coordinates represent a valid move for a Bishop. If the source coordinate is (x,y) and p is some integer, then
+        the destination coordinate can only be (x +/- p, y +/- p) in order for the move to be valid. Return True if
+        valid move, False otherwise."""
+
+        if abs(source_row - destination_row) == abs(source_column - destination_column):
+            return True
+
+        return False
+
+
+    def generate_bishop_path(self, source_row, source_column, destination_row, destination_column):
+        """Given the (source_row, source_column) and (destination_row, destination_column) coordinates, this method will
+        return a list of each square (eg. 'a2') that the bishop passes on its way to the destination square. This list does
+        not include the source and destination squares. The squares are read from the precomputed BETWEEN table"""
+
+        return self.generate_path(source_row, source_column, destination_row, destination_column)
+
+
+    def check_queen_move(self, source_row, source_column, destination_row, destination_column):
+        """This method will check whether the passed (source_row, source_column) and (destination_row, destination_column)
+        coordinates represent a valid move for a Queen. This method will call check_rook_move and check_bishop_move. If
+        one of these method calls returns True, then the move is valid (the queen can move like a rook or a bishop).
+        Return true if valid move, False otherwise"""
+
+        if self.check_rook_move(source_row, source_column, destination_row, destination_column) == True:
+            return True
+
+        if self.check_bishop_move(source_row, source_column, destination_row, destination_column) == True:
+            return True
+
+        return False
+
+
+    def generate_queen_path(self, source_row, source_column, destination_row, destination_column):
+        """Given the (source_row, source_column) and (destination_row, destination_column) coordinates, this method will
+        return a list of each square (eg. 'a2') that the queen passes on its way to the destination square. This list does
+        not include the source and destination squares. The squares are read from the precomputed BETWEEN table"""
+
+        return self.generate_path(source_row, source_column, destination_row, destination_column)
+
+
+    def check_king_move(self, source_row, source_column, destination_row, destination_column):
+        """This method will check whether the passed (source_row, source_column) and (destination_row, destination_column)
+        coordinates represent a valid move for a King. If the source coordinate is (x,y), then the destination coordinate
+        can only be (x +/- 1 , y) or (x , y +/- 1) or (x +/- 1, y +/- 1) for the move to be valid. Return True is the
+        move is valid, False otherwise."""
+
+        if abs(source_row - destination_row) == 1 and source_column == destination_column:
+            return True
+
+        if source_row == destination_row and abs(source_column - destination_column) == 1:
+            return True
+
+        if abs(source_row - destination_row) == 1 and abs(source_column - destination_column) == 1:
+            return True
+
+        return False
+
+
+    def check_for_victory(self):
+        """This method will call the ChessTeam check_for_captured_pieces method for whatever team is passed to this
+         method. If this method is called, that means that one of the passed team's pieces has just been captured.
+         If check_for_captured_pieces returns True, that means that all pieces of one type have been captured, and
+         the other team has won. Call set_game_state to update the game state accordingly, and return True. A False
+         return implies there still exists at least one piece of each type on the board for that team - return False"""
+
+        if self._turn == "BLACK":
+            if self._white_team.check_for_captured_pieces() == True:
+                self.set_game_state("BLACK_WON")
+                return True
+            else:
+                return False
+
+        else:
+            if self._black_team.check_for_captured_pieces() == True:
+                self.set_game_state("WHITE_WON")
+                return True
+            else:
+                return False
+
+
+    def check_if_turn_team_piece_is_being_moved(self, source_square):
+        """This method will be called by make_move to determine whether the attempted move is moving a piece of the
+        team whose turn it is. Return True if a turn team's piece is on the source square, return False otherwise"""
+
+        if self._turn == "WHITE":
+            if self._white_team.check_square_for_piece(source_square) == True:
+                return True
+
+        if self._turn == "BLACK":
+            if self._black_team.check_square_for_piece(source_square) == True:
+                return True
+
+        return False
+
+
+    def check_piece_type_for_valid_move(self, piece_name, piece_type, source_row, source_column, destination_square,
+                           destination_row, destination_column):
+        """This method uses the passed piece_type information to call the correct method that will check whether the
+        attempted move is valid based on that piece type. This method returns what is returned by that specifically
+        called method. Will return True if the move is valid based on the piece type movement restrictions, return False
+        if the move is not valid for that piece type"""
+
+        if piece_type == "pawn":
+            if self._turn == "WHITE":
+                return self._white_team.check_pawn_move(piece_name, self._black_team, source_row, source_column,
+                                                        destination_square, destination_row, destination_column)
+            else:
+                return self._black_team.check_pawn_move(piece_name, self._white_team, source_row, source_column,
+                                                         destination_square, destination_row, destination_column)
+
+        if piece_type == "rook":
+            return self.check_rook_move(source_row, source_column, destination_row, destination_column)
+
+        if piece_type == "knight":
+            return self.check_knight_move(source_row, source_column, destination_row, destination_column)
+
+        if piece_type == "bishop":
+            return self.check_bishop_move(source_row, source_column, destination_row, destination_column)
+
+        if piece_type == "queen":
+            return self.check_queen_move(source_row, source_column, destination_row, destination_column)
+
+        else:
+            return self.check_king_move(source_row, source_column, destination_row, destination_column)
+
+
+    def generate_piece_path(self, piece_type, source_row, source_column, destination_row, destination_column):
+        """This method will call the appropriate piece type-specific path generator and return the list of squares a
+        pawn, rook, bishop, or queen passes over. It is kept for callers that want the path as squares; is_valid_move
+        checks the path with check_path_between instead"""
+
+        if piece_type == "rook":
+            piece_path = self.generate_rook_path(source_row, source_column, destination_row, destination_column)
+        elif piece_type == "bishop":
+            piece_path = self.generate_bishop_path(source_row, source_column, destination_row, destination_column)
+        elif piece_type == "queen":
+            piece_path = self.generate_queen_path(source_row, source_column, destination_row, destination_column)
+        else:
+            piece_path = self.generate_pawn_path(source_row, source_column, destination_column)
+
+        return piece_path
+
+
+    def check_path_for_pieces(self, piece_path):
+        """This method will receive a list whose elements are the square coordinates (eg. 'a2') that a piece passes through
+        on its way to the destination square. The squares are turned into a bitboard and compared against the occupied
+        squares of both the black and white team. If a piece is ever on one of these squares, then return True (a piece
+        is in the path, not a valid move). Otherwise, return False (path is clear of pieces)"""
+
+        occupied = self._white_team.get_occupied() | self._black_team.get_occupied()
+
+        return occupied & squares_to_mask(piece_path) != 0
+
+
+    def check_path_between(self, source_index, destination_index):
+        """Returns True if any piece of either team stands on a square between the passed source and destination square
+        indexes (a piece is in the path, not a valid move), False otherwise. The squares between are a single lookup in
+        the precomputed BETWEEN table, so nothing is built for each move"""
+
+        occupied = self._white_team.get_occupied() | self._black_team.get_occupied()
+
+        return occupied & BETWEEN[source_index][destination_index] != 0
+
+
+    def process_capture(self, destination_index):
+        """If a valid capture has occurred, then this method will update the location of the piece on the destination
+        square index to reflect that it has been captured, then will call the check_for_victory method to determine
+        whether this capture has resulted in a victory. Returns the name of the captured piece"""
+
+        if self._turn == "WHITE":
+            captured_piece = self._black_team.remove_piece(destination_index)
+
+        else:
+            captured_piece = self._white_team.remove_piece(destination_index)
+
+        self.check_for_victory()
+        return captured_piece
+
+
+    def check_for_valid_capture(self, destination_square):
+        """This method will be called by is_valid_move to determine whether a capture is valid. If a piece attempts to
+        capture one of its own pieces, then the capture is not valid and the entire move is not valid. If the piece is
+        moving to an empty square, or capturing a piece from the other team (valid capture), return True to indicate
+        there are no issues with an invalid capture. The capture itself is carried out later by execute_move"""
+
+        if self._turn == "WHITE":
+            if self._white_team.check_square_for_piece(destination_square) == True:     # attempting to capture own piece
+                return False
+
+        else:
+            if self._black_team.check_square_for_piece(destination_square) == True:     # attempting to capture own piece
+                return False
+
+        return True
+
+
+    def is_valid_move(self, piece_name, piece_type, source_square, source_row, source_column, destination_square,
+                           destination_row, destination_column):
+        """This method will be called by make_move to determine whether the move is valid based on various restrictions.
+        First, is_valid_move calls the specific method that will determine whether the movement matches how that specific
+        piece type can move. Next, is_valid_move validates that a pawn, rook, bishop, or queen does not attempt to move
+        through other pieces. Finally, is_valid_move calls the is_valid_capture method to verify that the piece does not
+        attempt to capture itself. If any of these tests fail, then is_valid_move will immediately return False, indicating
+        and invalid move. If all the tests pass, then call execute_move to carry out the move (and capture, if applicable)
+        and change the turn, and return True"""
+
+        # squares that are not on the board are never valid
+        if source_square not in SQUARE_TO_INDEX or destination_square not in SQUARE_TO_INDEX:
+            return False
+
+        if self.check_piece_type_for_valid_move(piece_name, piece_type, source_row, source_column, destination_square,
+                           destination_row, destination_column) == False:
+            return False
+
+        source_index = SQUARE_TO_INDEX[source_square]
+        destination_index = SQUARE_TO_INDEX[destination_square]
+
+        # if the piece is a pawn, rook, bishop, or queen, it is necessary to check if these pieces attempt to move
+        # through existing pieces on their way to the destination square
+        if piece_type != "king" and piece_type != "knight":
+            # If check_path_between returns True, this means there exists a piece along the path, not valid
+            if self.check_path_between(source_index, destination_index) == True:
+                return False
+
+        # Call is_valid_capture to verify that a piece does not attempt to capture itself
+        if self.check_for_valid_capture(destination_square) == False:
+            return False
+
+        # all the tests have passed. This was a valid move. execute_move updates the locations of the moving piece and
+        # any captured piece, checks for a victory, and switches the turn to the other team.
+        self.execute_move(source_index, destination_index)
+        return True
+
+
+    def execute_move(self, source_index, destination_index):
+        """Carries out a move that is already known to be legal (either validated by is_valid_move, or produced by
+        generate_move_indexes), given the source and destination square indexes. Before anything changes, the delta
+        needed to take the move back is pushed onto _undo_stack: the two square indexes, the moving piece's previous
+        number of moves, the name of the captured piece (or None), the previous game state, the previous hash and the
+        previous number of quiet plies. Then any piece on the destination square is captured through process_capture,
+        the moving piece is moved, the turn is switched, and the keys of everything that changed are XORed into the
+        Zobrist hash. Finally the new position is counted in the position history and, if a draw rule is on and nobody
+        has won, the draw rules are checked"""
+
+        if self._turn == "WHITE":
+            team, other_team = self._white_team, self._black_team
+        else:
+            team, other_team = self._black_team, self._white_team
+
+        moving_piece = team.identify_piece_by_index(source_index)
+        captured_piece = other_team.identify_piece_by_index(destination_index)
+        self._undo_stack.append((source_index, destination_index, team.get_piece_moves(moving_piece), captured_piece,
+                                 self._game_state, self._hash, self._quiet_plies))
+
+        piece_keys = ZOBRIST_PIECE_KEYS[self._turn][team.get_piece_type(moving_piece)]
+        position_hash = self._hash ^ piece_keys[source_index] ^ piece_keys[destination_index] ^ ZOBRIST_BLACK_TO_MOVE
+        if team.get_unmoved_pawns() & SQUARE_MASKS[source_index]:
+            position_hash ^= ZOBRIST_UNMOVED_PAWN_KEYS[self._turn][source_index]
+
+        if captured_piece is not None:
+            other_color = other_team.get_team_color()
+            position_hash ^= ZOBRIST_PIECE_KEYS[other_color][other_team.get_piece_type(captured_piece)][destination_index]
+            if other_team.get_unmoved_pawns() & SQUARE_MASKS[destination_index]:
+                position_hash ^= ZOBRIST_UNMOVED_PAWN_KEYS[other_color][destination_index]
+            self.process_capture(destination_index)
+
+        team.move_piece(source_index, destination_index)
+        self.set_turn()
+        self._hash = position_hash
+
+        self._position_counts[position_hash] = self._position_counts.get(position_hash, 0) + 1
+        if captured_piece is None:
+            self._quiet_plies += 1
+        else:
+            self._quiet_plies = 0
+
+        if self._game_state == "UNFINISHED" and (self._repetition_limit is not None or
+                                                 self._quiet_ply_limit is not None):
+            self.check_for_draw()
+
+
+    def push(self, move):
+        """Makes the passed move, which is a (source square, destination square) pair such as ('a2', 'a4'), and records
+        it on the undo stack so that it can be taken back with pop. Returns what make_move returns: True if the move was
+        valid and made, False otherwise (in which case nothing is recorded)"""
+
+        return self.make_move(move[0], move[1])
+
+
+    def pop(self):
+        """Takes back the most recent move using the delta stored on _undo_stack. The moving piece returns to its source
+        square with its previous number of moves, a captured piece is put back on the destination square, the position
+        is taken out of the position history, and the turn, game state, hash and number of quiet plies are restored.
+        Returns the (source square, destination square) pair of the move that was taken back, or None if there are no
+        moves to take back"""
+
+        if self._undo_stack == []:
+            return None
+
+        source_index, destination_index, previous_moves, captured_piece, previous_game_state, previous_hash, \
+            previous_quiet_plies = self._undo_stack.pop()
+
+        count = self._position_counts[self._hash]
+        if count == 1:
+            del self._position_counts[self._hash]
+        else:
+            self._position_counts[self._hash] = count - 1
+
+        self.set_turn()
+        if self._turn == "WHITE":
+            team, other_team = self._white_team, self._black_team
+        else:
+            team, other_team = self._black_team, self._white_team
+
+        team.unmove_piece(destination_index, source_index, previous_moves)
+        if captured_piece is not None:
+            other_team.restore_piece(captured_piece, destination_index)
+
+        self._game_state = previous_game_state
+        self._hash = previous_hash
+        self._quiet_plies = previous_quiet_plies
+        return (INDEX_TO_SQUARE[source_index], INDEX_TO_SQUARE[destination_index])
+
+
+    def make_move(self, source_square, destination_square):
+        """This method will receive coordinates (eg. 'a2') for the source square and the destination square, in that
+        order. First, make_move will confirm that the move starts with square that contains a piece from the team whose
+        turn it is. If this test passes, then the method will extract the integer values for the source row, source column
+        destination row, and destination column. Then, the method will call is_valid_move, which does all the heavy lifting
+        for determining whether a move is valid based on the type of piece being moved. is_valid_move also updates the
+        moving (and captured) piece location, checks for victory, and changes the turn if a move is valid. make_move will
+        return True is the move (and capture, if applicable) is indeed valid, False is not valid"""
+
+        # return False if the game is over, and someone has already won
+        if self._game_state != "UNFINISHED":
+            return False
+
+        # return False if either square is not on the board (eg. 'z9', 'a9' or '')
+        if source_square not in SQUARE_TO_INDEX or destination_square not in SQUARE_TO_INDEX:
+            return False
+
+        # with a legal move cache, the move only has to be looked up in the set of legal moves of this position
+        if self._move_cache is not None:
+            source_index = SQUARE_TO_INDEX[source_square]
+            destination_index = SQUARE_TO_INDEX[destination_square]
+            if (source_index, destination_index) not in self._move_cache.get_legal_moves(self):
+                return False
+            self.execute_move(source_index, destination_index)
+            return True
+
+        # not a valid move if the turn does not start with moving a piece from the team whose turn it is
+        if self.check_if_turn_team_piece_is_being_moved(source_square) == False:
+            return False
+
+        # extract the piece name and type of the piece that is moving
+        if self._turn == "WHITE":
+            piece_name = self._white_team.identify_piece_by_location(source_square)
+            piece_type = self._white_team.get_piece_type(piece_name)
+        else:
+            piece_name = self._black_team.identify_piece_by_location(source_square)
+            piece_type = self._black_team.get_piece_type(piece_name)
+
+        # Assign specific integer values for the source row and column, and for the destination row and column
+        source_row = LETTER_TO_INT[source_square[0]]
+        source_column = int(source_square[1])
+        destination_row = LETTER_TO_INT[destination_square[0]]
+        destination_column = int(destination_square[1])
+
+        return(self.is_valid_move(piece_name, piece_type, source_square, source_row, source_column, destination_square,
+                           destination_row, destination_column))
+
+
+    def is_legal(self, source_square, destination_square):
+        """Returns True if moving from source_square to destination_square (eg. 'e2' and 'e4') would be accepted by
+        make_move, without making the move. The answer comes from the legal move cache if the game has one, and
+        otherwise from the bitboard move targets of the piece on the source square"""
+
+        if self._game_state != "UNFINISHED":
+            return False
+
+        if source_square not in SQUARE_TO_INDEX or destination_square not in SQUARE_TO_INDEX:
+            return False
+
+        source_index = SQUARE_TO_INDEX[source_square]
+        destination_index = SQUARE_TO_INDEX[destination_square]
+        if self._move_cache is not None:
+            return (source_index, destination_index) in self._move_cache.get_legal_moves(self)
+
+        return self.get_target_mask(source_index) & SQUARE_MASKS[destination_index] != 0
+
+
+    def get_target_mask(self, source_index):
+        """Returns the bitboard of every square that the turn team's piece on the passed square index can legally move
+        to. The squares come from the precomputed knight, king and pawn tables and the sliding piece rays in ChessBoard.py.
+        Returns 0 if the turn team has no piece on that square"""
+
+        if self._turn == "WHITE":
+            team, other_team = self._white_team, self._black_team
+        else:
+            team, other_team = self._black_team, self._white_team
+
+        piece_name = team.identify_piece_by_index(source_index)
+        if piece_name is None:
+            return 0
+
+        return piece_targets(team.get_piece_type(piece_name), self._turn, source_index, team.get_occupied(),
+                             other_team.get_occupied(), team.get_unmoved_pawns() & SQUARE_MASKS[source_index] != 0)
+
+
+    def generate_move_indexes(self):
+        """Returns a list of every legal move for the team whose turn it is, as (source index, destination index) pairs.
+        In this variant there is no check, castling, en passant or promotion, so every move a piece can make by its
+        movement rules is legal. An empty list is returned once the game is over"""
+
+        if self._game_state != "UNFINISHED":
+            return []
+
+        if self._turn == "WHITE":
+            team, other_team = self._white_team, self._black_team
+        else:
+            team, other_team = self._black_team, self._white_team
+
+        own = team.get_occupied()
+        enemy = other_team.get_occupied()
+        unmoved_pawns = team.get_unmoved_pawns()
+        moves = []
+
+        for piece_type in PIECE_TYPES:
+            for source_index in mask_to_indexes(team.get_bitboard(piece_type)):
+                targets = piece_targets(piece_type, self._turn, source_index, own, enemy,
+                                        unmoved_pawns & SQUARE_MASKS[source_index] != 0)
+                for destination_index in mask_to_indexes(targets):
+                    moves.append((source_index, destination_index))
+
+        return moves
+
+
+    def generate_legal_moves(self):
+        """Returns a list of every legal move for the team whose turn it is, as (source square, destination square)
+        pairs (eg. ('a2', 'a4')). Each pair can be passed straight to make_move"""
+
+        return [(INDEX_TO_SQUARE[source], INDEX_TO_SQUARE[destination])
+                for source, destination in self.generate_move_indexes()]
+
+
+    def generate_legal_moves_from(self, source_square):
+        """Returns a list of every legal move of the turn team's piece on the passed square (eg. 'b1'), as (source square,
+        destination square) pairs. The list is empty if the square does not hold a piece of the team whose turn it is,
+        or if the game is over"""
+
+        if self._game_state != "UNFINISHED":
+            return []
+
+        targets = self.get_target_mask(SQUARE_TO_INDEX[source_square])
+
+        return [(source_square, destination_square) for destination_square in mask_to_squares(targets)]
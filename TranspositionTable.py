@@ -0,0 +1,198 @@
+# Author: Mackenzie Anderson
+# GitHub username: mkenzieanderson
+# Date: October 18, 2026
+# Description: A transposition table for ChessVar positions. Different move orders often lead to the same position, so
+# search and evaluation code can store what they learned about a position under its Zobrist hash (ChessVar.get_hash)
+# and look it up again later instead of redoing the work. The table has a fixed memory budget that is chosen when it
+# is created: it is a flat array of 64-bit integers that never grows. The array is split into buckets, and each bucket
+# holds two entries. The first entry of a bucket is "depth-preferred" and only gets replaced by a result from a search
+# at least as deep (or by any result once the stored one is from an older search), while the second entry is
+# "always-replace" and takes whatever does not fit in the first. Each entry is two integers: a data word with the
+# score, search depth, bound type, search generation and best move packed together, and the position hash XORed with
+# that data word. Storing the hash XORed with the data means that an entry whose two words were written by different
+# processes at the same time (when the table is laid over shared memory) no longer matches any position hash, so a
+# torn entry reads as a miss instead of as a wrong result, without any locking. An empty entry has a data word of 0.
+
+from array import array
+
+# bound types stored with each score
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+ENTRY_BYTES = 16                # one 64-bit hash and one 64-bit data word
+BUCKET_BYTES = 2 * ENTRY_BYTES  # a depth-preferred entry and an always-replace entry
+
+_SCORE_OFFSET = 1 << 31
+_MAX_DEPTH = 255
+
+
+def pack_entry(score, depth, bound, generation, move):
+    """Packs the passed entry fields into a single 64-bit data word. Bits 0-5 hold the move's source index, bits 6-11
+    its destination index, bit 12 whether there is a move at all, bits 13-14 the bound type, bits 15-22 the depth,
+    bits 23-30 the search generation, and bits 31-62 the score"""
+
+    data = ((score + _SCORE_OFFSET) << 31) | ((generation & 0xFF) << 23) | (min(max(depth, 0), _MAX_DEPTH) << 15) | \
+           (bound << 13)
+    if move is not None:
+        data |= 0x1000 | (move[1] << 6) | move[0]
+
+    return data
+
+
+def unpack_entry(data):
+    """Unpacks a data word made by pack_entry and returns a (score, depth, bound, move) tuple, where move is a (source
+    index, destination index) pair or None"""
+
+    move = None
+    if data & 0x1000:
+        move = (data & 0x3F, (data >> 6) & 0x3F)
+
+    return ((data >> 31) - _SCORE_OFFSET, (data >> 15) & 0xFF, (data >> 13) & 0x3, move)
+
+
+class TranspositionTable:
+    """The TranspositionTable class stores search results keyed by position hash within a fixed memory budget. Its data
+    members are the flat _entries array (four 64-bit integers per bucket), the number of buckets, the current search
+    generation used to age out old entries, and counters for probes, hits and stores. The store and probe methods are
+    what search and evaluation code call; new_search should be called once per search so that results from earlier
+    searches are the first to be replaced"""
+
+    def __init__(self, memory_bytes=16 * 1024 * 1024, buffer=None):
+        """Creates a table that uses at most memory_bytes bytes of memory. The number of buckets is the largest power of
+        two that fits in the budget, so a bucket can be found from a hash with a single AND. If a writable buffer (for
+        example a bytearray or shared memory block) is passed, the table is laid over that buffer instead of allocating
+        its own, and memory_bytes is taken from the buffer's size"""
+
+        if buffer is not None:
+            memory_bytes = len(buffer)
+
+        bucket_count = 1
+        while bucket_count * 2 * BUCKET_BYTES <= memory_bytes:
+            bucket_count *= 2
+
+        self._bucket_count = bucket_count
+        self._bucket_mask = bucket_count - 1
+        if buffer is None:
+            self._entries = array("Q", bytes(bucket_count * BUCKET_BYTES))
+        else:
+            self._entries = memoryview(buffer)[:bucket_count * BUCKET_BYTES].cast("Q")
+
+        self._generation = 0
+        self._probes = 0
+        self._hits = 0
+        self._stores = 0
+
+
+    def get_bucket_count(self):
+        """Returns the number of buckets (each bucket holds two entries)"""
+
+        return self._bucket_count
+
+
+    def get_memory_bytes(self):
+        """Returns the number of bytes used by the entries of the table"""
+
+        return self._bucket_count * BUCKET_BYTES
+
+
+    def new_search(self):
+        """Moves the table on to a new search generation. Entries stored during earlier searches can then be replaced
+        in the depth-preferred slots even by shallower results"""
+
+        self._generation = (self._generation + 1) & 0xFF
+
+
+    def clear(self):
+        """Empties every entry of the table and resets the statistics counters"""
+
+        self._entries[:] = array("Q", bytes(len(self._entries) * 8))
+
+        self._generation = 0
+        self._probes = 0
+        self._hits = 0
+        self._stores = 0
+
+
+    def probe(self, position_hash):
+        """Looks up the passed position hash. Returns a (score, depth, bound, move) tuple if either entry of its bucket
+        holds that position, or None if the position is not in the table"""
+
+        self._probes += 1
+        slot = (position_hash & self._bucket_mask) << 2
+        entries = self._entries
+
+        data = entries[slot + 1]
+        if data != 0 and entries[slot] ^ data == position_hash:
+            self._hits += 1
+            return unpack_entry(data)
+
+        data = entries[slot + 3]
+        if data != 0 and entries[slot + 2] ^ data == position_hash:
+            self._hits += 1
+            return unpack_entry(data)
+
+        return None
+
+
+    def store(self, position_hash, depth, score, bound, move=None):
+        """Stores a result for the passed position hash: the score, the depth it was searched to (0 for a static
+        evaluation), the bound type (EXACT, LOWER_BOUND or UPPER_BOUND) and the best move as a (source index, destination
+        index) pair, if known. The result goes into the depth-preferred entry of the bucket if that entry holds the same
+        position, comes from an older search, or was searched less deeply; otherwise it goes into the always-replace
+        entry. A result pushed out of the depth-preferred entry moves to the always-replace entry. A stored best move is
+        kept when the new result does not have one"""
+
+        self._stores += 1
+        slot = (position_hash & self._bucket_mask) << 2
+        entries = self._entries
+
+        # each entry is read once; the hash it holds is its first word XORed with its data word
+        stored_data = entries[slot + 1]
+        stored_hash = entries[slot] ^ stored_data
+        replace_data = entries[slot + 3]
+        replace_hash = entries[slot + 2] ^ replace_data
+
+        if move is None:
+            if stored_data != 0 and stored_hash == position_hash:
+                move = unpack_entry(stored_data)[3]
+            elif replace_data != 0 and replace_hash == position_hash:
+                move = unpack_entry(replace_data)[3]
+
+        data = pack_entry(score, depth, bound, self._generation, move)
+
+        if stored_data == 0 or stored_hash == position_hash or ((stored_data >> 23) & 0xFF) != self._generation \
+                or ((stored_data >> 15) & 0xFF) <= depth:
+            # the result that is pushed out of the depth-preferred entry moves down to the always-replace entry
+            if stored_data != 0 and stored_hash != position_hash:
+                entries[slot + 2] = stored_hash ^ stored_data
+                entries[slot + 3] = stored_data
+            entries[slot] = position_hash ^ data
+            entries[slot + 1] = data
+
+        else:
+            entries[slot + 2] = position_hash ^ data
+            entries[slot + 3] = data
+
+
+    def get_statistics(self):
+        """Returns a dictionary with the number of probes, hits and stores made so far, the hit rate, and the fraction
+        of depth-preferred entries in use (sampled from the first 1000 buckets)"""
+
+        sample = min(self._bucket_count, 1000)
+        used = 0
+        for bucket in range(sample):
+            if self._entries[(bucket << 2) + 1] != 0:
+                used += 1
+
+        hit_rate = 0.0
+        if self._probes > 0:
+            hit_rate = self._hits / self._probes
+
+        return {
+            "probes"   : self._probes,
+            "hits"     : self._hits,
+            "stores"   : self._stores,
+            "hit_rate" : hit_rate,
+            "fill"     : used / sample
+        }